@@ -0,0 +1,75 @@
+"""
+The requesting user and their profiles (request.actor, attached by JWTAuthMiddleware).
+Views used to look the caller up again with Student/Faculty/HOD.objects.get(user__id=...)
+and User.objects.get(id=...); the actor loads the user with every profile joined in one
+query the first time any of them is asked for, or reuses the user the middleware already
+loaded, and serves the rest of the request from memory.
+"""
+from functools import cached_property
+
+from django.core.exceptions import ObjectDoesNotExist
+
+from .models import User
+
+
+# Profiles joined onto the user (the middleware loads users the same way)
+ACTOR_RELATED = ('student', 'faculty', 'hod', 'hod__faculty', 'admin')
+
+
+class Actor:
+    """
+    Lazy, per-request view of the authenticated user. Profiles the user does not have are
+    None. Nothing is queried until an attribute is read.
+    """
+
+    def __init__(self, user_id, user=None):
+        self.user_id = user_id
+        if user is not None:
+            self.__dict__['user'] = user
+
+    @cached_property
+    def user(self):
+        """The User with ACTOR_RELATED joined, or None if it no longer exists"""
+        if not self.user_id:
+            return None
+        return User.objects.select_related(*ACTOR_RELATED).filter(id=self.user_id).first()
+
+    def _profile(self, name):
+        if self.user is None:
+            return None
+        try:
+            return getattr(self.user, name)
+        except ObjectDoesNotExist:
+            return None
+
+    @property
+    def student(self):
+        return self._profile('student')
+
+    @property
+    def faculty(self):
+        return self._profile('faculty')
+
+    @property
+    def hod(self):
+        """The user's HOD record, current or ended"""
+        return self._profile('hod')
+
+    @property
+    def active_hod(self):
+        """The user's HOD record while their term is running"""
+        hod = self.hod
+        return hod if hod is not None and hod.endDate is None else None
+
+    @property
+    def admin(self):
+        return self._profile('admin')
+
+    @property
+    def department(self):
+        """Department the user belongs to: the one they head, teach in or study in"""
+        for profile, field in ((self.active_hod, 'department'), (self.faculty, 'department'),
+                               (self.student, 'branch'), (self.admin, 'department')):
+            if profile is not None and getattr(profile, field):
+                return getattr(profile, field)
+        return None
@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from .conditional import connect_signals
+        connect_signals()
+
+        if getattr(settings, 'CORE_LOG_QUEUE', False):
+            from .log import start_queue_logging
+            start_queue_logging('core')
@@ -0,0 +1,258 @@
+"""
+In-process endpoint benchmarks (manage.py benchmark_endpoints) against the configured
+database, normally one filled by manage.py generate_dataset. Each scenario logs in as a
+representative user of the busiest department and requests one endpoint through Django's
+test client: a few warm-up requests, then `iterations` timed ones, each measured for latency
+and for DB queries and time (streamed bodies are read to the end), and one more under
+tracemalloc for peak Python memory.
+
+Write scenarios run inside a transaction that is rolled back, so every run sees the same
+data (the savepoints this adds are counted in their queries). Dashboard scenarios drop the
+cached stats before each request, so they measure the computation rather than a cache hit.
+Results are plain JSON; compare() diffs a run against a saved baseline.
+"""
+import json
+import time
+import tracemalloc
+from contextlib import ExitStack
+from datetime import timedelta
+
+from django.db import connections, transaction
+from django.db.models import Count, Q
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from .cache import invalidate_dashboard_stats
+from .instrumentation import QueryRecorder, percentile
+from .models import Admin, Faculty, HOD, Mentorship, Student
+
+
+class Scenario:
+    """
+    One benchmarked request. `query`, `body` and `url_kwargs` are callables taking the
+    BenchmarkContext; `before(context)` runs ahead of every request, outside the measurement.
+    """
+
+    def __init__(self, name, role, url_name, method='get', query=None, body=None, url_kwargs=None,
+                 expected_status=200, write=False, before=None):
+        self.name = name
+        self.role = role
+        self.url_name = url_name
+        self.method = method
+        self.query = query
+        self.body = body
+        self.url_kwargs = url_kwargs
+        self.expected_status = expected_status
+        self.write = write
+        self.before = before
+
+    def request(self, context):
+        """(path, data, extra) for the test client"""
+        path = reverse(self.url_name, kwargs=self.url_kwargs(context) if self.url_kwargs else None)
+        if self.body is not None:
+            return path, json.dumps(self.body(context)), {'content_type': 'application/json'}
+        return path, self.query(context) if self.query else None, {}
+
+
+class BenchmarkContext:
+    """
+    The users and rows the scenarios act on, picked deterministically from the dataset: the
+    department with the most students, its HOD, the faculty there with the most active
+    mentees, that faculty's most senior mentee and an admin.
+    """
+
+    def __init__(self, department=None):
+        if department is None:
+            busiest = Student.objects.values('branch').annotate(total=Count('id')).order_by('-total', 'branch').first()
+            if busiest is None:
+                raise ValueError('No students found; run manage.py generate_dataset first')
+            department = busiest['branch']
+        self.department = department
+
+        self.hod = HOD.objects.select_related('user').filter(department=department, endDate__isnull=True).first()
+        self.faculty = Faculty.objects.select_related('user').filter(department=department).annotate(
+            mentees=Count('mentorships', filter=Q(mentorships__is_active=True))
+        ).order_by('-mentees', 'employeeId').first()
+        self.student = Student.objects.select_related('user').filter(
+            currentMentor=self.faculty
+        ).order_by('-year', 'rollNumber').first() if self.faculty else None
+        self.admin = Admin.objects.select_related('user').order_by('employeeId').first()
+        if None in (self.hod, self.faculty, self.student, self.admin):
+            raise ValueError(
+                f'{department} needs an active HOD, a faculty with mentees and an admin; '
+                'run manage.py generate_dataset first'
+            )
+
+        group = Mentorship.objects.get(student=self.student, faculty=self.faculty, is_active=True)
+        self.year, self.semester = group.year, group.semester
+        # Students of the same year mentored by someone else, for reassignment
+        self.reassign_roll_numbers = list(Student.objects.filter(
+            branch=department, year=self.year, mentorships__is_active=True, mentorships__semester=self.semester
+        ).exclude(currentMentor=self.faculty).order_by('rollNumber').values_list('rollNumber', flat=True)[:25])
+        self.today = timezone.localdate()
+
+    def user(self, role):
+        return {'HOD': self.hod.user, 'FACULTY': self.faculty.user,
+                'STUDENT': self.student.user, 'ADMIN': self.admin.user}[role]
+
+    def describe(self):
+        return {
+            'department': self.department,
+            'hod': self.hod.user.email,
+            'faculty': self.faculty.user.email,
+            'facultyMentees': self.faculty.mentees,
+            'student': self.student.user.email,
+            'admin': self.admin.user.email,
+        }
+
+
+SCENARIOS = (
+    Scenario('hod-mentorships', 'HOD', 'get_hod_mentorships'),
+    Scenario('hod-mentorships-page', 'HOD', 'get_hod_mentorships', query=lambda c: {'status': 'active', 'limit': 20}),
+    Scenario('students-list', 'HOD', 'get_students_list', query=lambda c: {'department': c.department}),
+    Scenario('students-list-cgpa', 'HOD', 'get_students_list',
+             query=lambda c: {'department': c.department, 'sortBy': 'cgpa', 'sortOrder': 'desc', 'page': 10}),
+    Scenario('students-search', 'HOD', 'get_students_list',
+             query=lambda c: {'department': c.department, 'search': c.student.name.split()[0]}),
+    Scenario('student-grades', 'STUDENT', 'get_student_grades'),
+    Scenario('student-grades-by-id', 'FACULTY', 'get_student_grades_by_id',
+             url_kwargs=lambda c: {'student_id': c.student.id}),
+    Scenario('export-students-csv', 'HOD', 'export_students_csv', query=lambda c: {'department': c.department}),
+    Scenario('dashboard-student', 'STUDENT', 'get_student_dashboard_stats',
+             before=lambda c: invalidate_dashboard_stats(student_ids=[c.student.id])),
+    Scenario('dashboard-faculty', 'FACULTY', 'get_faculty_dashboard_stats',
+             before=lambda c: invalidate_dashboard_stats(faculty_ids=[c.faculty.id])),
+    Scenario('dashboard-hod', 'HOD', 'get_hod_dashboard_stats',
+             before=lambda c: invalidate_dashboard_stats(departments=[c.department])),
+    Scenario('dashboard-admin', 'ADMIN', 'get_admin_dashboard_stats',
+             before=lambda c: invalidate_dashboard_stats()),
+    Scenario('assign-mentor', 'HOD', 'assign_mentor', method='post', expected_status=201, write=True,
+             body=lambda c: {'studentRollNumbers': c.reassign_roll_numbers, 'facultyEmployeeId': c.faculty.employeeId,
+                             'year': c.year, 'semester': c.semester}),
+    Scenario('schedule-group-meetings', 'HOD', 'schedule_group_meetings', method='post', expected_status=201,
+             write=True,
+             body=lambda c: {'facultyId': str(c.faculty.id), 'year': c.year, 'semester': c.semester,
+                             'recurrence': {'startDate': (c.today + timedelta(days=7)).isoformat(), 'time': '10:00',
+                                            'intervalWeeks': 1, 'occurrences': 8,
+                                            'description': 'Weekly review'}}),
+)
+
+SCENARIO_NAMES = [scenario.name for scenario in SCENARIOS]
+
+
+def login(client, user, password):
+    response = client.post('/api/auth/login', json.dumps({'email': user.email, 'password': password}),
+                           content_type='application/json')
+    if response.status_code != 200:
+        raise ValueError(f'Login as {user.email} failed ({response.status_code}); check --password')
+
+
+def measure(scenario, client, context, trace_memory=False):
+    """
+    Make one request. Returns (milliseconds, queries, DB milliseconds, response bytes, peak
+    traced bytes or None).
+    """
+    if scenario.before:
+        scenario.before(context)
+    path, data, extra = scenario.request(context)
+    recorder = QueryRecorder()
+    with ExitStack() as stack:
+        if scenario.write:
+            stack.enter_context(transaction.atomic())
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        response = getattr(client, scenario.method)(path, data, **extra)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        elapsed = time.perf_counter() - start
+        peak = None
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if scenario.write:
+            transaction.set_rollback(True)
+
+    if response.status_code != scenario.expected_status:
+        raise ValueError(f'{scenario.name} returned {response.status_code}: {body[:200]!r}')
+    return elapsed * 1000, recorder.count, recorder.seconds * 1000, len(body), peak
+
+
+def run(scenarios, context, password, iterations=20, warmup=2, log=None):
+    """Benchmark `scenarios`; returns {scenario name: result dict}"""
+    clients = {}
+    results = {}
+    for scenario in scenarios:
+        client = clients.get(scenario.role)
+        if client is None:
+            client = clients[scenario.role] = Client()
+            login(client, context.user(scenario.role), password)
+
+        for _ in range(warmup):
+            measure(scenario, client, context)
+        samples = [measure(scenario, client, context) for _ in range(iterations)]
+        peak = measure(scenario, client, context, trace_memory=True)[4]
+
+        latencies = sorted(sample[0] for sample in samples)
+        db_times = sorted(sample[2] for sample in samples)
+        results[scenario.name] = {
+            'endpoint': scenario.url_name,
+            'method': scenario.method.upper(),
+            'role': scenario.role,
+            'iterations': iterations,
+            'latencyMs': {
+                'p50': round(percentile(latencies, 50), 3),
+                'p95': round(percentile(latencies, 95), 3),
+                'max': round(latencies[-1], 3),
+                'mean': round(sum(latencies) / len(latencies), 3),
+            },
+            'queries': max(sample[1] for sample in samples),
+            'dbMs': {'p50': round(percentile(db_times, 50), 3)},
+            'bytes': samples[-1][3],
+            'peakMemoryKb': round(peak / 1024, 1),
+        }
+        if log:
+            log(scenario.name, results[scenario.name])
+    return results
+
+
+# Compared metrics: (label, path into a result, relative threshold applies)
+COMPARED_METRICS = (
+    ('p50 ms', ('latencyMs', 'p50'), True),
+    ('p95 ms', ('latencyMs', 'p95'), True),
+    ('queries', ('queries',), False),
+    ('peak KiB', ('peakMemoryKb',), True),
+)
+
+
+def _metric(result, path):
+    for key in path:
+        result = result.get(key) if isinstance(result, dict) else None
+    return result
+
+
+def compare(baseline, current, threshold=10.0):
+    """
+    Diff two runs' results. Returns one row per scenario present in both and metric:
+    {scenario, metric, baseline, current, changePct, regression}. Latency and memory regress
+    when they grow by more than `threshold` percent, queries when there are any more of them.
+    """
+    rows = []
+    for name, result in current.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        for label, path, relative in COMPARED_METRICS:
+            old, new = _metric(before, path), _metric(result, path)
+            if old is None or new is None:
+                continue
+            change = round((new - old) * 100 / old, 1) if old else None
+            if relative:
+                regression = change is not None and change > threshold
+            else:
+                regression = new > old
+            rows.append({'scenario': name, 'metric': label, 'baseline': old, 'current': new,
+                         'changePct': change, 'regression': regression})
+    return rows
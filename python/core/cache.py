@@ -0,0 +1,195 @@
+"""
+Application cache for core: namespaced, versioned keys on the Django cache (settings.CACHES).
+Every entry belongs to one or more namespaces ('student:<id>', 'faculty:<id>',
+'department:<code>', 'institution', ...) and its key embeds their current versions, so a
+write drops everything cached for a namespace by bumping one version key instead of finding
+and deleting entries. Recomputes are single-flight: one caller computes a missing entry while
+concurrent callers wait briefly for it instead of stampeding the database.
+The TTLs only bound staleness for data that drifts on its own (e.g. "upcoming this week").
+"""
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+
+CACHE_ALIAS = getattr(settings, 'CORE_CACHE_ALIAS', 'default')
+
+# Lifetime of a recompute lock, and how long other callers wait on it before computing themselves
+SINGLE_FLIGHT_TIMEOUT = getattr(settings, 'CORE_CACHE_LOCK_TIMEOUT', 10)
+SINGLE_FLIGHT_WAIT = getattr(settings, 'CORE_CACHE_LOCK_WAIT', 2)
+
+DASHBOARD_STATS_TTL = getattr(settings, 'DASHBOARD_STATS_TTL', 30)
+STUDENT_COUNT_TTL = getattr(settings, 'STUDENT_COUNT_TTL', 300)
+
+NAMESPACE_KEY = 'core:ns:{}'
+ENTRY_KEY = 'core:{}:{}'
+INSTITUTION = 'institution'
+
+_MISSING = object()
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def namespace(kind, ident=None):
+    """Namespace name, e.g. namespace('department', 'CSE') -> 'department:CSE'"""
+    return kind if ident is None else f'{kind}:{ident}'
+
+
+def namespace_versions(namespaces):
+    """
+    Current version of each namespace: the time (ns) of its last bump. A namespace without a
+    version (never bumped, or evicted) starts at the current time, which can only turn a hit
+    into a miss.
+    """
+    cache = _cache()
+    keys = [NAMESPACE_KEY.format(ns) for ns in namespaces]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns(), None)
+            found[key] = cache.get(key, 0)
+    return [found[key] for key in keys]
+
+
+def bump_namespaces(*namespaces):
+    """Invalidate every entry cached under any of `namespaces`: one write per namespace"""
+    now = time.time_ns()
+    _cache().set_many({NAMESPACE_KEY.format(ns): now for ns in namespaces if ns}, None)
+
+
+def make_key(name, namespaces, *parts):
+    """Cache key for entry `name` with `parts`, tied to the current versions of `namespaces`"""
+    versions = namespace_versions(namespaces)
+    digest = hashlib.md5(repr((list(namespaces), versions, parts)).encode()).hexdigest()
+    return ENTRY_KEY.format(name, digest)
+
+
+def get_or_compute(key, compute, ttl, cache_none=False):
+    """
+    Return the value cached at `key`, or compute() it once: the first caller takes a short
+    lock and computes, others poll for up to SINGLE_FLIGHT_WAIT seconds and then compute
+    themselves. A None result is not cached unless `cache_none`.
+    """
+    cache = _cache()
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    lock = f'{key}:lock'
+    if not cache.add(lock, 1, SINGLE_FLIGHT_TIMEOUT):
+        deadline = time.monotonic() + SINGLE_FLIGHT_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        return compute()
+
+    try:
+        value = compute()
+        if value is not None or cache_none:
+            cache.set(key, value, ttl)
+        return value
+    finally:
+        cache.delete(lock)
+
+
+def cached(name, namespaces, ttl, compute, *parts):
+    """get_or_compute() for entry `name`/`parts` in `namespaces`"""
+    return get_or_compute(make_key(name, namespaces, *parts), compute, ttl)
+
+
+class _Uncacheable(Exception):
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+def cached_response(key, ttl, view):
+    """
+    Return the response cached at `key` or the one `view()` returns, caching it (single-flight)
+    when it is a 200. Only the body and content type are kept.
+    """
+    def render():
+        response = view()
+        if response.status_code != 200:
+            raise _Uncacheable(response)
+        return response.content, response['Content-Type']
+
+    try:
+        content, content_type = get_or_compute(key, render, ttl)
+    except _Uncacheable as e:
+        return e.response
+    return HttpResponse(content, content_type=content_type)
+
+
+def memoize_view(name, ttl, namespaces, per_user=False):
+    """
+    Cache the 200 responses of a GET view, keyed on the caller's role, the query params and the
+    URL kwargs (and the user when `per_user`). `namespaces(request, *args, **kwargs)` returns
+    the namespaces the response belongs to; bumping any of them drops it. Apply below the
+    auth decorators.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped_view(request, *args, **kwargs):
+            user_data = getattr(request, 'user_data', None) or {}
+            parts = [user_data.get('role'), sorted(request.GET.lists()), args, sorted(kwargs.items())]
+            if per_user:
+                parts.append(user_data.get('id'))
+            key = make_key(name, namespaces(request, *args, **kwargs), *parts)
+            return cached_response(key, ttl, lambda: view_func(request, *args, **kwargs))
+        return wrapped_view
+    return decorator
+
+
+def scope_namespaces(student_ids=(), faculty_ids=(), departments=()):
+    """Namespaces of the given students, faculty and departments, plus the institution-wide one"""
+    return (
+        [INSTITUTION]
+        + [namespace('student', sid) for sid in student_ids if sid]
+        + [namespace('faculty', fid) for fid in faculty_ids if fid]
+        + [namespace('department', dept) for dept in departments if dept]
+    )
+
+
+# --- Dashboards ---
+
+def get_dashboard_stats(role, scope, compute):
+    """
+    Return the cached stats dict for `role` ('student', 'faculty', 'hod', 'admin') and `scope`
+    (student id, faculty id, department, or 'all'), calling `compute()` on a miss.
+    A None result (profile not found) is not cached.
+    """
+    scope_namespace = {
+        'student': namespace('student', scope),
+        'faculty': namespace('faculty', scope),
+        'hod': namespace('department', scope),
+    }.get(role, INSTITUTION)
+    return cached('dashboard-stats', [scope_namespace], DASHBOARD_STATS_TTL, compute, role, scope)
+
+
+def invalidate_dashboard_stats(student_ids=(), faculty_ids=(), departments=()):
+    """
+    Bump the namespaces of the given students, faculty and departments, dropping their dashboard
+    stats and anything else cached under them. The institution namespace (admin stats and the
+    institution-wide views) is always bumped.
+    """
+    bump_namespaces(*scope_namespaces(student_ids, faculty_ids, departments))
+
+
+# --- Student list ---
+
+def get_student_count(filters, compute):
+    """
+    Return the cached total for a student list filtered by `filters` (dict of query params),
+    calling `compute()` on a miss. Not invalidated by writes: the count is approximate for up
+    to STUDENT_COUNT_TTL seconds.
+    """
+    return cached('student-count', [], STUDENT_COUNT_TTL, compute, sorted(filters.items()))
@@ -0,0 +1,150 @@
+"""
+Conditional GET for read-mostly endpoints (subjects, toppers, faculty subjects, HODs, /me).
+Each resource's ETag is derived from an updatedAt watermark of the rows it is built from
+(latest updatedAt and row count, so deletes count too) plus the version of the resource's
+cache namespace, which model signals bump on every save/delete (covering related rows such
+as faculty names that the watermark query does not read). A matching If-None-Match or
+If-Modified-Since gets a 304 without running the view; otherwise the serialized body is
+cached under the ETag, so a write moves every reader to a new key.
+"""
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from . import models
+from .cache import ENTRY_KEY, bump_namespaces, cached_response, namespace, namespace_versions
+from .models import User, Subject, YearTopper, FacultySubjectHistory, HOD
+
+
+CONDITIONAL_RESPONSE_TTL = getattr(settings, 'CONDITIONAL_RESPONSE_TTL', 300)
+
+
+def table_watermark(queryset, field='updatedAt'):
+    """(latest `field`, row count) of `queryset` in one aggregate query"""
+    row = queryset.order_by().aggregate(latest=Max(field), rows=Count('pk'))
+    return row['latest'], row['rows']
+
+
+def _subjects_watermark(request):
+    return [table_watermark(Subject.objects.all())]
+
+
+def _toppers_watermark(request):
+    return [table_watermark(YearTopper.objects.all(), 'updated_at')]
+
+
+def _faculty_subjects_watermark(request):
+    return [table_watermark(Subject.objects.all()), table_watermark(FacultySubjectHistory.objects.all())]
+
+
+def _hods_watermark(request):
+    return [table_watermark(HOD.objects.all())]
+
+
+def _user_watermark(request):
+    row = User.objects.filter(id=request.user_data.get('id')).aggregate(
+        user=Max('updatedAt'),
+        student=Max('student__updatedAt'),
+        faculty=Max('faculty__updatedAt'),
+        hod=Max('hod__updatedAt'),
+        admin=Max('admin__updatedAt')
+    )
+    return [(value, 1) for value in row.values()]
+
+
+# resource -> (watermark(request), whether the response depends on the requesting user)
+RESOURCES = {
+    'subjects': (_subjects_watermark, False),
+    'toppers': (_toppers_watermark, True),
+    'faculty-subjects': (_faculty_subjects_watermark, True),
+    'hods': (_hods_watermark, False),
+    'me': (_user_watermark, True),
+}
+
+# model -> resources whose responses read it (bumped by signals); 'faculty-list' is the
+# memoized api/faculty view
+WATCHED_MODELS = {
+    'Subject': ('subjects', 'faculty-subjects'),
+    'Faculty': ('subjects', 'faculty-subjects', 'hods', 'faculty-list'),
+    'FacultySubjectHistory': ('faculty-subjects',),
+    'YearTopper': ('toppers',),
+    'Student': ('toppers',),
+    'HOD': ('hods',),
+    'User': ('hods', 'faculty-list'),
+    'Mentorship': ('faculty-list',),
+    'GroupMeeting': ('faculty-list',),
+}
+
+
+def resource_namespace(resource):
+    return namespace('resource', resource)
+
+
+def bump(*resources):
+    """Invalidate cached responses of `resources` (for writes that bypass model signals)"""
+    bump_namespaces(*[resource_namespace(name) for name in resources])
+
+
+def _on_write(sender, **kwargs):
+    bump(*WATCHED_MODELS[sender.__name__])
+
+
+def _on_past_faculty_changed(sender, **kwargs):
+    bump('subjects', 'faculty-subjects')
+
+
+def connect_signals():
+    """Bump resource namespaces on writes to WATCHED_MODELS (called from CoreConfig.ready)"""
+    for name in WATCHED_MODELS:
+        model = getattr(models, name)
+        post_save.connect(_on_write, sender=model, dispatch_uid=f'core.conditional.save.{name}')
+        post_delete.connect(_on_write, sender=model, dispatch_uid=f'core.conditional.delete.{name}')
+    m2m_changed.connect(
+        _on_past_faculty_changed,
+        sender=Subject.past_faculty.through,
+        dispatch_uid='core.conditional.past_faculty'
+    )
+
+
+def conditional_get(resource):
+    """
+    Serve a GET view of `resource` (see RESOURCES) conditionally: 304 for a current
+    If-None-Match/If-Modified-Since, the cached body for a known ETag, and otherwise the view's
+    response, which is cached (single-flight) when it is a 200. Apply below the auth decorators.
+    """
+    watermark, per_user = RESOURCES[resource]
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped_view(request, *args, **kwargs):
+            marks = watermark(request)
+            generation = namespace_versions([resource_namespace(resource)])[0]
+            parts = [resource, request.get_full_path(), generation, *marks]
+            if per_user:
+                parts.append(request.user_data.get('id'))
+            etag = '"{}"'.format(hashlib.md5(repr(parts).encode()).hexdigest())
+            stamps = [generation // 10 ** 9] + [int(latest.timestamp()) for latest, _ in marks if latest]
+            last_modified = max(stamps)
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = cached_response(
+                    ENTRY_KEY.format('conditional', etag.strip('"')),
+                    CONDITIONAL_RESPONSE_TTL,
+                    lambda: view_func(request, *args, **kwargs)
+                )
+                if response.status_code != 200:
+                    return response
+
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapped_view
+    return decorator
+
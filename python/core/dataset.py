@@ -0,0 +1,496 @@
+"""
+Synthetic institution for load testing and benchmarking (manage.py generate_dataset).
+Generates faculty and HODs per department, subjects with their teaching history, students
+spread over years 1-4 with graded semesters and backlogs, active and past mentorships,
+group meetings and student requests. Output is deterministic: the same seed and options
+produce the same rows, ids included, and dates are laid out relative to `as_of`.
+
+Rows are written with bulk_create in batches, and students are generated one batch at a
+time so memory stays flat however many are asked for. Every account shares one bcrypt hash.
+bulk_create skips save() and model signals, so the derived columns (grade points, SGPA/CGPA,
+Student.currentCgpa/currentMentor) are filled in here, and the year toppers and cached
+responses are refreshed once at the end.
+"""
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta, time as clock
+
+import bcrypt
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+
+from . import conditional
+from .cache import invalidate_dashboard_stats
+from .grades import calculate_cgpa, refresh_year_toppers
+from .models import (
+    User, Faculty, HOD, Admin, Student, Mentorship, Meeting, GroupMeeting, GroupMeetingStudent,
+    Internship, Project, Subject, Semester, StudentSubject, BacklogHistory, FacultySubjectHistory,
+    Request, UserRole, Department, Programme, Gender, Community, MeetingStatus, RequestStatus,
+    RequestType, SubjectType, SemesterType, AttemptType, GRADE_POINTS
+)
+
+
+FIRST_NAMES = [
+    'Aarav', 'Aditi', 'Akash', 'Ananya', 'Arjun', 'Bhavna', 'Chetan', 'Deepa', 'Divya', 'Farhan',
+    'Gayatri', 'Harish', 'Isha', 'Jyoti', 'Karthik', 'Kavya', 'Lakshmi', 'Manish', 'Meera', 'Nikhil',
+    'Nandini', 'Pooja', 'Pranav', 'Priya', 'Rahul', 'Ramesh', 'Riya', 'Rohit', 'Sanjay', 'Shreya',
+    'Siddharth', 'Sneha', 'Suresh', 'Tanvi', 'Varun', 'Vikram', 'Vidya', 'Yash', 'Zoya', 'Neha',
+]
+LAST_NAMES = [
+    'Agarwal', 'Bhat', 'Chandran', 'Das', 'Ghosh', 'Gupta', 'Iyer', 'Joshi', 'Kapoor', 'Khan',
+    'Krishnan', 'Kumar', 'Menon', 'Mishra', 'Nair', 'Patel', 'Pillai', 'Rao', 'Reddy', 'Sharma',
+    'Singh', 'Srinivasan', 'Thomas', 'Verma', 'Yadav',
+]
+SUBJECT_TOPICS = [
+    'Engineering Mathematics', 'Design Principles', 'Systems Analysis', 'Laboratory Practice',
+    'Modelling and Simulation', 'Instrumentation', 'Process Engineering', 'Materials',
+    'Computational Methods', 'Project Management',
+]
+COMMON_SUBJECTS = [
+    # (name, credits, type) per semester 1 and 2
+    [('Engineering Mathematics I', 4, SubjectType.BSC), ('English Communication', 2, SubjectType.HSC)],
+    [('Engineering Mathematics II', 4, SubjectType.BSC), ('Engineering Physics', 3, SubjectType.BSC)],
+]
+ROMAN = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII']
+INSTITUTES = ['IIT Delhi', 'IIT Bombay', 'IIT Madras', 'IIT Kanpur', 'NIT Trichy', 'NIT Warangal', 'IISc Bangalore']
+ORGANISATIONS = ['Infosys', 'TCS', 'Wipro', 'L&T', 'ISRO', 'DRDO', 'Tata Steel', 'Siemens', 'Bosch', 'Zoho']
+CITIES = ['Bengaluru', 'Chennai', 'Hyderabad', 'Pune', 'Mumbai', 'Delhi', 'Kolkata', 'Remote']
+TECHNOLOGIES = ['Python', 'Django', 'React', 'MATLAB', 'Arduino', 'TensorFlow', 'AutoCAD', 'ANSYS', 'C++', 'PostgreSQL']
+PROJECT_TOPICS = ['Smart Irrigation', 'Traffic Prediction', 'Solar Tracker', 'Water Quality Monitor',
+                  'Campus Navigation App', 'Bridge Load Analysis', 'Biosensor Design', 'Energy Audit']
+REVIEWS = ['Good progress', 'Needs to focus on attendance', 'Doing well academically',
+           'Discussed internship plans', 'Should reduce backlogs', 'Active in class']
+BLOOD_GROUPS = ['A+', 'B+', 'O+', 'AB+', 'A-', 'B-', 'O-']
+MEETING_TIMES = [clock(10, 0), clock(11, 30), clock(14, 0), clock(16, 0)]
+
+# Grade for a subject score (student ability plus noise), best first; below the last: F
+GRADE_CUTOFFS = [(9.5, 'EX'), (8.5, 'A'), (7.5, 'B'), (6.5, 'C'), (5.5, 'D'), (4.5, 'P')]
+
+# (type, weight) and (status, weight) of generated requests
+REQUEST_TYPES = [(RequestType.INTERNSHIP, 4), (RequestType.PROJECT, 3), (RequestType.MEETING_REQUEST, 3)]
+REQUEST_STATUSES = [(RequestStatus.PENDING, 4), (RequestStatus.APPROVED, 4), (RequestStatus.REJECTED, 2)]
+
+
+class DatasetGenerator:
+    """
+    Generate an institution of `students` students and `faculty` faculty (the first faculty of
+    each department is its HOD) over the first `departments` departments, with up to
+    `semesters` graded semesters per student. Call generate() on an empty database.
+    """
+
+    def __init__(self, students=50000, faculty=2000, departments=len(Department.values), semesters=8,
+                 subjects_per_semester=6, meetings_per_group=4, requests_per_student=0.6,
+                 seed=42, batch_size=2000, password='password', as_of=None, log=None):
+        if faculty < departments:
+            raise ValueError('Need at least one faculty per department')
+        if students >= 1000000:
+            raise ValueError('At most 999999 students (roll numbers are <admission yy><6-digit index>)')
+        self.students = students
+        self.faculty = faculty
+        self.departments = Department.values[:departments]
+        self.semesters = semesters
+        self.subjects_per_semester = subjects_per_semester
+        self.meetings_per_group = meetings_per_group
+        self.requests_per_student = requests_per_student
+        self.batch_size = batch_size
+        self.password = password
+        self.as_of = as_of or timezone.localdate()
+        self.log = log or (lambda message: None)
+        self.rng = random.Random(seed)
+
+        # Academic calendar: the year starts in July, odd semesters run July-December
+        self.academic_year = self.as_of.year if self.as_of.month >= 7 else self.as_of.year - 1
+        self.odd_term = self.as_of.month >= 7
+        self.term_start = date(self.academic_year, 7, 15) if self.odd_term else date(self.academic_year + 1, 1, 5)
+
+        self.counts = {}
+        self._faculty_by_department = {}  # department -> [Faculty]
+        self._subjects = {}  # (department, semester) -> [Subject]
+        self._mentor_cursor = {}  # (department, year) -> next index into the department's faculty
+        self._groups = {}  # (faculty id, department, year, semester) -> [student id]
+
+    # --- helpers ---
+
+    def _uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _name(self):
+        return f'{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}'
+
+    def _phone(self, prefix='9'):
+        return f'{prefix}{self.rng.randrange(10 ** 9):09d}'
+
+    def _aware(self, day, at=clock(9, 0)):
+        return timezone.make_aware(datetime.combine(day, at))
+
+    def _insert(self, model, objs):
+        if objs:
+            model.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.counts[model.__name__] = self.counts.get(model.__name__, 0) + len(objs)
+
+    def _current_semester(self, year):
+        return 2 * year - 1 if self.odd_term else 2 * year
+
+    def _exam_session(self, semester, admission_year):
+        """(exam year, exam month) of a semester's regular exam: December for odd, May for even"""
+        academic_year = admission_year + (semester - 1) // 2
+        return (academic_year, 'December') if semester % 2 else (academic_year + 1, 'May')
+
+    # --- generation ---
+
+    def generate(self):
+        """Write the whole dataset; returns {model name: rows created}"""
+        started = time.monotonic()
+        self.password_hash = bcrypt.hashpw(self.password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        ContentType.objects.clear_cache()
+        self.internship_type = ContentType.objects.get_for_model(Internship)
+        self.project_type = ContentType.objects.get_for_model(Project)
+
+        with transaction.atomic():
+            self._create_staff()
+            self._create_subjects()
+        self.log(f'Staff and subjects written ({time.monotonic() - started:.1f}s)')
+
+        for start in range(0, self.students, self.batch_size):
+            stop = min(start + self.batch_size, self.students)
+            with transaction.atomic():
+                self._create_students(start, stop)
+            self.log(f'Students {stop}/{self.students} written ({time.monotonic() - started:.1f}s)')
+
+        self._create_group_meetings()
+        self.log(f'Group meetings written ({time.monotonic() - started:.1f}s)')
+
+        refresh_year_toppers(self.departments)
+        invalidate_dashboard_stats(departments=self.departments)
+        conditional.bump(*{name for names in conditional.WATCHED_MODELS.values() for name in names})
+        return self.counts
+
+    def _create_staff(self):
+        users, faculty, hods = [], [], []
+        for index in range(self.faculty):
+            department = self.departments[index % len(self.departments)]
+            is_hod = index < len(self.departments)
+            number = index + 1
+            email = f'hod{number}@college.edu' if is_hod else f'faculty{number - len(self.departments)}@college.edu'
+            user = User(id=self._uuid(), email=email, password=self.password_hash,
+                        role=UserRole.HOD if is_hod else UserRole.FACULTY)
+            member = Faculty(
+                id=self._uuid(),
+                user_id=user.id,
+                employeeId=f'HOD{number:03d}' if is_hod else f'FAC{number:05d}',
+                name=('Prof. ' if is_hod else 'Dr. ') + self._name(),
+                phone1=self._phone(),
+                phone2=self._phone() if self.rng.random() < 0.4 else None,
+                personalEmail=email.replace('@college.edu', '.personal@gmail.com'),
+                collegeEmail=email,
+                department=department,
+                startDate=self._aware(self.as_of - timedelta(days=self.rng.randint(180, 7000))),
+                btech=self.rng.choice(INSTITUTES),
+                mtech=self.rng.choice(INSTITUTES),
+                phd=self.rng.choice(INSTITUTES) if is_hod or self.rng.random() < 0.6 else None,
+                office=f'{department} Block, Room {100 + index % 400}',
+                officeHours='10:00 AM - 5:00 PM'
+            )
+            users.append(user)
+            faculty.append(member)
+            self._faculty_by_department.setdefault(department, []).append(member)
+            if is_hod:
+                hods.append(HOD(id=self._uuid(), user_id=user.id, faculty_id=member.id, department=department,
+                                startDate=self._aware(self.as_of - timedelta(days=365 * 2))))
+
+        admin_user = User(id=self._uuid(), email='admin1@college.edu', password=self.password_hash, role=UserRole.ADMIN)
+        users.append(admin_user)
+        admin = Admin(id=self._uuid(), user_id=admin_user.id, employeeId='ADM001', name='Admin Staff 1',
+                      phone=self._phone(), personalEmail='admin1.personal@gmail.com',
+                      collegeEmail='admin1@college.edu', designation='System Administrator',
+                      office='Admin Block Room 1')
+
+        self._insert(User, users)
+        self._insert(Faculty, faculty)
+        self._insert(HOD, hods)
+        self._insert(Admin, [admin])
+
+    def _create_subjects(self):
+        subjects, history, past_links = [], [], []
+        all_faculty = [member for department in self.departments for member in self._faculty_by_department[department]]
+
+        def add(code, name, credits, subject_type, department, semester, pool):
+            teacher = self.rng.choice(pool)
+            previous = self.rng.choice(pool)
+            subject = Subject(id=self._uuid(), subjectCode=code, subjectName=name, credits=credits,
+                              subject_type=subject_type, department=department, typical_semester=semester,
+                              current_faculty_id=teacher.id)
+            semester_type = SemesterType.ODD if semester % 2 else SemesterType.EVEN
+            history.append(FacultySubjectHistory(id=self._uuid(), faculty_id=teacher.id, subject_id=subject.id,
+                                                 academic_year=self.academic_year, semester_type=semester_type,
+                                                 is_current=True))
+            if previous.id != teacher.id:
+                history.append(FacultySubjectHistory(id=self._uuid(), faculty_id=previous.id, subject_id=subject.id,
+                                                     academic_year=self.academic_year - 1,
+                                                     semester_type=semester_type, is_current=False))
+                past_links.append(Subject.past_faculty.through(subject_id=subject.id, faculty_id=previous.id))
+            subjects.append(subject)
+            return subject
+
+        for semester in range(1, self.semesters + 1):
+            common = []
+            if semester <= len(COMMON_SUBJECTS):
+                for k, (name, credits, subject_type) in enumerate(COMMON_SUBJECTS[semester - 1], start=1):
+                    common.append(add(f'GEN{semester}{k:02d}', name, credits, subject_type, None, semester, all_faculty))
+            for department in self.departments:
+                pool = self._faculty_by_department[department]
+                offered = list(common)
+                for k in range(self.subjects_per_semester):
+                    if semester >= 7 and k == self.subjects_per_semester - 1:
+                        subject_type = SubjectType.PRC
+                    elif semester >= 5 and k >= self.subjects_per_semester - 2:
+                        subject_type = SubjectType.DEC
+                    else:
+                        subject_type = SubjectType.PCC
+                    name = f'{SUBJECT_TOPICS[(semester + k) % len(SUBJECT_TOPICS)]} {ROMAN[(semester - 1) % len(ROMAN)]}'
+                    credits = 4 if k < 2 else (3 if k < 5 else 2)
+                    code = f"{department.replace('-', '')}{semester}{k + 1:02d}"
+                    offered.append(add(code, name, credits, subject_type, department, semester, pool))
+                self._subjects[(department, semester)] = offered
+
+        self._insert(Subject, subjects)
+        self._insert(FacultySubjectHistory, history)
+        self._insert(Subject.past_faculty.through, past_links)
+
+    def _next_mentor(self, department, year, advance=True):
+        """Round-robin over the department's faculty per year of study, so groups stay even"""
+        pool = self._faculty_by_department[department]
+        key = (department, year)
+        if key not in self._mentor_cursor:
+            self._mentor_cursor[key] = self.rng.randrange(len(pool))
+        cursor = self._mentor_cursor[key]
+        if advance:
+            self._mentor_cursor[key] = cursor + 1
+        return pool[cursor % len(pool)]
+
+    def _grade(self, ability):
+        score = ability + self.rng.gauss(0, 1.0)
+        for cutoff, grade in GRADE_CUTOFFS:
+            if score >= cutoff:
+                return grade
+        return 'X' if self.rng.random() < 0.1 else 'F'
+
+    def _create_students(self, start, stop):
+        rows = {model: [] for model in (User, Student, Semester, StudentSubject, BacklogHistory, Mentorship,
+                                        Meeting, Internship, Project, Request)}
+
+        for index in range(start, stop):
+            number = index + 1
+            department = self.rng.choice(self.departments)
+            year = self.rng.randint(1, 4)
+            admission_year = self.academic_year - (year - 1)
+            current_semester = self._current_semester(year)
+            name = self._name()
+
+            user = User(id=self._uuid(), email=f'student{number}@college.edu', password=self.password_hash,
+                        role=UserRole.STUDENT)
+            student_id = self._uuid()
+            mentor = self._next_mentor(department, year)
+
+            # Graded semesters: every one before the current, with backlogs cleared at the next sitting
+            semesters = []
+            ability = self.rng.gauss(7.4, 1.1)
+            for semester_number in range(1, min(current_semester - 1, self.semesters) + 1):
+                exam_year, exam_month = self._exam_session(semester_number, admission_year)
+                semester = Semester(
+                    id=self._uuid(), student_id=student_id, semester=semester_number,
+                    semester_type=SemesterType.ODD if semester_number % 2 else SemesterType.EVEN,
+                    academic_year=admission_year + (semester_number - 1) // 2
+                )
+                points = credits = 0
+                for subject in self._subjects[(department, semester_number)]:
+                    grade = StudentSubject(id=self._uuid(), student_id=student_id, subject_id=subject.id,
+                                           semester_id=semester.id, grade=self._grade(ability),
+                                           exam_year=exam_year, exam_month=exam_month)
+                    grade.apply_grade()
+                    if not grade.is_passed:
+                        retry_year, retry_month = (exam_year, 'December') if exam_month == 'May' else (exam_year + 1, 'May')
+                        if date(retry_year, 12 if retry_month == 'December' else 5, 20) < self.as_of:
+                            backlog = BacklogHistory(
+                                id=self._uuid(), student_id=student_id, subject_id=subject.id,
+                                original_semester=semester_number, attempt_number=1,
+                                attempt_type=AttemptType.BACKLOG, semester_type=semester.semester_type,
+                                exam_year=retry_year, exam_month=retry_month,
+                                grade=self.rng.choice(['C', 'D', 'P', 'P', 'F'])
+                            )
+                            backlog.apply_grade()
+                            rows[BacklogHistory].append(backlog)
+                            if backlog.is_cleared:
+                                grade.grade, grade.grade_point = backlog.grade, backlog.grade_point
+                                grade.is_passed, grade.passing_year = True, retry_year
+                    points += GRADE_POINTS[grade.grade] * subject.credits
+                    credits += subject.credits
+                    rows[StudentSubject].append(grade)
+                semester.total_credits = credits
+                semester.sgpa = round(points / credits, 2) if credits else 0.0
+                semesters.append(semester)
+            cgpa = calculate_cgpa(semesters)
+            for semester in semesters:
+                semester.cgpa = cgpa
+            rows[Semester].extend(semesters)
+
+            rows[User].append(user)
+            rows[Student].append(Student(
+                id=student_id,
+                user_id=user.id,
+                name=name,
+                aadhar=f'{100000000000 + index}',
+                phoneNumber=self._phone('7'),
+                phoneCode=91,
+                registrationNumber=100000000 + index,
+                rollNumber=(admission_year % 100) * 1000000 + index,
+                emergencyContact=self._phone('8'),
+                personalEmail=f'student{number}.personal@gmail.com',
+                collegeEmail=f'student{number}@college.edu',
+                dob=self._aware(date(admission_year - 18, 1, 1) + timedelta(days=self.rng.randrange(365))),
+                address=f'{self.rng.randint(1, 999)} Main Street, {self.rng.choice(CITIES)}',
+                program=Programme.BTECH,
+                branch=department,
+                year=year,
+                bloodGroup=self.rng.choice(BLOOD_GROUPS),
+                dayScholar=self.rng.random() < 0.4,
+                fatherName=f'{self.rng.choice(FIRST_NAMES)} {name.split()[-1]}',
+                fatherOccupation=self.rng.choice(['Engineer', 'Business', 'Farmer', 'Teacher', None]),
+                fatherNumber=self._phone(),
+                motherName=f'{self.rng.choice(FIRST_NAMES)} {name.split()[-1]}',
+                motherOccupation=self.rng.choice(['Teacher', 'Homemaker', 'Doctor', None]),
+                motherNumber=self._phone(),
+                gender=self.rng.choice(Gender.values),
+                community=self.rng.choice(Community.values),
+                xMarks=self.rng.randint(60, 100),
+                xiiMarks=self.rng.randint(60, 100),
+                jeeMains=self.rng.randint(80, 300),
+                jeeAdvanced=self.rng.randint(50, 250) if self.rng.random() < 0.3 else None,
+                currentCgpa=cgpa,
+                currentMentor_id=mentor.id
+            ))
+
+            # Mentorships: the current one, and last year's (with a different mentor) for seniors
+            mentorship = Mentorship(id=self._uuid(), faculty_id=mentor.id, student_id=student_id,
+                                    department=department, year=year, semester=current_semester,
+                                    start_date=self._aware(self.term_start), is_active=True)
+            rows[Mentorship].append(mentorship)
+            self._groups.setdefault((mentor.id, department, year, current_semester), []).append(student_id)
+            if year > 1:
+                previous = self._next_mentor(department, year, advance=False)
+                past = Mentorship(id=self._uuid(), faculty_id=previous.id, student_id=student_id,
+                                  department=department, year=year - 1, semester=current_semester - 2,
+                                  start_date=self._aware(self.term_start - timedelta(days=365)),
+                                  end_date=self._aware(self.term_start - timedelta(days=1)), is_active=False)
+                rows[Mentorship].append(past)
+                for weeks in (40, 46):
+                    rows[Meeting].append(Meeting(
+                        id=self._uuid(), mentorship_id=past.id,
+                        date=self.term_start - timedelta(weeks=weeks), time=self.rng.choice(MEETING_TIMES),
+                        description='Mentoring session', facultyReview=self.rng.choice(REVIEWS),
+                        status=MeetingStatus.COMPLETED
+                    ))
+
+            whole, fraction = divmod(self.requests_per_student, 1)
+            for _ in range(int(whole) + (self.rng.random() < fraction)):
+                self._add_request(rows, student_id, name, mentor, mentorship, current_semester)
+
+        for model, objs in rows.items():
+            self._insert(model, objs)
+
+    def _add_request(self, rows, student_id, student_name, mentor, mentorship, current_semester):
+        request_type = self.rng.choices(*zip(*REQUEST_TYPES))[0]
+        status = self.rng.choices(*zip(*REQUEST_STATUSES))[0]
+        semester = self.rng.randint(1, current_semester)
+        request = Request(id=self._uuid(), student_id=student_id, assigned_to_id=mentor.id, type=request_type,
+                          status=status, remarks='')
+        if status == RequestStatus.APPROVED:
+            request.feedback = 'Approved'
+        elif status == RequestStatus.REJECTED:
+            request.feedback = 'Please add more details'
+
+        if request_type == RequestType.INTERNSHIP:
+            request.request_data = {
+                'semester': semester,
+                'type': self.rng.choice(['SUMMER', 'WINTER', 'SEMESTER']),
+                'organisation': self.rng.choice(ORGANISATIONS),
+                'stipend': self.rng.choice([0, 5000, 10000, 15000, 25000]),
+                'duration': f'{self.rng.choice([4, 6, 8, 12])} weeks',
+                'location': self.rng.choice(CITIES)
+            }
+            if status == RequestStatus.APPROVED:
+                internship = Internship(id=self._uuid(), student_id=student_id, **request.request_data)
+                rows[Internship].append(internship)
+                request.content_type, request.object_id = self.internship_type, internship.id
+        elif request_type == RequestType.PROJECT:
+            project_mentor = self.rng.choice([None, mentor])
+            request.request_data = {
+                'semester': semester,
+                'title': f'{self.rng.choice(PROJECT_TOPICS)} System',
+                'description': 'Course project',
+                'technologies': self.rng.sample(TECHNOLOGIES, 3),
+                'mentorId': str(project_mentor.id) if project_mentor else None,
+                'mentorName': project_mentor.name if project_mentor else None
+            }
+            if status == RequestStatus.APPROVED:
+                data = request.request_data
+                project = Project(id=self._uuid(), student_id=student_id, semester=semester, title=data['title'],
+                                  description=data['description'], technologies=data['technologies'],
+                                  mentor_id=project_mentor.id if project_mentor else None)
+                rows[Project].append(project)
+                request.content_type, request.object_id = self.project_type, project.id
+        else:
+            meeting_date = self.as_of + timedelta(days=self.rng.randint(-30, 14))
+            meeting_time = self.rng.choice(MEETING_TIMES)
+            request.request_data = {
+                'mentorshipId': str(mentorship.id),
+                'facultyId': str(mentor.id),
+                'facultyName': mentor.name,
+                'studentName': student_name,
+                'date': meeting_date.isoformat(),
+                'time': meeting_time.strftime('%H:%M'),
+                'description': 'Would like to discuss my progress'
+            }
+            request.remarks = request.request_data['description']
+            if status == RequestStatus.APPROVED:
+                rows[Meeting].append(Meeting(
+                    id=self._uuid(), mentorship_id=mentorship.id, date=meeting_date, time=meeting_time,
+                    description=request.request_data['description'],
+                    status=MeetingStatus.COMPLETED if meeting_date < self.as_of else MeetingStatus.UPCOMING
+                ))
+        rows[Request].append(request)
+
+    def _create_group_meetings(self):
+        """Fortnightly completed meetings this term plus one upcoming, for every mentorship group"""
+        meetings, attendance = [], []
+
+        def flush():
+            with transaction.atomic():
+                self._insert(GroupMeeting, meetings)
+                self._insert(GroupMeetingStudent, attendance)
+            meetings.clear()
+            attendance.clear()
+
+        for (faculty_id, department, year, semester), student_ids in self._groups.items():
+            dates = [self.as_of - timedelta(weeks=2 * k) for k in range(self.meetings_per_group - 1, 0, -1)]
+            dates = [day for day in dates if day >= self.term_start]
+            if self.meetings_per_group:
+                dates.append(self.as_of + timedelta(days=self.rng.randint(1, 7)))
+            for day in dates:
+                completed = day < self.as_of
+                meeting = GroupMeeting(id=self._uuid(), faculty_id=faculty_id, department=department, year=year,
+                                       semester=semester, date=day, time=self.rng.choice(MEETING_TIMES),
+                                       description='Mentoring group meeting',
+                                       status=MeetingStatus.COMPLETED if completed else MeetingStatus.UPCOMING)
+                meetings.append(meeting)
+                for student_id in student_ids:
+                    attended = not completed or self.rng.random() < 0.9
+                    attendance.append(GroupMeetingStudent(
+                        id=self._uuid(), group_meeting_id=meeting.id, student_id=student_id, attended=attended,
+                        review=self.rng.choice(REVIEWS) if completed and attended else ''
+                    ))
+            if len(attendance) >= 10 * self.batch_size:
+                flush()
+        flush()
@@ -0,0 +1,389 @@
+"""
+Bulk import of exam result sheets (CSV, or XLSX when openpyxl is installed).
+Rows are read as a stream and written in batches with the same per-row semantics as
+update_student_grade; GPA is recomputed once per affected student and YearTopper once
+for the affected departments after the last batch.
+"""
+import csv
+import io
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from .cache import invalidate_dashboard_stats
+from .conditional import bump
+from .grades import recalculate_gpa, refresh_year_toppers
+from .models import (
+    Student, Subject, Semester, StudentSubject, BacklogHistory,
+    AttemptType, GRADE_POINTS
+)
+
+
+# Rows validated and written per round trip
+IMPORT_BATCH_SIZE = 500
+
+# Normalised header (lowercase, no spaces/underscores/dashes) -> row key
+COLUMNS = {
+    'rollnumber': 'rollNumber',
+    'rollno': 'rollNumber',
+    'subjectcode': 'subjectCode',
+    'grade': 'grade',
+    'attempttype': 'attemptType',
+    'semester': 'semester',
+    'examyear': 'examYear',
+    'exammonth': 'examMonth',
+}
+REQUIRED_COLUMNS = ('rollNumber', 'subjectCode', 'grade')
+
+RETAKE_ATTEMPTS = (AttemptType.BACKLOG, AttemptType.MAKEUP)
+
+
+def _normalise_header(header):
+    mapped = []
+    for name in header:
+        key = str(name or '').strip().lower()
+        for ch in ' _-':
+            key = key.replace(ch, '')
+        mapped.append(COLUMNS.get(key))
+    missing = [col for col in REQUIRED_COLUMNS if col not in mapped]
+    if missing:
+        raise ValueError(f'Missing required columns: {missing}')
+    return mapped
+
+
+def _read_csv(uploaded_file):
+    reader = csv.reader(io.TextIOWrapper(uploaded_file, encoding='utf-8-sig', newline=''))
+    header = next(reader, None)
+    if header is None:
+        raise ValueError('The file is empty')
+    columns = _normalise_header(header)
+    for row_number, values in enumerate(reader, start=2):
+        if any(v.strip() for v in values):
+            yield row_number, {col: v for col, v in zip(columns, values) if col}
+
+
+def _read_xlsx(uploaded_file):
+    try:
+        import openpyxl
+    except ImportError:
+        raise ValueError('XLSX import needs the openpyxl package; upload the sheet as CSV instead')
+
+    workbook = openpyxl.load_workbook(uploaded_file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError('The file is empty')
+        columns = _normalise_header(header)
+        for row_number, values in enumerate(rows, start=2):
+            if any(v not in (None, '') for v in values):
+                yield row_number, {col: v for col, v in zip(columns, values) if col}
+    finally:
+        workbook.close()
+
+
+def read_result_sheet(uploaded_file, filename=''):
+    """
+    Yield (sheet row number, {column: value}) for each non-empty data row of a CSV or XLSX upload.
+    Raises ValueError for an unreadable file or missing required columns.
+    """
+    if filename.lower().endswith(('.xlsx', '.xlsm')):
+        return _read_xlsx(uploaded_file)
+    return _read_csv(uploaded_file)
+
+
+def _to_int(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return int(str(value).strip())
+
+
+def _parse_row(values, defaults):
+    """Return the cleaned row dict, or raise ValueError with the reason it is rejected"""
+    try:
+        roll_number = _to_int(values.get('rollNumber'))
+    except (TypeError, ValueError):
+        raise ValueError('Invalid rollNumber')
+
+    subject_code = str(values.get('subjectCode') or '').strip()
+    if not subject_code:
+        raise ValueError('subjectCode is required')
+
+    grade = str(values.get('grade') or '').strip().upper()
+    if grade not in GRADE_POINTS:
+        raise ValueError(f'Invalid grade. Valid values: {list(GRADE_POINTS)}')
+
+    attempt_type = str(values.get('attemptType') or AttemptType.REGULAR).strip().upper()
+    if attempt_type not in AttemptType.values:
+        raise ValueError(f'Invalid attemptType. Valid values: {AttemptType.values}')
+
+    try:
+        semester = _to_int(values['semester']) if values.get('semester') not in (None, '') else defaults['semester']
+    except (TypeError, ValueError):
+        raise ValueError('Invalid semester')
+    if semester is None or not 1 <= semester <= 8:
+        raise ValueError('semester must be between 1 and 8')
+
+    try:
+        exam_year = _to_int(values['examYear']) if values.get('examYear') not in (None, '') else defaults['examYear']
+    except (TypeError, ValueError):
+        raise ValueError('Invalid examYear')
+
+    return {
+        'rollNumber': roll_number,
+        'subjectCode': subject_code,
+        'grade': grade,
+        'attemptType': attempt_type,
+        'semester': semester,
+        'examYear': exam_year,
+        'examMonth': str(values.get('examMonth') or '').strip() or defaults['examMonth'],
+    }
+
+
+class _GradeImport:
+    """State shared across batches: lookups already loaded and rows already written"""
+
+    def __init__(self, department, defaults):
+        self.department = department
+        self.defaults = defaults
+        self.now = timezone.now()
+        self.students = {}        # rollNumber -> Student (None if unknown)
+        self.subjects = {}        # subjectCode -> Subject (None if unknown)
+        self.semesters = {}       # (student_id, semester number) -> Semester
+        self.grades = {}          # (student_id, subject_id) -> [StudentSubject], by semester number
+        self.backlog_counts = {}  # (student_id, subject_id) -> attempts recorded
+        self.changed_semesters = set()
+        self.departments = set()
+        self.errors = []
+        self.created = 0
+        self.updated = 0
+        self.backlog_attempts = 0
+
+    def fail(self, row_number, values, reason):
+        self.errors.append({
+            'row': row_number,
+            'rollNumber': values.get('rollNumber'),
+            'subjectCode': values.get('subjectCode'),
+            'reason': reason
+        })
+
+    def _load(self, rows):
+        """Fetch students, subjects, semesters, grades and backlog counts the batch needs"""
+        rolls = {r['rollNumber'] for _, r in rows} - self.students.keys()
+        if rolls:
+            found = Student.objects.filter(rollNumber__in=rolls).only('id', 'rollNumber', 'branch', 'year', 'status')
+            self.students.update({s.rollNumber: s for s in found})
+            self.students.update({roll: None for roll in rolls if roll not in self.students})
+
+        codes = {r['subjectCode'] for _, r in rows} - self.subjects.keys()
+        if codes:
+            found = Subject.objects.filter(subjectCode__in=codes).only('id', 'subjectCode')
+            self.subjects.update({s.subjectCode: s for s in found})
+            self.subjects.update({code: None for code in codes if code not in self.subjects})
+
+        student_ids = set()
+        subject_ids = set()
+        for _, r in rows:
+            student = self.students.get(r['rollNumber'])
+            subject = self.subjects.get(r['subjectCode'])
+            if student and subject and (student.id, subject.id) not in self.grades:
+                student_ids.add(student.id)
+                subject_ids.add(subject.id)
+        if not student_ids:
+            return
+
+        for sem in Semester.objects.filter(student_id__in=student_ids):
+            self.semesters.setdefault((sem.student_id, sem.semester), sem)
+
+        pairs = set()
+        for _, r in rows:
+            student = self.students.get(r['rollNumber'])
+            subject = self.subjects.get(r['subjectCode'])
+            if student and subject and (student.id, subject.id) not in self.grades:
+                pairs.add((student.id, subject.id))
+                self.grades[(student.id, subject.id)] = []
+                self.backlog_counts[(student.id, subject.id)] = 0
+
+        existing = StudentSubject.objects.filter(
+            student_id__in=student_ids,
+            subject_id__in=subject_ids
+        ).select_related('semester').order_by('semester__semester')
+        for sg in existing:
+            if (sg.student_id, sg.subject_id) in pairs:
+                self.grades[(sg.student_id, sg.subject_id)].append(sg)
+
+        counts = BacklogHistory.objects.filter(
+            student_id__in=student_ids,
+            subject_id__in=subject_ids
+        ).values('student_id', 'subject_id').annotate(attempts=Count('id')).order_by()
+        for row in counts:
+            key = (row['student_id'], row['subject_id'])
+            if key in pairs:
+                self.backlog_counts[key] = row['attempts']
+
+    def process(self, rows):
+        """Validate and write one batch of (row number, parsed row) pairs"""
+        self._load(rows)
+
+        new_semesters = []
+        new_grades = []
+        updated_grades = {}
+        backlog_rows = []
+
+        for row_number, r in rows:
+            student = self.students.get(r['rollNumber'])
+            if student is None:
+                self.fail(row_number, r, 'Student not found')
+                continue
+            if self.department and student.branch != self.department:
+                self.fail(row_number, r, f'Student branch ({student.branch}) is not {self.department}')
+                continue
+            subject = self.subjects.get(r['subjectCode'])
+            if subject is None:
+                self.fail(row_number, r, 'Subject not found')
+                continue
+
+            semester_type = 'ODD' if r['semester'] % 2 == 1 else 'EVEN'
+            semester = self.semesters.get((student.id, r['semester']))
+            if semester is None:
+                semester = Semester(
+                    student_id=student.id,
+                    semester=r['semester'],
+                    semester_type=semester_type,
+                    sgpa=0.0,
+                    cgpa=0.0
+                )
+                self.semesters[(student.id, r['semester'])] = semester
+                new_semesters.append(semester)
+            self.changed_semesters.add(semester.id)
+            self.departments.add(student.branch)
+
+            pair = (student.id, subject.id)
+            attempts = self.grades[pair]
+
+            if attempts and r['attemptType'] in RETAKE_ATTEMPTS:
+                # Retake of an existing grade: record the attempt, upgrade the original grade if passed
+                original = attempts[0]
+                self.backlog_counts[pair] += 1
+                backlog = BacklogHistory(
+                    student_id=student.id,
+                    subject_id=subject.id,
+                    original_semester=original.semester.semester,
+                    attempt_number=self.backlog_counts[pair],
+                    attempt_type=r['attemptType'],
+                    semester_type=semester_type,
+                    exam_year=r['examYear'],
+                    exam_month=r['examMonth'],
+                    grade=r['grade']
+                )
+                backlog.apply_grade()
+                backlog_rows.append(backlog)
+                self.backlog_attempts += 1
+
+                if GRADE_POINTS[r['grade']] >= 5:
+                    original.grade = r['grade']
+                    original.passing_year = r['examYear']
+                    original.apply_grade()
+                    original.updatedAt = self.now
+                    if not original._state.adding:
+                        updated_grades[original.id] = original
+                    self.changed_semesters.add(original.semester_id)
+                continue
+
+            grade_row = next((sg for sg in attempts if sg.semester_id == semester.id), None)
+            if grade_row is None:
+                grade_row = StudentSubject(
+                    student_id=student.id,
+                    subject_id=subject.id,
+                    semester=semester
+                )
+                attempts.append(grade_row)
+                attempts.sort(key=lambda sg: sg.semester.semester)
+                new_grades.append(grade_row)
+                self.created += 1
+            elif not grade_row._state.adding:
+                updated_grades[grade_row.id] = grade_row
+                self.updated += 1
+            grade_row.grade = r['grade']
+            grade_row.attempt_type = r['attemptType']
+            grade_row.exam_year = r['examYear']
+            grade_row.exam_month = r['examMonth']
+            grade_row.updatedAt = self.now
+            grade_row.apply_grade()
+
+        if new_semesters:
+            Semester.objects.bulk_create(new_semesters)
+        if new_grades:
+            StudentSubject.objects.bulk_create(new_grades)
+        if updated_grades:
+            StudentSubject.objects.bulk_update(
+                list(updated_grades.values()),
+                ['grade', 'grade_point', 'is_passed', 'passing_year', 'attempt_type',
+                 'exam_year', 'exam_month', 'updatedAt']
+            )
+        if backlog_rows:
+            BacklogHistory.objects.bulk_create(backlog_rows)
+
+
+def _invalidate_caches(student_ids, departments):
+    invalidate_dashboard_stats(student_ids=student_ids, departments=departments)
+    bump('toppers')
+
+
+def import_grades(rows, department=None, semester=None, exam_year=None, exam_month=None, dry_run=False):
+    """
+    Import (row number, {column: value}) pairs from read_result_sheet.
+    `semester`, `exam_year` and `exam_month` fill in columns a row leaves empty; with `department`
+    rows for students of other branches are rejected. Rejected rows are reported and skipped;
+    everything else is written in one transaction (rolled back when `dry_run`).
+    Returns a summary dict with a row-level `errors` list.
+    """
+    defaults = {
+        'semester': semester,
+        'examYear': exam_year or datetime.now().year,
+        'examMonth': exam_month or datetime.now().strftime('%B'),
+    }
+    state = _GradeImport(department, defaults)
+    total_rows = 0
+    gpa_changes = {}
+
+    with transaction.atomic():
+        batch = []
+        for row_number, values in rows:
+            total_rows += 1
+            try:
+                batch.append((row_number, _parse_row(values, defaults)))
+            except ValueError as e:
+                state.fail(row_number, values, str(e))
+                continue
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                state.process(batch)
+                batch = []
+        if batch:
+            state.process(batch)
+
+        if state.changed_semesters:
+            student_ids = {sem.student_id for sem in state.semesters.values() if sem.id in state.changed_semesters}
+            gpa_changes = recalculate_gpa(student_ids, state.changed_semesters)
+            refresh_year_toppers(state.departments)
+            # The bulk writes bypass model signals; drop the cached stats and toppers once
+            # committed (never, when the dry run rolls back)
+            transaction.on_commit(lambda: _invalidate_caches(student_ids, state.departments))
+
+        if dry_run:
+            transaction.set_rollback(True)
+
+    state.errors.sort(key=lambda e: e['row'])
+    return {
+        'dryRun': dry_run,
+        'totalRows': total_rows,
+        'created': state.created,
+        'updated': state.updated,
+        'backlogAttempts': state.backlog_attempts,
+        'failed': len(state.errors),
+        'studentsRecomputed': len(gpa_changes),
+        'departmentsRefreshed': sorted(state.departments),
+        'errors': state.errors
+    }
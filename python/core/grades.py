@@ -0,0 +1,197 @@
+"""
+GPA engine: SGPA/CGPA recomputation and the topper refresh that follows a grade change.
+SGPA comes from one aggregate over the changed semesters' grades; CGPA is derived from the
+stored per-semester totals, and every touched semester is written back with one bulk_update.
+The result is mirrored on Student.currentCgpa, which list sorting and topper ranking read.
+Year toppers for any set of departments are ranked in one ROW_NUMBER() window query.
+"""
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, FloatField, OuterRef, Subquery, Sum, Value, Window
+from django.db.models.functions import Coalesce, RowNumber
+from django.utils import timezone
+
+from .models import Student, Semester, StudentSubject, StudentStatus, YearTopper
+
+
+# Number of ranks kept per department/year in YearTopper
+TOPPERS_PER_YEAR = getattr(settings, 'YEAR_TOPPERS_COUNT', 3)
+
+# Years of study ranked in YearTopper
+TOPPER_YEARS = (1, 2, 3, 4)
+
+
+def semester_totals(semester_ids):
+    """
+    Return {semester_id: (grade points x credits, credits)} for `semester_ids` using one
+    aggregate query. Every graded subject counts, including F/X (0 points).
+    """
+    rows = StudentSubject.objects.filter(
+        semester_id__in=semester_ids
+    ).values('semester_id').annotate(
+        points=Sum(F('grade_point') * F('subject__credits')),
+        credits=Sum('subject__credits')
+    ).order_by()
+    return {row['semester_id']: (row['points'] or 0, row['credits'] or 0) for row in rows}
+
+
+def calculate_cgpa(semesters):
+    """CGPA from stored semester rows: Σ(sgpa * credits) / Σ(credits) over semesters with a result"""
+    total_weighted_sgpa = 0
+    total_credits = 0
+    for sem in semesters:
+        if sem.sgpa > 0 and sem.total_credits > 0:
+            total_weighted_sgpa += sem.sgpa * sem.total_credits
+            total_credits += sem.total_credits
+    return round(total_weighted_sgpa / total_credits, 2) if total_credits > 0 else 0.0
+
+
+def recalculate_gpa(student_ids, semester_ids=None):
+    """
+    Recompute SGPA for `semester_ids` (every semester of the students when None) and CGPA for
+    each student in `student_ids` (also stored on Student.currentCgpa), in four queries
+    regardless of how many rows change.
+    Returns {student_id: (previous_cgpa, cgpa, {semester number: Semester})}.
+    """
+    semesters = list(Semester.objects.filter(student_id__in=student_ids).order_by('semester'))
+    targets = {sem.id for sem in semesters} if semester_ids is None else set(semester_ids)
+    totals = semester_totals(targets) if targets else {}
+    now = timezone.now()
+
+    by_student = {}
+    for sem in semesters:
+        by_student.setdefault(sem.student_id, []).append(sem)
+        if sem.id in targets:
+            points, credits = totals.get(sem.id, (0, 0))
+            sem.total_credits = credits
+            sem.sgpa = round(points / credits, 2) if credits > 0 else 0.0
+
+    results = {}
+    for student_id, student_semesters in by_student.items():
+        previous_cgpa = student_semesters[0].cgpa
+        cgpa = calculate_cgpa(student_semesters)
+        for sem in student_semesters:
+            sem.cgpa = cgpa
+            sem.updatedAt = now
+        results[student_id] = (previous_cgpa, cgpa, {sem.semester: sem for sem in student_semesters})
+
+    if semesters:
+        Semester.objects.bulk_update(semesters, ['sgpa', 'cgpa', 'total_credits', 'updatedAt'], batch_size=1000)
+        Student.objects.bulk_update(
+            [Student(id=student_id, currentCgpa=cgpa) for student_id, (_, cgpa, _) in results.items()],
+            ['currentCgpa'],
+            batch_size=1000
+        )
+    return results
+
+
+def sync_current_cgpa(students=None):
+    """
+    Reset Student.currentCgpa to the CGPA of each student's latest semester in one UPDATE, for
+    the `students` queryset (all students when None). Returns the number of students updated.
+    """
+    latest_cgpa = Semester.objects.filter(student=OuterRef('pk')).order_by('-semester').values('cgpa')[:1]
+    students = Student.objects.all() if students is None else students
+    return students.update(
+        currentCgpa=Coalesce(Subquery(latest_cgpa), Value(0.0), output_field=FloatField())
+    )
+
+
+def toppers_affected(student, previous_cgpa, cgpa):
+    """
+    Whether a CGPA change of `student` can change the YearTopper ranks of their branch/year:
+    they are currently listed, or the new CGPA reaches the lowest listed CGPA (any positive
+    CGPA while fewer than TOPPERS_PER_YEAR are listed).
+    """
+    if cgpa == previous_cgpa:
+        return False
+
+    toppers = list(
+        YearTopper.objects.filter(
+            department=student.branch,
+            academic_year=student.year
+        ).values_list('student_id', 'cgpa')
+    )
+    if any(student_id == student.id for student_id, _ in toppers):
+        return True
+    if student.status != StudentStatus.PURSUING or cgpa <= 0:
+        return False
+    if len(toppers) < TOPPERS_PER_YEAR:
+        return True
+    return cgpa >= min(topper_cgpa for _, topper_cgpa in toppers)
+
+
+def update_student_gpa(student, semester_ids):
+    """
+    Recompute GPA after grade changes in `semester_ids` of `student` and refresh the
+    student's year toppers only when the change crosses the top ranks.
+    Returns (cgpa, {semester number: Semester}).
+    """
+    previous_cgpa, cgpa, semesters = recalculate_gpa([student.id], semester_ids).get(
+        student.id, (0.0, 0.0, {})
+    )
+    if toppers_affected(student, previous_cgpa, cgpa):
+        refresh_year_toppers([student.branch], years=[student.year])
+    return cgpa, semesters
+
+
+def rank_year_toppers(departments=None, years=None, top_n=None):
+    """
+    Return [(department, year, rank, student_id, cgpa)] for the top `top_n` pursuing students
+    by CGPA in each department/year (all departments when `departments` is None).
+    Ties on CGPA are broken by roll number. Uses ROW_NUMBER() OVER (PARTITION BY branch, year)
+    where the database supports window functions, and a single ordered scan otherwise.
+    """
+    top_n = top_n or TOPPERS_PER_YEAR
+    students = Student.objects.filter(
+        status=StudentStatus.PURSUING,
+        year__in=years or TOPPER_YEARS,
+        currentCgpa__gt=0
+    )
+    if departments is not None:
+        students = students.filter(branch__in=departments)
+
+    if connection.features.supports_over_clause:
+        ranked = students.annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=[F('branch'), F('year')],
+                order_by=[F('currentCgpa').desc(), F('rollNumber').asc()]
+            )
+        ).filter(rank__lte=top_n).values_list('branch', 'year', 'rank', 'id', 'currentCgpa')
+        return sorted(ranked)
+
+    ranked = []
+    partition = None
+    rank = 0
+    ordered = students.order_by('branch', 'year', '-currentCgpa', 'rollNumber').values_list(
+        'branch', 'year', 'id', 'currentCgpa'
+    )
+    for branch, year, student_id, cgpa in ordered.iterator():
+        if (branch, year) != partition:
+            partition = (branch, year)
+            rank = 0
+        rank += 1
+        if rank <= top_n:
+            ranked.append((branch, year, rank, student_id, cgpa))
+    return ranked
+
+
+def refresh_year_toppers(departments=None, years=None, top_n=None):
+    """
+    Replace the YearTopper rows of `departments` (all when None) and `years` (1-4 when None)
+    with the current top `top_n` ranking: one ranking query, one delete and one bulk insert,
+    in a single transaction. Returns the number of topper rows written.
+    """
+    stale = YearTopper.objects.filter(academic_year__in=years or TOPPER_YEARS)
+    if departments is not None:
+        stale = stale.filter(department__in=departments)
+
+    with transaction.atomic():
+        toppers = [
+            YearTopper(department=branch, academic_year=year, rank=rank, student_id=student_id, cgpa=cgpa)
+            for branch, year, rank, student_id, cgpa in rank_year_toppers(departments, years, top_n)
+        ]
+        stale.delete()
+        YearTopper.objects.bulk_create(toppers)
+    return len(toppers)
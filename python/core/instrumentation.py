@@ -0,0 +1,209 @@
+"""
+Per-endpoint request instrumentation. InstrumentationMiddleware records, for every request
+routed to a named URL, the total latency, the number of DB queries and the time spent in
+them, the time spent JSON-encoding responses (TimedJSONEncoder, which the middleware makes
+the default encoder of django.http.JsonResponse), the rest of the time spent in Python and
+the response size. The last PERF_STATS_WINDOW samples per URL name are kept in process memory
+and summarised as percentiles by api/admin/endpoint-stats. Like the verified-token cache,
+stats are per worker process. Streaming responses (CSV export) are measured until the view
+returns, not while the body is streamed, and responses served from a cache serialize nothing.
+
+QUERY_BUDGETS caps the queries an endpoint may run regardless of data size; requests over
+budget are logged, and core.testing.QueryBudgetMixin fails a test that goes over.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.http import JsonResponse
+
+
+logger = logging.getLogger(__name__)
+
+PERF_STATS_ENABLED = getattr(settings, 'PERF_STATS_ENABLED', True)
+PERF_STATS_WINDOW = getattr(settings, 'PERF_STATS_WINDOW', 500)
+
+# URL name -> maximum DB queries per request (including authentication). Every endpoint
+# here runs a fixed number of queries however many rows it returns, so going over means an
+# N+1 crept in.
+QUERY_BUDGETS = {
+    'get_user_role': 2,
+    'get_students_list': 3,
+    'search_students': 2,
+    'get_faculty': 2,
+    'get_hods': 3,
+    'get_subjects_list': 3,
+    'get_year_toppers': 3,
+    'get_faculty_subjects': 6,
+    'get_hod_mentorships': 8,
+    'get_faculty_mentees': 4,
+    'get_student_about': 1,
+    'get_student_grades': 4,
+    'get_student_grades_by_id': 5,
+    'get_student_mentoring_by_rollno': 5,
+    'get_student_dashboard_stats': 3,
+    'get_faculty_dashboard_stats': 3,
+    'get_hod_dashboard_stats': 2,
+    'get_admin_dashboard_stats': 2,
+}
+
+# Fields of a sample, in order
+SAMPLE_FIELDS = ('totalMs', 'queries', 'dbMs', 'serializeMs', 'appMs', 'bytes')
+
+# Timer of the request being instrumented, for TimedJSONEncoder
+_serialization_timer = ContextVar('serialization_timer', default=None)
+
+
+class QueryRecorder:
+    """execute_wrapper that counts queries and the time spent executing them"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+class SerializationTimer:
+    """Time spent JSON-encoding the responses of one request"""
+
+    def __init__(self):
+        self.seconds = 0.0
+
+
+class TimedJSONEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder that adds its encoding time to the instrumented request's timer"""
+
+    def encode(self, o):
+        timer = _serialization_timer.get()
+        if timer is None:
+            return super().encode(o)
+        start = time.perf_counter()
+        try:
+            return super().encode(o)
+        finally:
+            timer.seconds += time.perf_counter() - start
+
+
+def use_timed_json_encoder():
+    """
+    Make TimedJSONEncoder the default `encoder` of django.http.JsonResponse, so responses are
+    timed without the views knowing; a JsonResponse given its own encoder is not timed.
+    """
+    encoder, *defaults = JsonResponse.__init__.__defaults__
+    if encoder is DjangoJSONEncoder:
+        JsonResponse.__init__.__defaults__ = (TimedJSONEncoder, *defaults)
+
+
+class EndpointStats:
+    """
+    Thread-safe rolling window of request samples per URL name: the latest `window` samples
+    of each endpoint, plus a running request count.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._samples = {}  # url name -> deque of SAMPLE_FIELDS tuples
+        self._totals = {}  # url name -> requests recorded since start/reset
+        self._lock = threading.Lock()
+
+    def record(self, name, sample):
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append(sample)
+            self._totals[name] = self._totals.get(name, 0) + 1
+
+    def snapshot(self):
+        """{url name: (total requests, [samples])} copied under the lock"""
+        with self._lock:
+            return {name: (self._totals[name], list(samples)) for name, samples in self._samples.items()}
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+
+endpoint_stats = EndpointStats(PERF_STATS_WINDOW)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(samples, percentiles=(50, 95, 99)):
+    """{field: {'p50': .., 'p95': .., 'p99': .., 'max': ..}} over a list of samples"""
+    summary = {}
+    for index, field in enumerate(SAMPLE_FIELDS):
+        values = sorted(sample[index] for sample in samples if sample[index] is not None)
+        stats = {f'p{pct}': percentile(values, pct) for pct in percentiles}
+        stats['max'] = values[-1] if values else None
+        summary[field] = stats
+    return summary
+
+
+class InstrumentationMiddleware:
+    """
+    Record latency, DB queries/time, serialization time, other Python time and response size
+    per URL name. Place first in MIDDLEWARE so the authentication queries are counted too.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if PERF_STATS_ENABLED:
+            use_timed_json_encoder()
+
+    def __call__(self, request):
+        if not PERF_STATS_ENABLED:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        timer = SerializationTimer()
+        token = _serialization_timer.set(timer)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(recorder))
+                response = self.get_response(request)
+        finally:
+            _serialization_timer.reset(token)
+        elapsed = time.perf_counter() - start
+
+        match = getattr(request, 'resolver_match', None)
+        name = match.url_name if match is not None else None
+        if not name:
+            return response
+
+        size = None if response.streaming else len(response.content)
+        endpoint_stats.record(name, (
+            round(elapsed * 1000, 3),
+            recorder.count,
+            round(recorder.seconds * 1000, 3),
+            round(timer.seconds * 1000, 3),
+            round((elapsed - recorder.seconds - timer.seconds) * 1000, 3),
+            size
+        ))
+
+        budget = QUERY_BUDGETS.get(name)
+        if budget is not None and recorder.count > budget:
+            logger.warning("%s ran %d queries (budget %d) for %s", name, recorder.count, budget, request.get_full_path())
+        return response
@@ -0,0 +1,48 @@
+"""
+Logging setup for the core app.
+
+Loggers under `core.*` are configured in settings.LOGGING. When
+settings.CORE_LOG_QUEUE is on, the handlers of the `core` logger are moved
+behind a QueueHandler so request threads only enqueue records and a single
+background QueueListener thread does the formatting and I/O.
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+
+
+_listener = None
+
+
+def start_queue_logging(logger_name='core'):
+    """
+    Replace the handlers of `logger_name` with a QueueHandler and start a
+    QueueListener that feeds the original handlers. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    target = logging.getLogger(logger_name)
+    handlers = [h for h in target.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+    if not handlers:
+        return None
+
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        target.removeHandler(handler)
+    target.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_queue_logging)
+    return _listener
+
+
+def stop_queue_logging():
+    """Flush pending records and stop the background listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
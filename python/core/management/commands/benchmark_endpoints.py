@@ -0,0 +1,112 @@
+import json
+import platform
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from core.benchmark import SCENARIOS, SCENARIO_NAMES, BenchmarkContext, compare, run
+from core.models import Department, Faculty, Mentorship, Student, StudentSubject
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the heavy API endpoints in-process (latency, queries, peak memory) against the '
+        'current database, e.g. one built by generate_dataset; save the results as JSON and '
+        'compare them with a baseline'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scenario', action='append', dest='scenarios', choices=SCENARIO_NAMES,
+            help='Scenario to run; repeat for several (default: all)'
+        )
+        parser.add_argument('--iterations', type=int, default=20, help='Timed requests per scenario (default: 20)')
+        parser.add_argument('--warmup', type=int, default=2, help='Untimed requests per scenario first (default: 2)')
+        parser.add_argument('--department', choices=Department.values,
+                            help='Department to act in (default: the one with the most students)')
+        parser.add_argument('--password', default='password',
+                            help='Password of the benchmark users (default: password, as generate_dataset)')
+        parser.add_argument('--label', default='', help='Free-form label stored with the results')
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument('--baseline', help='JSON file of an earlier run to compare against')
+        parser.add_argument('--threshold', type=float, default=10.0,
+                            help='Percent growth in latency or memory reported as a regression (default: 10)')
+        parser.add_argument('--fail-on-regression', action='store_true',
+                            help='Exit with an error if the comparison finds a regression')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1 or options['warmup'] < 0:
+            raise CommandError('--iterations must be at least 1 and --warmup cannot be negative')
+
+        baseline = None
+        if options['baseline']:
+            try:
+                with open(options['baseline']) as f:
+                    baseline = json.load(f)['results']
+            except (OSError, ValueError, KeyError) as e:
+                raise CommandError(f"Cannot read baseline {options['baseline']}: {e}")
+
+        selected = options['scenarios'] or SCENARIO_NAMES
+        scenarios = [scenario for scenario in SCENARIOS if scenario.name in selected]
+
+        # Allows the test client's host and measures with DEBUG off (no query logging)
+        setup_test_environment(debug=False)
+        try:
+            context = BenchmarkContext(options['department'])
+            self.stdout.write(f'{"scenario":<26}{"p50 ms":>10}{"p95 ms":>10}{"queries":>9}{"db ms":>9}{"peak KiB":>11}')
+            results = run(scenarios, context, options['password'], options['iterations'], options['warmup'],
+                          log=self._print_result)
+        except ValueError as e:
+            raise CommandError(str(e))
+        finally:
+            teardown_test_environment()
+
+        report = {
+            'meta': {
+                'label': options['label'],
+                'createdAt': timezone.now().isoformat(),
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'iterations': options['iterations'],
+                'warmup': options['warmup'],
+                'dataset': {
+                    'students': Student.objects.count(),
+                    'faculty': Faculty.objects.count(),
+                    'mentorships': Mentorship.objects.count(),
+                    'grades': StudentSubject.objects.count(),
+                },
+                'actors': context.describe(),
+            },
+            'results': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if baseline is None:
+            self.stdout.write(self.style.SUCCESS(f'Benchmarked {len(results)} scenario(s)'))
+            return
+
+        rows = compare(baseline, results, options['threshold'])
+        regressions = [row for row in rows if row['regression']]
+        self.stdout.write(f'\nCompared with {options["baseline"]}:')
+        for row in rows:
+            change = 'n/a' if row['changePct'] is None else f"{row['changePct']:+.1f}%"
+            line = f"{row['scenario']:<26}{row['metric']:<10}{row['baseline']:>12} -> {row['current']:<12}{change:>9}"
+            self.stdout.write(self.style.ERROR(line + '  REGRESSION') if row['regression'] else line)
+
+        if regressions and options['fail_on_regression']:
+            raise CommandError(f'{len(regressions)} regression(s) against {options["baseline"]}')
+        summary = f'{len(regressions)} regression(s)' if regressions else 'No regressions'
+        self.stdout.write(self.style.SUCCESS(f'{summary} over {len(results)} scenario(s)'))
+
+    def _print_result(self, name, result):
+        self.stdout.write(
+            f"{name:<26}{result['latencyMs']['p50']:>10.1f}{result['latencyMs']['p95']:>10.1f}"
+            f"{result['queries']:>9}{result['dbMs']['p50']:>9.1f}{result['peakMemoryKb']:>11.1f}"
+        )
@@ -0,0 +1,80 @@
+import time
+from datetime import date
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from core.dataset import DatasetGenerator
+from core.models import Department, User
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate a synthetic institution (faculty, HODs, students with grades, mentorships, '
+        'meetings, requests) for load testing; deterministic for a given --seed'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=50000, help='Students to create (default: 50000)')
+        parser.add_argument('--faculty', type=int, default=2000,
+                            help='Faculty to create, HODs included (default: 2000)')
+        parser.add_argument(
+            '--departments', type=int, default=len(Department.values), choices=range(1, len(Department.values) + 1),
+            help=f'Number of departments to populate, in Department order (default: {len(Department.values)})'
+        )
+        parser.add_argument('--semesters', type=int, default=8, choices=range(1, 9),
+                            help='Semesters of subjects and grades (default: 8)')
+        parser.add_argument('--subjects-per-semester', type=int, default=6,
+                            help='Department subjects per semester (default: 6)')
+        parser.add_argument('--meetings-per-group', type=int, default=4,
+                            help='Group meetings per mentorship group this term, one upcoming (default: 4)')
+        parser.add_argument('--requests-per-student', type=float, default=0.6,
+                            help='Average requests per student (default: 0.6)')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+        parser.add_argument('--batch-size', type=int, default=2000,
+                            help='Students generated and rows inserted per batch (default: 2000)')
+        parser.add_argument('--password', default='password', help='Password of every account (default: password)')
+        parser.add_argument('--as-of', type=date.fromisoformat,
+                            help='Date the dataset is laid out around, YYYY-MM-DD (default: today)')
+        parser.add_argument('--flush', action='store_true',
+                            help='Delete ALL data in the database first (manage.py flush)')
+
+    def handle(self, *args, **options):
+        for name in ('students', 'faculty', 'subjects_per_semester', 'batch_size'):
+            if options[name] < 1:
+                raise CommandError(f"--{name.replace('_', '-')} must be at least 1")
+        if options['meetings_per_group'] < 0 or options['requests_per_student'] < 0:
+            raise CommandError('--meetings-per-group and --requests-per-student cannot be negative')
+
+        if options['flush']:
+            call_command('flush', interactive=False, verbosity=0)
+        elif User.objects.exists():
+            raise CommandError('The database already has users; run with --flush to replace ALL data')
+
+        try:
+            generator = DatasetGenerator(
+                students=options['students'],
+                faculty=options['faculty'],
+                departments=options['departments'],
+                semesters=options['semesters'],
+                subjects_per_semester=options['subjects_per_semester'],
+                meetings_per_group=options['meetings_per_group'],
+                requests_per_student=options['requests_per_student'],
+                seed=options['seed'],
+                batch_size=options['batch_size'],
+                password=options['password'],
+                as_of=options['as_of'],
+                log=self.stdout.write if options['verbosity'] > 1 else None
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        started = time.monotonic()
+        counts = generator.generate()
+        for model, count in counts.items():
+            self.stdout.write(f'  {model}: {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {sum(counts.values())} row(s) in {time.monotonic() - started:.1f}s '
+            f"(seed {options['seed']}, as of {generator.as_of}); every account's password is "
+            f"'{options['password']}'"
+        ))
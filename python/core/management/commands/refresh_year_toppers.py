@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.grades import TOPPER_YEARS, TOPPERS_PER_YEAR, refresh_year_toppers
+from core.models import Department
+
+
+class Command(BaseCommand):
+    help = 'Recompute YearTopper for every department (or the given ones) in one ranking pass'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--department', action='append', dest='departments', choices=Department.values,
+            help='Department to refresh; repeat for several (default: all)'
+        )
+        parser.add_argument(
+            '--year', action='append', dest='years', type=int, choices=TOPPER_YEARS,
+            help='Year of study to refresh; repeat for several (default: 1-4)'
+        )
+        parser.add_argument(
+            '--top', type=int, default=TOPPERS_PER_YEAR,
+            help=f'Ranks kept per department/year (default: {TOPPERS_PER_YEAR})'
+        )
+
+    def handle(self, *args, **options):
+        if options['top'] < 1:
+            raise CommandError('--top must be at least 1')
+
+        count = refresh_year_toppers(options['departments'], options['years'], options['top'])
+        scope = ', '.join(options['departments']) if options['departments'] else 'all departments'
+        self.stdout.write(self.style.SUCCESS(f'Refreshed year toppers for {scope}: {count} row(s)'))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.grades import sync_current_cgpa
+from core.mentorship import sync_current_mentors
+from core.models import Department, Student
+
+
+class Command(BaseCommand):
+    help = 'Recompute Student.currentCgpa and Student.currentMentor from semesters and active mentorships'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--department', action='append', dest='departments', choices=Department.values,
+            help='Department to repair; repeat for several (default: all)'
+        )
+
+    def handle(self, *args, **options):
+        students = Student.objects.all()
+        if options['departments']:
+            students = students.filter(branch__in=options['departments'])
+
+        with transaction.atomic():
+            cgpa_count = sync_current_cgpa(students)
+            mentor_count = sync_current_mentors(students)
+
+        scope = ', '.join(options['departments']) if options['departments'] else 'all departments'
+        self.stdout.write(self.style.SUCCESS(
+            f'Repaired student summaries for {scope}: {cgpa_count} CGPA row(s), {mentor_count} mentor row(s)'
+        ))
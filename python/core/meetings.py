@@ -0,0 +1,160 @@
+"""
+Group meeting scheduling helpers shared by the HOD and faculty scheduling views.
+"""
+from datetime import datetime, timedelta
+
+from django.db import transaction
+
+from .models import GroupMeeting, GroupMeetingStudent
+
+
+# Upper bound on meetings a single recurrence spec may expand to
+MAX_RECURRING_MEETINGS = 100
+
+WEEKDAYS = {
+    'MON': 0, 'MONDAY': 0,
+    'TUE': 1, 'TUESDAY': 1,
+    'WED': 2, 'WEDNESDAY': 2,
+    'THU': 3, 'THURSDAY': 3,
+    'FRI': 4, 'FRIDAY': 4,
+    'SAT': 5, 'SATURDAY': 5,
+    'SUN': 6, 'SUNDAY': 6,
+}
+
+
+def parse_meeting_entries(meetings_data):
+    """
+    Parse [{date: "YYYY-MM-DD", time: "HH:MM", description: "optional"}, ...]
+    Entries with a missing or malformed date/time are skipped.
+    """
+    parsed_meetings = []
+    for meeting_data in meetings_data or []:
+        meeting_date = meeting_data.get('date')
+        meeting_time = meeting_data.get('time')
+        description = meeting_data.get('description', '')
+
+        if not meeting_date or not meeting_time:
+            continue
+
+        try:
+            parsed_meetings.append({
+                'date': datetime.strptime(meeting_date, '%Y-%m-%d').date(),
+                'time': datetime.strptime(meeting_time, '%H:%M').time(),
+                'description': description
+            })
+        except ValueError:
+            continue
+    return parsed_meetings
+
+
+def expand_recurring_schedule(spec):
+    """
+    Expand a recurrence spec into meeting entries, e.g. every other Tuesday 10:00 for 12 weeks:
+        {"startDate": "2026-01-05", "weekday": "TUE", "time": "10:00",
+         "intervalWeeks": 2, "weeks": 12, "description": "Fortnightly review"}
+    The first meeting falls on the first `weekday` on or after startDate (weekday defaults to
+    startDate's own). The schedule ends after `weeks` weeks, on `endDate`, or after
+    `occurrences` meetings, whichever comes first; one of the three is required.
+    Raises ValueError with a user-facing message for an invalid spec.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError('recurrence must be an object')
+
+    try:
+        start_date = datetime.strptime(spec.get('startDate') or '', '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError('recurrence.startDate must be YYYY-MM-DD')
+
+    try:
+        meeting_time = datetime.strptime(spec.get('time') or '', '%H:%M').time()
+    except ValueError:
+        raise ValueError('recurrence.time must be HH:MM')
+
+    weekday = spec.get('weekday')
+    if weekday is None:
+        weekday = start_date.weekday()
+    elif isinstance(weekday, str):
+        if weekday.upper() not in WEEKDAYS:
+            raise ValueError(f'Invalid recurrence.weekday. Valid values: {sorted(set(WEEKDAYS))}')
+        weekday = WEEKDAYS[weekday.upper()]
+    elif not isinstance(weekday, int) or not 0 <= weekday <= 6:
+        raise ValueError('recurrence.weekday must be a day name or 0 (Monday) - 6 (Sunday)')
+
+    try:
+        interval_weeks = int(spec.get('intervalWeeks') or 1)
+    except (TypeError, ValueError):
+        raise ValueError('recurrence.intervalWeeks must be a number')
+    if interval_weeks < 1:
+        raise ValueError('recurrence.intervalWeeks must be at least 1')
+
+    end_date = None
+    if spec.get('endDate'):
+        try:
+            end_date = datetime.strptime(spec['endDate'], '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError('recurrence.endDate must be YYYY-MM-DD')
+    if spec.get('weeks'):
+        try:
+            weeks = int(spec['weeks'])
+        except (TypeError, ValueError):
+            raise ValueError('recurrence.weeks must be a number')
+        weeks_end = start_date + timedelta(weeks=weeks) - timedelta(days=1)
+        end_date = min(end_date, weeks_end) if end_date else weeks_end
+    try:
+        occurrences = int(spec['occurrences']) if spec.get('occurrences') else None
+    except (TypeError, ValueError):
+        raise ValueError('recurrence.occurrences must be a number')
+
+    if end_date is None and occurrences is None:
+        raise ValueError('recurrence needs one of weeks, endDate or occurrences')
+
+    limit = min(occurrences or MAX_RECURRING_MEETINGS, MAX_RECURRING_MEETINGS)
+    description = spec.get('description', '')
+
+    meetings = []
+    current = start_date + timedelta(days=(weekday - start_date.weekday()) % 7)
+    while len(meetings) < limit and (end_date is None or current <= end_date):
+        meetings.append({
+            'date': current,
+            'time': meeting_time,
+            'description': description
+        })
+        current += timedelta(weeks=interval_weeks)
+    return meetings
+
+
+def create_group_meetings(faculty, year, semester, student_ids, meetings):
+    """
+    Create one GroupMeeting per entry in `meetings` (dicts with date, time, description, status)
+    and a GroupMeetingStudent row per student per meeting, using two bulk inserts in one transaction.
+    Returns the created GroupMeeting objects.
+    """
+    group_meetings = [
+        GroupMeeting(
+            faculty=faculty,
+            department=faculty.department,
+            year=year,
+            semester=semester,
+            date=meeting['date'],
+            time=meeting['time'],
+            description=meeting['description'],
+            status=meeting['status']
+        )
+        for meeting in meetings
+    ]
+    student_rows = [
+        GroupMeetingStudent(
+            group_meeting=group_meeting,
+            student_id=student_id,
+            review='',
+            attended=True
+        )
+        for group_meeting in group_meetings
+        for student_id in student_ids
+    ]
+
+    with transaction.atomic():
+        GroupMeeting.objects.bulk_create(group_meetings)
+        GroupMeetingStudent.objects.bulk_create(student_rows, batch_size=1000)
+
+    return group_meetings
@@ -0,0 +1,491 @@
+"""
+Set-based mentorship writes shared by the HOD mentorship views.
+Each helper runs a fixed number of queries regardless of how many students are involved,
+and keeps Student.currentMentor in step with the active mentorships it writes.
+"""
+import heapq
+import math
+
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.utils import timezone
+
+from .cache import invalidate_dashboard_stats
+from .models import Student, Faculty, Mentorship, StudentStatus, GroupMeeting, GroupMeetingStudent, MeetingStatus
+
+
+def sync_current_mentors(students):
+    """
+    Reset Student.currentMentor from the active mentorship (latest start when several) in one
+    UPDATE. `students` is a queryset or an iterable of student ids.
+    Returns the number of students updated.
+    """
+    if not isinstance(students, QuerySet):
+        students = Student.objects.filter(id__in=list(students))
+    active_mentor = Mentorship.objects.filter(
+        student=OuterRef('pk'),
+        is_active=True
+    ).order_by('-start_date').values('faculty_id')[:1]
+    return students.update(currentMentor=Subquery(active_mentor))
+
+
+def bulk_assign_mentor(faculty, roll_numbers, year, semester, comments=None):
+    """
+    Assign `faculty` as mentor for `year`/`semester` to every student in `roll_numbers`.
+    Per student this behaves like assigning them one at a time:
+      - an inactive mentorship with the same faculty/year/semester is reactivated
+      - an active one with the same faculty/year/semester is reported as failed
+      - otherwise the student's current active mentorship is ended and a new one created
+    Returns {'successful': [...], 'failed': [...]}, each in the order of `roll_numbers`.
+    """
+    year = int(year)
+    semester = int(semester)
+    comments = comments if isinstance(comments, list) else []
+    now = timezone.now()
+
+    results = {
+        'successful': [],
+        'failed': []
+    }
+
+    # Parse roll numbers up front, keeping the caller's order
+    parsed = []
+    for roll_number in roll_numbers:
+        try:
+            parsed.append((roll_number, int(roll_number), None))
+        except (TypeError, ValueError) as e:
+            parsed.append((roll_number, None, str(e)))
+
+    wanted = {roll for _, roll, _ in parsed if roll is not None}
+    students = {
+        s.rollNumber: s
+        for s in Student.objects.filter(rollNumber__in=wanted).only('id', 'name', 'rollNumber', 'branch')
+    }
+
+    # One query for both the same-slot mentorships and the currently active ones
+    same_slot = {}
+    active = {}
+    student_ids = [s.id for s in students.values()]
+    if student_ids:
+        mentorships = Mentorship.objects.filter(
+            student_id__in=student_ids
+        ).filter(
+            Q(faculty=faculty, year=year, semester=semester) | Q(is_active=True)
+        ).select_related('faculty').order_by('id')
+        for m in mentorships:
+            if m.faculty_id == faculty.id and m.year == year and m.semester == semester:
+                same_slot[m.student_id] = m
+            if m.is_active:
+                active.setdefault(m.student_id, m)
+
+    to_update = {}
+    to_create = []
+    previous_faculty = set()
+    for roll_number, roll, parse_error in parsed:
+        if parse_error is not None:
+            results['failed'].append({
+                'rollNumber': roll_number,
+                'reason': parse_error
+            })
+            continue
+
+        student = students.get(roll)
+        if student is None:
+            results['failed'].append({
+                'rollNumber': roll_number,
+                'reason': 'Student not found'
+            })
+            continue
+
+        # Check if student is in the same department as faculty
+        if student.branch != faculty.department:
+            results['failed'].append({
+                'rollNumber': roll_number,
+                'reason': f'Student branch ({student.branch}) does not match faculty department ({faculty.department})'
+            })
+            continue
+
+        student_info = {
+            'name': student.name,
+            'rollNumber': student.rollNumber,
+            'branch': student.branch
+        }
+
+        existing_mentorship = same_slot.get(student.id)
+        if existing_mentorship:
+            # Reactivate if inactive
+            if not existing_mentorship.is_active:
+                existing_mentorship.is_active = True
+                existing_mentorship.end_date = None
+                existing_mentorship.updated_at = now
+                to_update[existing_mentorship.id] = existing_mentorship
+                results['successful'].append({
+                    'student': student_info,
+                    'mentorshipId': str(existing_mentorship.id),
+                    'reactivated': True
+                })
+            else:
+                results['failed'].append({
+                    'rollNumber': roll_number,
+                    'reason': 'Active mentorship already exists for this faculty, student, year, and semester'
+                })
+            continue
+
+        # Deactivate the student's active mentorship (previous mentor becomes past mentor)
+        previous_mentor_info = None
+        active_mentorship = active.pop(student.id, None)
+        if active_mentorship:
+            active_mentorship.is_active = False
+            active_mentorship.end_date = now
+            active_mentorship.updated_at = now
+            to_update[active_mentorship.id] = active_mentorship
+            previous_faculty.add(active_mentorship.faculty)
+            previous_mentor_info = {
+                'id': str(active_mentorship.faculty.id),
+                'name': active_mentorship.faculty.name,
+                'employeeId': active_mentorship.faculty.employeeId,
+                'mentorshipId': str(active_mentorship.id)
+            }
+
+        mentorship = Mentorship(
+            faculty=faculty,
+            student=student,
+            department=faculty.department,
+            year=year,
+            semester=semester,
+            start_date=now,
+            is_active=True,
+            comments=list(comments)
+        )
+        to_create.append(mentorship)
+        # A repeated roll number now sees this mentorship as the active same-slot one
+        same_slot[student.id] = mentorship
+        active[student.id] = mentorship
+
+        results['successful'].append({
+            'student': student_info,
+            'mentorshipId': str(mentorship.id),
+            'previousMentor': previous_mentor_info,
+            'reactivated': False
+        })
+
+    with transaction.atomic():
+        if to_update:
+            Mentorship.objects.bulk_update(
+                list(to_update.values()), ['is_active', 'end_date', 'updated_at']
+            )
+        if to_create:
+            Mentorship.objects.bulk_create(to_create)
+        if to_update or to_create:
+            sync_current_mentors({m.student_id for m in list(to_update.values()) + to_create})
+
+    if to_update or to_create:
+        invalidate_dashboard_stats(
+            student_ids={m.student_id for m in list(to_update.values()) + to_create},
+            faculty_ids={faculty.id} | {f.id for f in previous_faculty},
+            departments={faculty.department} | {f.department for f in previous_faculty}
+        )
+
+    return results
+
+
+def plan_mentor_allocation(student_ids, faculty_loads, cap, previous_mentors=None):
+    """
+    Spread `student_ids` over the faculty in `faculty_loads` ({faculty_id: active mentee count}).
+    Students always go to the least-loaded faculty with room under `cap`, which keeps the
+    largest group as small as possible. With `previous_mentors` ({student_id: faculty_id}),
+    a student goes back to their past mentor first, as long as that mentor stays at or
+    below the balanced target load.
+    Returns (plan, unplaced): plan maps student_id -> faculty_id, unplaced lists students
+    that did not fit under the cap.
+    """
+    loads = dict(faculty_loads)
+    plan = {}
+    if not loads:
+        return plan, list(student_ids)
+
+    # Balanced target: the level every mentor would sit at if the new students were spread evenly
+    target = math.ceil((sum(loads.values()) + len(student_ids)) / len(loads))
+    target = min(target, cap)
+
+    remaining = []
+    for student_id in student_ids:
+        faculty_id = (previous_mentors or {}).get(student_id)
+        if faculty_id in loads and loads[faculty_id] < target:
+            plan[student_id] = faculty_id
+            loads[faculty_id] += 1
+        else:
+            remaining.append(student_id)
+
+    # Min-heap of (load, insertion order, faculty_id) over mentors that still have room
+    heap = [
+        (load, order, faculty_id)
+        for order, (faculty_id, load) in enumerate(loads.items())
+        if load < cap
+    ]
+    heapq.heapify(heap)
+
+    unplaced = []
+    for student_id in remaining:
+        if not heap:
+            unplaced.append(student_id)
+            continue
+        load, order, faculty_id = heapq.heappop(heap)
+        plan[student_id] = faculty_id
+        loads[faculty_id] = load + 1
+        if load + 1 < cap:
+            heapq.heappush(heap, (load + 1, order, faculty_id))
+
+    return plan, unplaced
+
+
+def allocate_department_mentors(department, year, semester, cap, keep_previous_mentor=True, dry_run=False):
+    """
+    Assign every pursuing student of `department`/`year` without an active mentor to the
+    department's active faculty, balanced by current active mentee counts.
+    Returns a summary dict with the per-faculty plan and any students left unplaced.
+    """
+    year = int(year)
+    semester = int(semester)
+    now = timezone.now()
+
+    with transaction.atomic():
+        faculty_list = list(
+            Faculty.objects.filter(department=department, isActive=True).annotate(
+                active_count=Count('mentorships', filter=Q(mentorships__is_active=True))
+            ).order_by('name')
+        )
+        faculty_by_id = {f.id: f for f in faculty_list}
+
+        students = list(
+            Student.objects.filter(
+                branch=department,
+                year=year,
+                status=StudentStatus.PURSUING,
+                currentMentor__isnull=True
+            ).only('id', 'name', 'rollNumber').order_by('rollNumber')
+        )
+        students_by_id = {s.id: s for s in students}
+
+        previous_mentors = {}
+        if keep_previous_mentor and students:
+            # Latest past mentorship per student, newest first
+            history = Mentorship.objects.filter(
+                student_id__in=students_by_id.keys(),
+                is_active=False
+            ).order_by('student_id', '-start_date').values_list('student_id', 'faculty_id')
+            for student_id, faculty_id in history:
+                previous_mentors.setdefault(student_id, faculty_id)
+
+        plan, unplaced = plan_mentor_allocation(
+            [s.id for s in students],
+            {f.id: f.active_count for f in faculty_list},
+            cap,
+            previous_mentors
+        )
+
+        if plan and not dry_run:
+            # Past mentorships in the same faculty/year/semester slot are reactivated, not duplicated
+            existing = {
+                (m.faculty_id, m.student_id): m
+                for m in Mentorship.objects.filter(
+                    student_id__in=plan.keys(),
+                    year=year,
+                    semester=semester
+                )
+            }
+            to_update = []
+            to_create = []
+            for student_id, faculty_id in plan.items():
+                mentorship = existing.get((faculty_id, student_id))
+                if mentorship:
+                    mentorship.is_active = True
+                    mentorship.end_date = None
+                    mentorship.updated_at = now
+                    to_update.append(mentorship)
+                else:
+                    to_create.append(Mentorship(
+                        faculty_id=faculty_id,
+                        student_id=student_id,
+                        department=department,
+                        year=year,
+                        semester=semester,
+                        start_date=now,
+                        is_active=True
+                    ))
+            if to_update:
+                Mentorship.objects.bulk_update(to_update, ['is_active', 'end_date', 'updated_at'])
+            if to_create:
+                Mentorship.objects.bulk_create(to_create)
+            if plan:
+                sync_current_mentors(plan.keys())
+
+    if plan and not dry_run:
+        invalidate_dashboard_stats(
+            student_ids=plan.keys(),
+            faculty_ids=set(plan.values()),
+            departments=[department]
+        )
+
+    assigned = {f.id: [] for f in faculty_list}
+    for student_id, faculty_id in plan.items():
+        assigned[faculty_id].append(students_by_id[student_id])
+
+    return {
+        'department': department,
+        'year': year,
+        'semester': semester,
+        'maxPerMentor': cap,
+        'dryRun': dry_run,
+        'totalUnassigned': len(students),
+        'assignedCount': len(plan),
+        'continuityCount': sum(1 for sid, fid in plan.items() if previous_mentors.get(sid) == fid),
+        'faculty': [
+            {
+                'id': str(f.id),
+                'name': f.name,
+                'employeeId': f.employeeId,
+                'previousLoad': f.active_count,
+                'assignedCount': len(assigned[f.id]),
+                'newLoad': f.active_count + len(assigned[f.id]),
+                'students': [
+                    {'id': str(s.id), 'name': s.name, 'rollNumber': s.rollNumber}
+                    for s in assigned[f.id]
+                ]
+            }
+            for f in faculty_list
+        ],
+        'unplacedStudents': [
+            {
+                'id': str(students_by_id[sid].id),
+                'name': students_by_id[sid].name,
+                'rollNumber': students_by_id[sid].rollNumber
+            }
+            for sid in unplaced
+        ]
+    }
+
+
+# How future GroupMeetings follow a transferred group
+TRANSFER_MEETING_MODES = ('none', 'move', 'copy')
+
+
+def transfer_mentorship_group(from_faculty, to_faculty, year, semester, meeting_mode='none'):
+    """
+    Move every active mentorship of `from_faculty` in `year`/`semester` to `to_faculty` atomically:
+    one UPDATE ends the old mentorships and one bulk insert creates the new ones (past
+    mentorships of `to_faculty` in the same slot are reactivated instead).
+    Future, not yet completed GroupMeetings of the group are left alone ('none'),
+    reassigned to `to_faculty` ('move') or duplicated for `to_faculty` with the transferred
+    students ('copy').
+    Returns (transferred, meeting_count), or (None, 0) if the group has no active mentorships.
+    """
+    year = int(year)
+    semester = int(semester)
+    now = timezone.now()
+
+    with transaction.atomic():
+        active_mentorships = list(
+            Mentorship.objects.select_for_update(of=('self',)).filter(
+                faculty=from_faculty,
+                year=year,
+                semester=semester,
+                is_active=True
+            ).select_related('student').order_by('student__rollNumber')
+        )
+        if not active_mentorships:
+            return None, 0
+
+        student_ids = [m.student_id for m in active_mentorships]
+
+        Mentorship.objects.filter(
+            id__in=[m.id for m in active_mentorships]
+        ).update(is_active=False, end_date=now, updated_at=now)
+
+        # Students who had `to_faculty` in this slot before keep that row (unique per faculty/student/slot)
+        existing = {
+            m.student_id: m
+            for m in Mentorship.objects.filter(
+                faculty=to_faculty,
+                student_id__in=student_ids,
+                year=year,
+                semester=semester
+            )
+        }
+        to_update = []
+        to_create = []
+        transferred = []
+        for old in active_mentorships:
+            new_mentorship = existing.get(old.student_id)
+            if new_mentorship:
+                new_mentorship.is_active = True
+                new_mentorship.end_date = None
+                new_mentorship.updated_at = now
+                to_update.append(new_mentorship)
+            else:
+                new_mentorship = Mentorship(
+                    faculty=to_faculty,
+                    student_id=old.student_id,
+                    department=to_faculty.department,
+                    year=year,
+                    semester=semester,
+                    start_date=now,
+                    is_active=True,
+                    comments=[]
+                )
+                to_create.append(new_mentorship)
+            transferred.append({
+                'student': {
+                    'name': old.student.name,
+                    'rollNumber': old.student.rollNumber
+                },
+                'oldMentorshipId': str(old.id),
+                'newMentorshipId': str(new_mentorship.id)
+            })
+
+        if to_update:
+            Mentorship.objects.bulk_update(to_update, ['is_active', 'end_date', 'updated_at'])
+        if to_create:
+            Mentorship.objects.bulk_create(to_create)
+        sync_current_mentors(student_ids)
+
+        meeting_count = 0
+        if meeting_mode != 'none':
+            future_meetings = GroupMeeting.objects.filter(
+                faculty=from_faculty,
+                year=year,
+                semester=semester,
+                date__gte=now.date()
+            ).exclude(status=MeetingStatus.COMPLETED)
+
+            if meeting_mode == 'move':
+                meeting_count = future_meetings.update(faculty=to_faculty, updatedAt=now)
+            elif meeting_mode == 'copy':
+                copies = [
+                    GroupMeeting(
+                        faculty=to_faculty,
+                        department=to_faculty.department,
+                        year=year,
+                        semester=semester,
+                        date=meeting.date,
+                        time=meeting.time,
+                        description=meeting.description,
+                        status=meeting.status
+                    )
+                    for meeting in future_meetings
+                ]
+                GroupMeeting.objects.bulk_create(copies)
+                GroupMeetingStudent.objects.bulk_create([
+                    GroupMeetingStudent(group_meeting=meeting, student_id=student_id, review='', attended=True)
+                    for meeting in copies
+                    for student_id in student_ids
+                ], batch_size=1000)
+                meeting_count = len(copies)
+
+    invalidate_dashboard_stats(
+        student_ids=student_ids,
+        faculty_ids=[from_faculty.id, to_faculty.id],
+        departments={from_faculty.department, to_faculty.department}
+    )
+
+    return transferred, meeting_count
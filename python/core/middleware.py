@@ -2,12 +2,211 @@ from django.http import JsonResponse
 import jwt
 from django.conf import settings
 import os
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from django.core.cache import cache
+from django.db.models import F
+from .actor import ACTOR_RELATED, Actor
 from .models import User
 
 
+logger = logging.getLogger(__name__)
+
 # Get JWT secret from environment or settings
 JWT_SECRET = os.environ.get('JWT_SECRET', settings.SECRET_KEY)
 
+# Verified-token cache settings (size 0 or ttl 0 disables the cache)
+JWT_USER_CACHE_SIZE = getattr(settings, 'JWT_USER_CACHE_SIZE', 2048)
+JWT_USER_CACHE_TTL = getattr(settings, 'JWT_USER_CACHE_TTL', 60)
+
+# Stateless mode: tokens carry the user_data claims and are checked against User.tokenVersion
+JWT_STATELESS_AUTH = getattr(settings, 'JWT_STATELESS_AUTH', False)
+JWT_TOKEN_VERSION_TTL = getattr(settings, 'JWT_TOKEN_VERSION_TTL', 30)
+TOKEN_VERSION_CACHE_KEY = 'core:token-version:{}'
+
+
+class UserDataCache:
+    """
+    Bounded, thread-safe LRU cache of resolved request.user_data dicts
+    keyed by the SHA-256 digest of the token cookie.
+    Entries expire after `ttl` seconds or at the token's own `exp`, whichever is first.
+    The cache is per process - invalidation only reaches the current worker,
+    other workers pick up changes once their entry's TTL runs out. Revocations
+    (revoke_user_tokens) reach every worker sooner: a hit is only used while the
+    entry's `ver` matches the user's current token version.
+    """
+    
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # digest -> (expires_at, user_data)
+        self._by_user = {}  # user id -> set of digests
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self):
+        return self.max_size > 0 and self.ttl > 0
+    
+    @staticmethod
+    def digest(token):
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+    
+    def get(self, digest):
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            expires_at, user_data = entry
+            if expires_at <= time.monotonic():
+                self._discard(digest)
+                return None
+            self._entries.move_to_end(digest)
+            return dict(user_data)
+    
+    def set(self, digest, user_data, token_exp=None):
+        now = time.monotonic()
+        expires_at = now + self.ttl
+        if token_exp is not None:
+            # Convert the token's wall-clock expiry into the monotonic timeline
+            expires_at = min(expires_at, now + (token_exp - time.time()))
+        user_key = str(user_data['id'])
+        with self._lock:
+            if digest in self._entries:
+                self._discard(digest)
+            self._entries[digest] = (expires_at, dict(user_data))
+            self._by_user.setdefault(user_key, set()).add(digest)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+    
+    def invalidate_user(self, user_id):
+        with self._lock:
+            for digest in self._by_user.pop(str(user_id), set()):
+                self._entries.pop(digest, None)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+    
+    def _discard(self, digest):
+        # Caller must hold the lock
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return
+        user_key = str(entry[1]['id'])
+        digests = self._by_user.get(user_key)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._by_user[user_key]
+
+
+user_data_cache = UserDataCache(JWT_USER_CACHE_SIZE, JWT_USER_CACHE_TTL)
+
+
+def resolve_user_data(user):
+    """
+    Build the request.user_data dict for a user loaded with
+    select_related(*ACTOR_RELATED)
+    """
+    # Determine entity ID and type
+    entity_id = None
+    entity_type = None
+    
+    if hasattr(user, 'student') and user.student:
+        entity_id = user.student.id
+        entity_type = 'STUDENT'
+    elif hasattr(user, 'faculty') and user.faculty:
+        entity_id = user.faculty.id
+        entity_type = 'FACULTY'
+    elif hasattr(user, 'hod') and user.hod:
+        entity_id = user.hod.id
+        entity_type = 'HOD'
+    elif hasattr(user, 'admin') and user.admin:
+        entity_id = user.admin.id
+        entity_type = 'ADMIN'
+    
+    return {
+        'id': user.id,
+        'email': user.email,
+        'role': user.role,
+        'entityId': entity_id,
+        'entityType': entity_type,
+        'profilePicture': user.profilePicture,
+        'accountStatus': user.accountStatus
+    }
+
+
+def build_token_claims(user):
+    """
+    Claims embedded in stateless tokens: everything in user_data plus the
+    user's current token version (`ver`)
+    """
+    user_data = resolve_user_data(user)
+    user_data['id'] = str(user_data['id'])
+    if user_data['entityId'] is not None:
+        user_data['entityId'] = str(user_data['entityId'])
+    user_data['ver'] = user.tokenVersion
+    return user_data
+
+
+def user_data_from_claims(claims):
+    """Rebuild request.user_data from a verified stateless token"""
+    entity_id = claims.get('entityId')
+    return {
+        'id': uuid.UUID(claims['id']),
+        'email': claims.get('email'),
+        'role': claims.get('role'),
+        'entityId': uuid.UUID(entity_id) if entity_id else None,
+        'entityType': claims.get('entityType'),
+        'profilePicture': claims.get('profilePicture'),
+        'accountStatus': claims.get('accountStatus'),
+        'ver': claims.get('ver')
+    }
+
+
+def get_token_version(user_id):
+    """
+    Current token version for a user, read through the default cache.
+    Returns None if the user no longer exists.
+    """
+    key = TOKEN_VERSION_CACHE_KEY.format(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = User.objects.filter(id=user_id).values_list('tokenVersion', flat=True).first()
+        if version is not None:
+            cache.set(key, version, JWT_TOKEN_VERSION_TTL)
+    return version
+
+
+def revoke_user_tokens(*user_ids):
+    """
+    Invalidate every token issued to the given user(s) by bumping their token version.
+    Stateless tokens carrying the old version are rejected by JWTAuthMiddleware.
+    """
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+    if not user_ids:
+        return
+    User.objects.filter(id__in=user_ids).update(tokenVersion=F('tokenVersion') + 1)
+    cache.delete_many([TOKEN_VERSION_CACHE_KEY.format(user_id) for user_id in user_ids])
+    invalidate_user_data(*user_ids)
+
+
+def invalidate_user_data(*user_ids):
+    """
+    Drop cached user_data for the given user id(s).
+    Call after any write that changes what the middleware attaches to the request
+    (password, email, role, HOD assignment, accountStatus).
+    """
+    for user_id in user_ids:
+        if user_id is not None:
+            user_data_cache.invalidate_user(user_id)
+
 
 class JWTAuthMiddleware:
     """
@@ -20,85 +219,83 @@ class JWTAuthMiddleware:
         self.get_response = get_response
     
     def __call__(self, request):
-        print(f"[JWT Middleware START] Path: {request.path}")
-        print(f"[JWT Middleware] All cookies: {request.COOKIES}")
+        # Resolved once per request; isEnabledFor is a cached dict lookup
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         # Skip JWT validation for public endpoints
         public_paths = ['/api/auth/login', '/api/auth/register', '/admin/']
         
         if any(request.path.startswith(path) for path in public_paths):
-            print(f"[JWT Middleware] Skipping public path: {request.path}")
+            if debug:
+                logger.debug("Skipping public path %s", request.path)
             return self.get_response(request)
         
         # Get token from cookie
         token = request.COOKIES.get('token')
         
-        print(f"[JWT Middleware] Path: {request.path}")
-        print(f"[JWT Middleware] Cookie token exists: {token is not None}")
+        cache_digest = None
+        if token and user_data_cache.enabled:
+            cache_digest = user_data_cache.digest(token)
+            cached_user_data = user_data_cache.get(cache_digest)
+            # Tokens revoked since the entry was cached fall through to full verification
+            if cached_user_data is not None and (
+                get_token_version(cached_user_data['id']) == cached_user_data.get('ver')
+            ):
+                request.user_data = cached_user_data
+                request.actor = Actor(cached_user_data['id'])
+                if debug:
+                    logger.debug("Cached user %s (%s) for %s", cached_user_data['id'], cached_user_data['role'], request.path)
+                return self.get_response(request)
         
         if token:
-            print(f"[JWT Middleware] Token value (first 20 chars): {token[:20]}...")
             try:
                 # Verify and decode token to get user ID
                 decoded = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
                 user_id = decoded.get('id')
                 
-                print(f"[JWT Middleware] Decoded user_id: {user_id}")
-                
-                if user_id:
+                if user_id and JWT_STATELESS_AUTH and 'ver' in decoded:
+                    # Stateless token - trust the signed claims once the version still matches
+                    if get_token_version(user_id) == decoded['ver']:
+                        request.user_data = user_data_from_claims(decoded)
+                        request.actor = Actor(request.user_data['id'])
+                        if cache_digest is not None:
+                            user_data_cache.set(cache_digest, request.user_data, decoded.get('exp'))
+                    else:
+                        logger.info("Revoked token for user id %s on %s", user_id, request.path)
+                elif user_id:
                     # Find user and include related entities
                     try:
-                        user = User.objects.select_related(
-                            'student', 'faculty', 'hod', 'admin'
-                        ).get(id=user_id)
-                        
-                        print(f"[JWT Middleware] Found user: {user.email}")
+                        user = User.objects.select_related(*ACTOR_RELATED).get(id=user_id)
                         
-                        # Determine entity ID and type
-                        entity_id = None
-                        entity_type = None
+                        # Attach user information to request (available for all views);
+                        # the actor reuses the loaded user and profiles
+                        request.user_data = resolve_user_data(user)
+                        request.actor = Actor(user.id, user)
                         
-                        if hasattr(user, 'student') and user.student:
-                            entity_id = user.student.id
-                            entity_type = 'STUDENT'
-                        elif hasattr(user, 'faculty') and user.faculty:
-                            entity_id = user.faculty.id
-                            entity_type = 'FACULTY'
-                        elif hasattr(user, 'hod') and user.hod:
-                            entity_id = user.hod.id
-                            entity_type = 'HOD'
-                        elif hasattr(user, 'admin') and user.admin:
-                            entity_id = user.admin.id
-                            entity_type = 'ADMIN'
+                        if cache_digest is not None:
+                            user_data_cache.set(cache_digest, request.user_data, decoded.get('exp'))
+                            # Seeds the version check of the next cache hits
+                            cache.set(TOKEN_VERSION_CACHE_KEY.format(user.id), user.tokenVersion, JWT_TOKEN_VERSION_TTL)
                         
-                        # Attach user information to request (available for all views)
-                        request.user_data = {
-                            'id': user.id,
-                            'email': user.email,
-                            'role': user.role,
-                            'entityId': entity_id,
-                            'entityType': entity_type,
-                            'profilePicture': user.profilePicture,
-                            'accountStatus': user.accountStatus
-                        }
-                        
-                        print(f"[JWT Middleware] Set user_data for: {user.email}, role: {user.role}")
+                        if debug:
+                            logger.debug("Authenticated user %s (%s) for %s", user.id, user.role, request.path)
                         
                     except User.DoesNotExist:
-                        print(f"[JWT Middleware] User not found for id: {user_id}")
+                        logger.info("Token for unknown user id %s on %s", user_id, request.path)
                         pass  # User not found, continue without user_data
                     
             except jwt.ExpiredSignatureError:
-                print(f"[JWT Middleware] Token expired")
+                if debug:
+                    logger.debug("Expired token on %s", request.path)
                 pass  # Token expired, continue without user_data
             except jwt.InvalidTokenError as e:
-                print(f"[JWT Middleware] Invalid token: {str(e)}")
+                logger.info("Invalid token on %s: %s", request.path, e)
                 pass  # Invalid token, continue without user_data
             except Exception as e:
-                print(f"[JWT Middleware] Error: {str(e)}")
+                logger.exception("JWT middleware error on %s: %s", request.path, e)
                 pass  # Any error, continue without user_data
-        else:
-            print(f"[JWT Middleware] No token found in cookies")
+        elif debug:
+            logger.debug("No token cookie on %s", request.path)
         
         # Continue to view - views can check if request.user_data exists
         response = self.get_response(request)
@@ -202,7 +399,7 @@ class AuthMiddleware:
                 status=401
             )
         except Exception as e:
-            print(f"Auth middleware error: {str(e)}")
+            logger.exception("Auth middleware error: %s", e)
             return JsonResponse(
                 {'message': 'Unauthorized'},
                 status=401
@@ -248,20 +445,15 @@ def require_auth(view_func):
     Usage: @require_auth
     """
     def wrapped_view(request, *args, **kwargs):
-        print(f"[require_auth] Checking auth for {request.path}")
-        print(f"[require_auth] Has user_data attr: {hasattr(request, 'user_data')}")
-        if hasattr(request, 'user_data'):
-            print(f"[require_auth] user_data value: {request.user_data}")
-        
         # Check if user data was set by middleware
         if not hasattr(request, 'user_data') or not request.user_data:
-            print(f"[require_auth] No user_data, returning 401")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unauthenticated request to %s", request.path)
             return JsonResponse(
                 {'message': 'Login is required'},
                 status=401
             )
         
-        print(f"[require_auth] Auth passed, calling view")
         # User is authenticated, proceed with the view
         return view_func(request, *args, **kwargs)
     
@@ -294,6 +486,8 @@ def require_admin(view_func):
 def require_role(*roles):
     """
     Decorator to require specific role(s) for a view
+    Authorises from request.user_data only - in stateless mode that comes
+    straight from the verified token, so no query is made here
     Usage: @require_role('HOD') or @require_role('FACULTY', 'HOD', 'ADMIN') or @require_role(['HOD', 'ADMIN'])
     """
     def decorator(view_func):
@@ -320,8 +514,11 @@ def require_role(*roles):
                     status=403
                 )
             
-            # Attach user_id for convenience in views
+            # Attach user_id and role for convenience in views
             request.user_id = request.user_data.get('id')
+            request.user_role = user_role
+            if not hasattr(request, 'actor'):
+                request.actor = Actor(request.user_id)
             
             return view_func(request, *args, **kwargs)
         
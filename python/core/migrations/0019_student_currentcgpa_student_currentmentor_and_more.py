@@ -0,0 +1,51 @@
+# Generated by Django 6.0 on 2026-10-17 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_student_summaries(apps, schema_editor):
+    Student = apps.get_model('core', 'Student')
+    Semester = apps.get_model('core', 'Semester')
+    Mentorship = apps.get_model('core', 'Mentorship')
+
+    # CGPA as of the student's latest semester
+    latest_cgpa = Semester.objects.filter(student=OuterRef('pk')).order_by('-semester').values('cgpa')[:1]
+    active_mentor = Mentorship.objects.filter(
+        student=OuterRef('pk'), is_active=True
+    ).order_by('-start_date').values('faculty_id')[:1]
+    Student.objects.update(
+        currentCgpa=Coalesce(Subquery(latest_cgpa), Value(0.0), output_field=models.FloatField()),
+        currentMentor=Subquery(active_mentor)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_user_tokenversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='currentCgpa',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='currentMentor',
+            field=models.ForeignKey(blank=True, db_column='currentMentorId', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='current_mentees', to='core.faculty'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['branch', 'year', 'currentCgpa'], name='students_branch_58b80b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['branch', 'currentMentor'], name='students_branch_7147d9_idx'),
+        ),
+        migrations.RunPython(fill_student_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-17 09:00
+
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS students_search_trgm_idx ON students USING gin ("searchText" gin_trgm_ops)'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS students_search_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_student_currentcgpa_student_currentmentor_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='student',
+            name='searchText',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower(django.db.models.functions.text.Concat('name', models.Value(' '), django.db.models.functions.comparison.Cast('rollNumber', models.CharField()), models.Value(' '), django.db.models.functions.comparison.Cast('registrationNumber', models.CharField()), models.Value(' '), 'collegeEmail', output_field=models.TextField())), output_field=models.TextField()),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.db.models.functions import Cast, Concat, Lower
 from django.contrib.postgres.fields import ArrayField
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
@@ -133,6 +134,8 @@ class User(models.Model):
     role = models.CharField(max_length=20, choices=UserRole.choices)
     profilePicture = models.URLField(null=True, blank=True)
     accountStatus = models.CharField(max_length=20, choices=AccountStatus.choices, default=AccountStatus.ACTIVE)
+    # Bumped to revoke every stateless token issued to this user
+    tokenVersion = models.IntegerField(default=0)
     createdAt = models.DateTimeField(auto_now_add=True)
     updatedAt = models.DateTimeField(auto_now=True)
 
@@ -244,13 +247,27 @@ class Student(models.Model):
     jeeMains = models.IntegerField()
     jeeAdvanced = models.IntegerField(null=True, blank=True)
     status = models.CharField(max_length=20, choices=StudentStatus.choices, default=StudentStatus.PURSUING)
+    # Summary columns maintained by core.grades / core.mentorship (repair: manage.py repair_student_summaries)
+    currentCgpa = models.FloatField(default=0.0)
+    currentMentor = models.ForeignKey('Faculty', on_delete=models.SET_NULL, null=True, blank=True, related_name='current_mentees', db_column='currentMentorId')
+    # Lower-cased "name rollNumber registrationNumber collegeEmail", trigram-indexed on Postgres (see core.search)
+    searchText = models.GeneratedField(
+        expression=Lower(Concat(
+            'name', models.Value(' '),
+            Cast('rollNumber', models.CharField()), models.Value(' '),
+            Cast('registrationNumber', models.CharField()), models.Value(' '),
+            'collegeEmail',
+            output_field=models.TextField()
+        )),
+        output_field=models.TextField(),
+        db_persist=True
+    )
     createdAt = models.DateTimeField(auto_now_add=True)
     updatedAt = models.DateTimeField(auto_now=True)
     
     @property
     def current_mentor(self):
-        mentorship = self.mentorships.filter(is_active=True).first()
-        return mentorship.faculty if mentorship else None
+        return self.currentMentor
     
     @property
     def past_mentors(self):
@@ -258,6 +275,11 @@ class Student(models.Model):
     
     class Meta:
         db_table = 'students'
+        indexes = [
+            models.Index(fields=['branch', 'year', 'currentCgpa']),
+            models.Index(fields=['branch', 'currentMentor']),
+            models.Index(fields=['currentCgpa', 'id']),
+        ]
 
 
 class Mentorship(models.Model):
@@ -438,41 +460,19 @@ class Semester(models.Model):
     
     def calculate_sgpa(self):
         """Calculate SGPA for this semester: Σ(grade_point * credits) / Σ(total_credits)
-        Note: SGPA uses total credits, not just passed credits (even F/X grades count)"""
-        subject_grades = self.subject_grades.all()
-        total_points = 0
-        total_credits = 0
-        
-        for sg in subject_grades:
-            grade_point = GRADE_POINTS.get(sg.grade.upper(), 0)
-            credits = sg.subject.credits
-            total_points += grade_point * credits
-            total_credits += credits
-        
-        self.total_credits = total_credits
-        self.sgpa = round(total_points / total_credits, 2) if total_credits > 0 else 0.0
-        self.save()
+        Note: SGPA uses total credits, not just passed credits (even F/X grades count).
+        Also refreshes the student's CGPA; see core.grades"""
+        from .grades import recalculate_gpa
+        _, _, semesters = recalculate_gpa([self.student_id], [self.id])[self.student_id]
+        updated = semesters[self.semester]
+        self.sgpa, self.cgpa, self.total_credits = updated.sgpa, updated.cgpa, updated.total_credits
         return self.sgpa
     
     @staticmethod
     def calculate_cgpa_for_student(student):
-        """Calculate CGPA: average of all SGPAs weighted by credits"""
-        semesters = Semester.objects.filter(student=student).order_by('semester')
-        total_weighted_sgpa = 0
-        total_credits = 0
-        
-        for sem in semesters:
-            if sem.sgpa > 0 and sem.total_credits > 0:
-                total_weighted_sgpa += sem.sgpa * sem.total_credits
-                total_credits += sem.total_credits
-        
-        cgpa = round(total_weighted_sgpa / total_credits, 2) if total_credits > 0 else 0.0
-        
-        # Update CGPA for all semesters
-        for sem in semesters:
-            sem.cgpa = cgpa
-            sem.save(update_fields=['cgpa'])
-        
+        """Calculate CGPA: average of all SGPAs weighted by credits (from stored semester totals)"""
+        from .grades import recalculate_gpa
+        _, cgpa, _ = recalculate_gpa([student.id], semester_ids=[]).get(student.id, (0.0, 0.0, {}))
         return cgpa
 
 
@@ -499,13 +499,17 @@ class StudentSubject(models.Model):
             models.Index(fields=['attempt_type']),
         ]
     
-    def save(self, *args, **kwargs):
+    def apply_grade(self):
+        """Derive grade_point, is_passed and passing_year from grade (bulk writes skip save())"""
         # Auto-calculate grade point
         self.grade_point = GRADE_POINTS.get(self.grade.upper(), 0)
         # Check if passed (grade P or above = 5 or more points)
         self.is_passed = self.grade_point >= 5
         if self.is_passed and not self.passing_year:
             self.passing_year = self.exam_year
+    
+    def save(self, *args, **kwargs):
+        self.apply_grade()
         super().save(*args, **kwargs)
     
     def __str__(self):
@@ -537,9 +541,13 @@ class BacklogHistory(models.Model):
             models.Index(fields=['is_cleared']),
         ]
     
-    def save(self, *args, **kwargs):
+    def apply_grade(self):
+        """Derive grade_point and is_cleared from grade (bulk writes skip save())"""
         self.grade_point = GRADE_POINTS.get(self.grade.upper(), 0)
         self.is_cleared = self.grade_point >= 5
+    
+    def save(self, *args, **kwargs):
+        self.apply_grade()
         super().save(*args, **kwargs)
     
     def __str__(self):
@@ -547,11 +555,11 @@ class BacklogHistory(models.Model):
 
 
 class YearTopper(models.Model):
-    """Store top 3 students by CGPA for each year in each department"""
+    """Store top students (3 by default) by CGPA for each year in each department"""
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     department = models.CharField(max_length=20, choices=Department.choices)
     academic_year = models.IntegerField()  # e.g., 1, 2, 3, 4 for year of study
-    rank = models.IntegerField()  # 1, 2, or 3
+    rank = models.IntegerField()  # 1, 2, 3, ...
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='topper_ranks')
     cgpa = models.FloatField()
     updated_at = models.DateTimeField(auto_now=True)
@@ -562,35 +570,10 @@ class YearTopper(models.Model):
         ordering = ['department', 'academic_year', 'rank']
     
     @staticmethod
-    def update_toppers(department):
-        """Update top 3 students for each year in the department"""
-        from django.db.models import Max
-        
-        for year in range(1, 5):  # Years 1-4
-            # Get students in this year with their latest CGPA
-            students = Student.objects.filter(
-                branch=department,
-                year=year,
-                status=StudentStatus.PURSUING
-            ).annotate(
-                latest_cgpa=Max('semesters__cgpa')
-            ).filter(
-                latest_cgpa__isnull=False,
-                latest_cgpa__gt=0
-            ).order_by('-latest_cgpa')[:3]
-            
-            # Clear existing toppers for this year
-            YearTopper.objects.filter(department=department, academic_year=year).delete()
-            
-            # Create new topper entries
-            for rank, student in enumerate(students, 1):
-                YearTopper.objects.create(
-                    department=department,
-                    academic_year=year,
-                    rank=rank,
-                    student=student,
-                    cgpa=student.latest_cgpa
-                )
+    def update_toppers(department, years=None):
+        """Update top students (settings.YEAR_TOPPERS_COUNT, default 3) for each year (or only `years`) in the department"""
+        from .grades import refresh_year_toppers
+        refresh_year_toppers([department], years)
 
 
 class FacultySubjectHistory(models.Model):
@@ -0,0 +1,63 @@
+"""
+Student search over Student.searchText (lower-cased name, roll number, registration number and
+college email). Every whitespace-separated term must appear in the text, so typing a name or
+number prefix narrows the list as you type. On Postgres the terms are matched through the
+pg_trgm GIN index and results are ranked by trigram word similarity, which also lets a
+misspelt name match; other databases (SQLite in development) fall back to LIKE with the
+same exact-number and name-prefix ranking.
+"""
+from django.db import connection
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.db.models.functions import Lower
+
+
+# Upper bound on api/students/search results
+SEARCH_LIMIT = 20
+
+
+def search_terms(query):
+    return [term for term in query.lower().split() if term]
+
+
+def search_students(queryset, query):
+    """
+    Filter `queryset` (Students) to those matching `query` and annotate `search_rank`
+    (higher is better): an exact roll/registration number, then a name starting with the query,
+    then trigram similarity on Postgres. Returns `queryset` unchanged for a blank query.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return queryset
+
+    query = ' '.join(terms)
+    matches = Q()
+    for term in terms:
+        matches &= Q(searchText__contains=term)
+
+    exact = Q()
+    if query.isdigit():
+        exact = Q(rollNumber=int(query)) | Q(registrationNumber=int(query))
+
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.lookups import TrigramWordSimilar
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        # The <% operator also uses the trigram index, so a typo still finds the student.
+        # (Used as an expression: the __trigram_word_similar lookup is registered on TextField
+        # after models load, so the generated searchText field does not inherit it.)
+        matches |= Q(TrigramWordSimilar(F('searchText'), Value(query)))
+        similarity = TrigramWordSimilarity(query, 'searchText')
+    else:
+        similarity = Value(0.0, output_field=FloatField())
+
+    # An exact number is always contained in searchText, so it only affects the rank
+    whens = [When(Q(name__istartswith=query), then=Value(1.0))]
+    if exact:
+        whens.insert(0, When(exact, then=Value(2.0)))
+    boost = Case(*whens, default=Value(0.0), output_field=FloatField())
+    return queryset.filter(matches).annotate(search_rank=boost + similarity)
+
+
+def ranked(queryset):
+    """Order a search_students() queryset best match first (ties by name, then roll number)"""
+    return queryset.order_by('-search_rank', Lower('name'), 'rollNumber')
@@ -0,0 +1,482 @@
+"""
+Section builders for the student detail pages (api/department/student/<rollno>/...).
+load_student() resolves the student once and prefetches only what the requested sections
+read; each builder then works from those prefetched relations, so the single-section views
+and the profile bundle share one loading path and one response shape.
+"""
+import uuid
+from datetime import date, time
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count, Prefetch, Q
+
+from .models import (
+    Student, Mentorship, Meeting, GroupMeetingStudent, Project, Internship, CoCurricular, Semester,
+    StudentSubject, PersonalProblem
+)
+
+
+SECTIONS = ('profile', 'projects', 'internships', 'career', 'problems', 'mentoring', 'academic', 'cocurricular')
+
+# PersonalProblem answers, in the order the problems page lists them
+PROBLEM_FIELDS = tuple(
+    f.name for f in PersonalProblem._meta.concrete_fields if f.name not in ('id', 'student')
+)
+
+DEFAULT_CAREER_RANKINGS = {
+    'govt_sector_rank': 1,
+    'core_rank': 2,
+    'it_rank': 3,
+    'higher_education_rank': 4,
+    'startup_rank': 5,
+    'family_business_rank': 6
+}
+
+
+def _before_cursor(cursor, prefix=''):
+    """Q for rows strictly older than a timeline cursor on (<prefix>date, <prefix>time, <prefix>id)"""
+    cursor_date, cursor_time, cursor_id = cursor
+    older = Q(**{f'{prefix}date__lt': cursor_date}) | Q(**{f'{prefix}date': cursor_date, f'{prefix}time__lt': cursor_time})
+    if cursor_id:
+        older |= Q(**{f'{prefix}date': cursor_date, f'{prefix}time': cursor_time, f'{prefix}id__lt': cursor_id})
+    return older
+
+
+def load_student(rollno, sections, timeline_page=None):
+    """
+    Fetch the student with `rollno` plus the relations `sections` need: one query for the
+    student and its one-to-one rows, and one per prefetched relation.
+    `timeline_page` is the (cursor, limit) of a paginated mentoring timeline (see
+    parse_timeline_cursor): meetings and group meeting reviews are then prefetched only from
+    before the cursor and at most limit + 1 per mentorship, and mentorships carry a meeting
+    count instead of their meetings. Raises Student.DoesNotExist.
+    """
+    select = []
+    prefetch = []
+    cursor, limit = timeline_page or (None, None)
+
+    if 'profile' in sections:
+        select.append('user')
+    if 'career' in sections:
+        select.append('careerDetails')
+    if 'problems' in sections:
+        select.append('personalProblem')
+    if 'profile' in sections or 'mentoring' in sections:
+        mentorships = Mentorship.objects.select_related('faculty').order_by('-is_active', '-start_date')
+        if timeline_page is not None:
+            mentorships = mentorships.annotate(meeting_count=Count('meetings'))
+        prefetch.append(Prefetch('mentorships', queryset=mentorships))
+    if 'mentoring' in sections:
+        meetings = Meeting.objects.order_by('-date', '-time', '-id')
+        reviews = GroupMeetingStudent.objects.select_related('group_meeting__faculty').order_by(
+            '-group_meeting__date', '-group_meeting__time', '-group_meeting__id'
+        )
+        if cursor:
+            meetings = meetings.filter(_before_cursor(cursor))
+            reviews = reviews.filter(_before_cursor(cursor, 'group_meeting__'))
+        if limit:
+            # The page takes the newest `limit` of the merged rows, so no relation needs more
+            meetings = meetings[:limit + 1]
+            reviews = reviews[:limit + 1]
+        prefetch.append(Prefetch('mentorships__meetings', queryset=meetings, to_attr='timeline_meetings'))
+        prefetch.append(Prefetch('group_meeting_reviews', queryset=reviews, to_attr='timeline_reviews'))
+    if 'projects' in sections:
+        prefetch.append(Prefetch('projects', queryset=Project.objects.select_related('mentor').order_by('-semester')))
+    if 'internships' in sections:
+        prefetch.append(Prefetch('internships', queryset=Internship.objects.order_by('-semester')))
+    if 'cocurricular' in sections:
+        prefetch.append(Prefetch('co_curriculars', queryset=CoCurricular.objects.order_by('-sem', '-date')))
+    if 'academic' in sections:
+        prefetch.append(Prefetch('semesters', queryset=Semester.objects.order_by('semester')))
+        prefetch.append(Prefetch(
+            'semesters__subject_grades',
+            queryset=StudentSubject.objects.select_related('subject')
+        ))
+
+    return Student.objects.select_related(*select).prefetch_related(*prefetch).get(rollNumber=rollno)
+
+
+def _student_ref(student):
+    return {
+        'studentId': str(student.id),
+        'studentName': student.name,
+        'rollNumber': student.rollNumber
+    }
+
+
+def _one_to_one(student, name):
+    try:
+        return getattr(student, name)
+    except ObjectDoesNotExist:
+        return None
+
+
+def profile_data(student):
+    active_mentorship = next((m for m in student.mentorships.all() if m.is_active), None)
+    mentor_info = None
+    if active_mentorship:
+        mentor_info = {
+            'id': str(active_mentorship.faculty.id),
+            'name': active_mentorship.faculty.name,
+            'employeeId': active_mentorship.faculty.employeeId,
+            'department': active_mentorship.faculty.department,
+            'email': active_mentorship.faculty.collegeEmail
+        }
+
+    return {
+        'id': str(student.id),
+        'userId': str(student.user.id),
+        'name': student.name,
+        'email': student.user.email,
+        'aadhar': student.aadhar,
+        'phoneNumber': student.phoneNumber,
+        'phoneCode': student.phoneCode,
+        'registrationNumber': student.registrationNumber,
+        'rollNumber': student.rollNumber,
+        'passPort': student.passPort,
+        'emergencyContact': student.emergencyContact,
+        'personalEmail': student.personalEmail,
+        'collegeEmail': student.collegeEmail,
+        'dob': student.dob.isoformat() if student.dob else None,
+        'address': student.address,
+        'program': student.program,
+        'branch': student.branch,
+        'year': student.year,
+        'bloodGroup': student.bloodGroup,
+        'dayScholar': student.dayScholar,
+        'gender': student.gender,
+        'community': student.community,
+        'status': student.status,
+        'profilePicture': student.user.profilePicture,
+        'accountStatus': student.user.accountStatus,
+        'father': {
+            'name': student.fatherName,
+            'occupation': student.fatherOccupation,
+            'aadhar': student.fatherAadhar,
+            'phone': student.fatherNumber
+        },
+        'mother': {
+            'name': student.motherName,
+            'occupation': student.motherOccupation,
+            'aadhar': student.motherAadhar,
+            'phone': student.motherNumber
+        },
+        'academicBackground': {
+            'xMarks': student.xMarks,
+            'xiiMarks': student.xiiMarks,
+            'jeeMains': student.jeeMains,
+            'jeeAdvanced': student.jeeAdvanced
+        },
+        'mentor': mentor_info,
+        'createdAt': student.createdAt.isoformat() if student.createdAt else None,
+        'updatedAt': student.updatedAt.isoformat() if student.updatedAt else None
+    }
+
+
+def projects_data(student):
+    projects_list = [
+        {
+            'id': str(project.id),
+            'semester': project.semester,
+            'title': project.title,
+            'description': project.description,
+            'technologies': project.technologies or [],
+            'mentor': {
+                'name': project.mentor.name,
+                'employeeId': project.mentor.employeeId,
+                'department': project.mentor.department
+            } if project.mentor else None
+        }
+        for project in student.projects.all()
+    ]
+    return {**_student_ref(student), 'projects': projects_list, 'total': len(projects_list)}
+
+
+def internships_data(student):
+    internships_list = [
+        {
+            'id': str(internship.id),
+            'semester': internship.semester,
+            'type': internship.type,
+            'organisation': internship.organisation,
+            'stipend': internship.stipend,
+            'duration': internship.duration,
+            'location': internship.location
+        }
+        for internship in student.internships.all()
+    ]
+    return {**_student_ref(student), 'internships': internships_list, 'total': len(internships_list)}
+
+
+def cocurricular_data(student):
+    activities_list = [
+        {
+            'id': str(activity.id),
+            'semester': activity.sem,
+            'date': activity.date.isoformat() if activity.date else None,
+            'eventDetails': activity.eventDetails,
+            'participationDetails': activity.participationDetails,
+            'awards': activity.awards
+        }
+        for activity in student.co_curriculars.all()
+    ]
+    return {**_student_ref(student), 'activities': activities_list, 'total': len(activities_list)}
+
+
+def career_data(student):
+    career = _one_to_one(student, 'careerDetails')
+    if career is None:
+        return {
+            'id': None,
+            **_student_ref(student),
+            'hobbies': [],
+            'strengths': [],
+            'areasToImprove': [],
+            'careerInterests': {
+                'core': [],
+                'it': [],
+                'higherEducation': [],
+                'startup': [],
+                'familyBusiness': [],
+                'otherInterests': []
+            },
+            'careerRankings': dict(DEFAULT_CAREER_RANKINGS),
+            'message': 'No career details found for this student'
+        }
+
+    return {
+        'id': str(career.id),
+        **_student_ref(student),
+        'hobbies': career.hobbies or [],
+        'strengths': career.strengths or [],
+        'areasToImprove': career.areasToImprove or [],
+        'careerInterests': {
+            'core': career.core or [],
+            'it': career.it or [],
+            'higherEducation': career.higherEducation or [],
+            'startup': career.startup or [],
+            'familyBusiness': career.familyBusiness or [],
+            'otherInterests': career.otherInterests or []
+        },
+        'careerRankings': {name: getattr(career, name) for name in DEFAULT_CAREER_RANKINGS}
+    }
+
+
+def problems_data(student):
+    problem = _one_to_one(student, 'personalProblem')
+    if problem is None:
+        return {
+            'id': None,
+            **_student_ref(student),
+            **{name: None for name in PROBLEM_FIELDS},
+            'message': 'No personal problems data found for this student'
+        }
+
+    return {
+        'id': str(problem.id),
+        **_student_ref(student),
+        **{name: getattr(problem, name) for name in PROBLEM_FIELDS}
+    }
+
+
+def parse_timeline_cursor(value):
+    """
+    Parse a timeline cursor: a `nextCursor` from a previous page ("<date>|<HH:MM:SS>|<id>")
+    or a plain YYYY-MM-DD date (entries before that day). Raises ValueError, including for an
+    id that is not a UUID.
+    """
+    parts = value.split('|')
+    if len(parts) == 1:
+        return (date.fromisoformat(parts[0]), time.min, '')
+    if len(parts) != 3:
+        raise ValueError(value)
+    return (date.fromisoformat(parts[0]), time.fromisoformat(parts[1]), str(uuid.UUID(parts[2])))
+
+
+def _timeline_key(entry):
+    return (entry['_date'], entry['_time'], entry['id'])
+
+
+def _faculty_ref(faculty):
+    return {
+        'id': str(faculty.id),
+        'name': faculty.name,
+        'employeeId': faculty.employeeId
+    }
+
+
+def mentoring_timeline(student, cursor=None, limit=None):
+    """
+    Legacy Meeting rows of every mentorship and the student's GroupMeetingStudent
+    attendance/reviews merged into one list, newest first (date, time, id).
+    `cursor` (parse_timeline_cursor) keeps only entries strictly older than it; `limit` caps the
+    page. Returns (entries, next cursor or None).
+    """
+    entries = []
+    for mentorship in student.mentorships.all():
+        for meeting in mentorship.timeline_meetings:
+            entries.append({
+                'id': str(meeting.id),
+                'type': 'MEETING',
+                '_date': meeting.date,
+                '_time': meeting.time or time.min,
+                'mentorshipId': str(mentorship.id),
+                'faculty': _faculty_ref(mentorship.faculty),
+                'description': meeting.description,
+                'status': meeting.status,
+                'feedback': meeting.facultyReview,
+                'attended': None
+            })
+    for review in student.timeline_reviews:
+        meeting = review.group_meeting
+        entries.append({
+            'id': str(meeting.id),
+            'type': 'GROUP_MEETING',
+            '_date': meeting.date,
+            '_time': meeting.time or time.min,
+            'year': meeting.year,
+            'semester': meeting.semester,
+            'faculty': _faculty_ref(meeting.faculty),
+            'description': meeting.description,
+            'status': meeting.status,
+            'feedback': review.review,
+            'attended': review.attended
+        })
+
+    if cursor:
+        entries = [e for e in entries if _timeline_key(e) < cursor]
+    entries.sort(key=_timeline_key, reverse=True)
+
+    next_cursor = None
+    if limit and len(entries) > limit:
+        entries = entries[:limit]
+        last = entries[-1]
+        next_cursor = f"{last['_date'].isoformat()}|{last['_time'].isoformat()}|{last['id']}"
+
+    for entry in entries:
+        entry_date = entry.pop('_date')
+        entry_time = entry.pop('_time')
+        entry['date'] = entry_date.isoformat() if entry_date else None
+        entry['time'] = entry_time.strftime('%H:%M')
+    return entries, next_cursor
+
+
+def mentoring_data(student, cursor=None, limit=None):
+    """
+    Mentorships and the mentoring timeline. With a cursor or limit (a student loaded with
+    timeline_page) the timeline is one page and mentorships list only their meeting counts;
+    without, every mentorship also lists all its meetings.
+    """
+    paginated = cursor is not None or limit is not None
+    mentorships_list = []
+    for mentorship in student.mentorships.all():
+        faculty = {
+            'id': str(mentorship.faculty.id),
+            'name': mentorship.faculty.name,
+            'employeeId': mentorship.faculty.employeeId,
+            'department': mentorship.faculty.department,
+            'email': mentorship.faculty.collegeEmail,
+            'phone': mentorship.faculty.phone1
+        }
+        if paginated:
+            mentorships_list.append({
+                'id': str(mentorship.id),
+                'faculty': faculty,
+                'startDate': mentorship.start_date.isoformat() if mentorship.start_date else None,
+                'endDate': mentorship.end_date.isoformat() if mentorship.end_date else None,
+                'isActive': mentorship.is_active,
+                'totalMeetings': mentorship.meeting_count
+            })
+            continue
+        meetings_list = [
+            {
+                'id': str(meeting.id),
+                'date': meeting.date.isoformat() if meeting.date else None,
+                'time': meeting.time.strftime('%H:%M') if meeting.time else None,
+                'description': meeting.description,
+                'status': meeting.status,
+                'feedback': meeting.facultyReview,
+                'remarks': None
+            }
+            for meeting in mentorship.timeline_meetings
+        ]
+        mentorships_list.append({
+            'id': str(mentorship.id),
+            'faculty': faculty,
+            'startDate': mentorship.start_date.isoformat() if mentorship.start_date else None,
+            'endDate': mentorship.end_date.isoformat() if mentorship.end_date else None,
+            'isActive': mentorship.is_active,
+            'meetings': meetings_list,
+            'totalMeetings': len(meetings_list)
+        })
+
+    timeline, next_cursor = mentoring_timeline(student, cursor, limit)
+    return {
+        **_student_ref(student),
+        'activeMentorship': next((m for m in mentorships_list if m['isActive']), None),
+        'mentorships': mentorships_list,
+        'totalMentorships': len(mentorships_list),
+        'timeline': timeline,
+        'nextCursor': next_cursor
+    }
+
+
+def academic_data(student):
+    semesters_list = []
+    latest_cgpa = None
+    for sem in student.semesters.all():
+        subjects_list = [
+            {
+                'subjectCode': sg.subject.subjectCode,
+                'subjectName': sg.subject.subjectName,
+                'credits': sg.subject.credits,
+                'grade': sg.grade
+            }
+            for sg in sem.subject_grades.all()
+        ]
+        semesters_list.append({
+            'semester': sem.semester,
+            'sgpa': float(sem.sgpa) if sem.sgpa else None,
+            'cgpa': float(sem.cgpa) if sem.cgpa else None,
+            'subjects': subjects_list,
+            'totalCredits': sum(s['credits'] for s in subjects_list)
+        })
+        if sem.cgpa:
+            latest_cgpa = float(sem.cgpa)
+
+    return {
+        **_student_ref(student),
+        'program': student.program,
+        'branch': student.branch,
+        'currentYear': student.year,
+        'latestCGPA': latest_cgpa,
+        'semesters': semesters_list,
+        'totalSemesters': len(semesters_list),
+        'preAdmission': {
+            'xMarks': student.xMarks,
+            'xiiMarks': student.xiiMarks,
+            'jeeMains': student.jeeMains,
+            'jeeAdvanced': student.jeeAdvanced
+        }
+    }
+
+
+BUILDERS = {
+    'profile': profile_data,
+    'projects': projects_data,
+    'internships': internships_data,
+    'career': career_data,
+    'problems': problems_data,
+    'mentoring': mentoring_data,
+    'academic': academic_data,
+    'cocurricular': cocurricular_data,
+}
+
+
+def build_sections(rollno, sections):
+    """
+    Return {section: data} for `sections` of the student with `rollno`.
+    Raises Student.DoesNotExist.
+    """
+    student = load_student(rollno, sections)
+    return {section: BUILDERS[section](student) for section in sections}
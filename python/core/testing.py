@@ -0,0 +1,53 @@
+"""
+Test helpers for query budgets. QueryBudgetMixin requests an endpoint through the test client
+and fails when it runs more DB queries than QUERY_BUDGETS allows (or a budget given
+explicitly), so an N+1 introduced in core/views.py fails CI instead of reaching production:
+
+    class StudentListBudgetTests(QueryBudgetMixin, TestCase):
+        def test_list(self):
+            self.client.post('/api/auth/login', {'email': ..., 'password': ...},
+                             content_type='application/json')
+            self.assertWithinQueryBudget('get_students_list', data={'department': 'CSE'})
+
+Budgets count every query of the request, authentication included, and should be checked
+against data with more than one row per relation so that per-row queries show up. core/tests.py
+checks every QUERY_BUDGETS entry this way; a new budget needs a request there.
+"""
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .instrumentation import QUERY_BUDGETS
+
+
+class QueryBudgetMixin:
+    """Mixin for django.test.TestCase (uses self.client)"""
+
+    def assertWithinQueryBudget(self, url_name, method='get', args=None, kwargs=None, data=None,
+                                budget=None, expected_status=200, using='default', **extra):
+        """
+        Request `url_name` (reversed with args/kwargs; `data` and `extra` are passed to the test
+        client, e.g. content_type='application/json' for a JSON body) and assert the status and
+        that it ran at most `budget` queries (default QUERY_BUDGETS[url_name]).
+        Returns the response.
+        """
+        if budget is None:
+            if url_name not in QUERY_BUDGETS:
+                self.fail(f'No query budget for {url_name}; add it to QUERY_BUDGETS or pass budget=')
+            budget = QUERY_BUDGETS[url_name]
+
+        url = reverse(url_name, args=args, kwargs=kwargs)
+        with CaptureQueriesContext(connections[using]) as captured:
+            response = getattr(self.client, method)(url, data, **extra)
+
+        self.assertEqual(
+            response.status_code, expected_status,
+            f'{url_name} returned {response.status_code}: {response.content[:200]!r}'
+        )
+        executed = len(captured.captured_queries)
+        if executed > budget:
+            queries = '\n'.join(
+                f'{i}. {q["sql"]}' for i, q in enumerate(captured.captured_queries, start=1)
+            )
+            self.fail(f'{url_name} ran {executed} queries, budget is {budget}:\n{queries}')
+        return response
@@ -0,0 +1,361 @@
+"""
+Tests against a department with several faculty, students, subjects, grades, meetings and
+mentorships (DepartmentTestCase).
+Query budget tests: every endpoint in QUERY_BUDGETS is requested by a user of the role it
+serves, with cold caches, so that a per-row query or a cache masking one fails here.
+The other classes check the behaviour of the set-based helpers those endpoints use.
+"""
+import io
+import json
+from datetime import date, time
+from unittest import mock
+
+import bcrypt
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .grade_import import import_grades
+from .grades import rank_year_toppers, recalculate_gpa, refresh_year_toppers, update_student_gpa
+from .instrumentation import QUERY_BUDGETS
+from .middleware import user_data_cache
+from .mentorship import (
+    allocate_department_mentors, bulk_assign_mentor, plan_mentor_allocation, sync_current_mentors
+)
+from .models import (
+    Admin, Faculty, GroupMeeting, GroupMeetingStudent, HOD, Meeting, Mentorship, Semester,
+    Student, StudentSubject, Subject, User, YearTopper
+)
+from .testing import QueryBudgetMixin
+
+
+PASSWORD = 'password'
+FACULTY_COUNT = 3
+STUDENT_COUNT = 6
+
+# URL name -> (role of the requesting user, assertWithinQueryBudget kwargs given the test case)
+BUDGETED_REQUESTS = {
+    'get_user_role': ('HOD', lambda t: {}),
+    'get_students_list': ('HOD', lambda t: {}),
+    'search_students': ('HOD', lambda t: {'data': {'q': 'student'}}),
+    'get_faculty': ('HOD', lambda t: {}),
+    'get_hods': ('ADMIN', lambda t: {}),
+    'get_subjects_list': ('HOD', lambda t: {}),
+    'get_year_toppers': ('HOD', lambda t: {}),
+    'get_faculty_subjects': ('HOD', lambda t: {}),
+    'get_hod_mentorships': ('HOD', lambda t: {}),
+    'get_faculty_mentees': ('FACULTY', lambda t: {}),
+    'get_student_about': ('STUDENT', lambda t: {}),
+    'get_student_grades': ('STUDENT', lambda t: {}),
+    'get_student_grades_by_id': ('HOD', lambda t: {'kwargs': {'student_id': t.student.id}}),
+    'get_student_mentoring_by_rollno': ('HOD', lambda t: {'kwargs': {'rollno': t.student.rollNumber}}),
+    'get_student_dashboard_stats': ('STUDENT', lambda t: {}),
+    'get_faculty_dashboard_stats': ('FACULTY', lambda t: {}),
+    'get_hod_dashboard_stats': ('HOD', lambda t: {}),
+    'get_admin_dashboard_stats': ('ADMIN', lambda t: {}),
+}
+
+
+def create_user(email, role):
+    password = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(4)).decode()
+    return User.objects.create(email=email, password=password, role=role)
+
+
+def create_faculty(index, role='FACULTY'):
+    user = create_user(f'faculty{index}@example.edu', role)
+    return Faculty.objects.create(
+        user=user, employeeId=f'EMP{index:03d}', name=f'Faculty {index}', phone1='9000000000',
+        personalEmail=f'faculty{index}@example.com', collegeEmail=user.email, department='CSE',
+        office='Block A', officeHours='10:00-12:00'
+    )
+
+
+def create_student(index):
+    user = create_user(f'student{index}@example.edu', 'STUDENT')
+    return Student.objects.create(
+        user=user, name=f'Student {index}', aadhar=str(100000000000 + index), phoneNumber='9000000000',
+        phoneCode=91, registrationNumber=5000 + index, rollNumber=1000 + index, emergencyContact='9000000001',
+        personalEmail=f'student{index}@example.com', collegeEmail=user.email, dob=timezone.now(),
+        address='Address', program='B.Tech', branch='CSE', year=1, bloodGroup='O+', dayScholar=True,
+        fatherName='Father', motherName='Mother', gender='Male', community='General', xMarks=90,
+        xiiMarks=90, jeeMains=100
+    )
+
+
+class DepartmentTestCase(TestCase):
+    """CSE with an HOD, an admin, FACULTY_COUNT faculty and STUDENT_COUNT first-year students"""
+
+    @classmethod
+    def setUpTestData(cls):
+        hod_faculty = create_faculty(0, role='HOD')
+        HOD.objects.create(user=hod_faculty.user, faculty=hod_faculty, department='CSE', startDate=timezone.now())
+        admin_user = create_user('admin@example.edu', 'ADMIN')
+        Admin.objects.create(
+            user=admin_user, employeeId='ADM001', name='Admin', phone='9000000000',
+            personalEmail='admin@example.com', collegeEmail=admin_user.email, designation='Registrar'
+        )
+        faculty = [create_faculty(index) for index in range(1, FACULTY_COUNT + 1)]
+        subjects = [
+            Subject.objects.create(subjectName=f'Subject {index}', subjectCode=f'CS{index:03d}', credits=3,
+                                   department='CSE', current_faculty=faculty[index % FACULTY_COUNT])
+            for index in range(FACULTY_COUNT * 2)
+        ]
+
+        students = []
+        for index in range(STUDENT_COUNT):
+            student = create_student(index)
+            students.append(student)
+            mentorship = Mentorship.objects.create(
+                faculty=faculty[index % FACULTY_COUNT], student=student, department='CSE', year=1, semester=1,
+                start_date=timezone.now()
+            )
+            Meeting.objects.create(mentorship=mentorship, date=date(2026, 1, 2), time=time(10), status='COMPLETED')
+            for number in (1, 2):
+                semester = Semester.objects.create(student=student, semester=number, sgpa=7, cgpa=7, total_credits=6)
+                for subject in subjects[:2]:
+                    StudentSubject.objects.create(student=student, subject=subject, semester=semester, grade='A')
+
+        for mentor in faculty:
+            meeting = GroupMeeting.objects.create(
+                faculty=mentor, department='CSE', year=1, semester=1, date=date(2026, 1, 1), time=time(10),
+                status='COMPLETED'
+            )
+            for student in students[:3]:
+                GroupMeetingStudent.objects.create(group_meeting=meeting, student=student, review='Good',
+                                                   attended=True)
+
+        call_command('repair_student_summaries', stdout=io.StringIO())
+        call_command('refresh_year_toppers', stdout=io.StringIO())
+
+        cls.users = {
+            'HOD': hod_faculty.user,
+            'ADMIN': admin_user,
+            'FACULTY': faculty[0].user,
+            'STUDENT': students[0].user,
+        }
+        cls.faculty = faculty
+        cls.subjects = subjects
+        cls.students = students
+        cls.student = students[0]
+
+    def login(self, role):
+        response = self.client.post(
+            '/api/auth/login', json.dumps({'email': self.users[role].email, 'password': PASSWORD}),
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200, response.content[:200])
+
+
+class QueryBudgetTests(QueryBudgetMixin, DepartmentTestCase):
+
+    def clear_caches(self):
+        cache.clear()
+        user_data_cache.clear()
+
+    def test_every_budget_is_checked(self):
+        self.assertEqual(set(BUDGETED_REQUESTS), set(QUERY_BUDGETS))
+
+    def test_query_budgets(self):
+        for url_name, (role, request_kwargs) in BUDGETED_REQUESTS.items():
+            with self.subTest(url_name):
+                self.login(role)
+                self.clear_caches()
+                self.assertWithinQueryBudget(url_name, **request_kwargs(self))
+
+
+class BulkAssignMentorTests(DepartmentTestCase):
+
+    def test_results_follow_roll_number_order(self):
+        mentor = self.faculty[1]
+        moved, kept = self.students[0], self.students[1]
+        results = bulk_assign_mentor(mentor, [moved.rollNumber, 'abc', kept.rollNumber, 9999], 1, 1)
+
+        self.assertEqual(
+            [r['student']['rollNumber'] for r in results['successful']], [moved.rollNumber]
+        )
+        self.assertEqual(
+            [r['rollNumber'] for r in results['failed']], ['abc', kept.rollNumber, 9999]
+        )
+        self.assertEqual(results['failed'][2]['reason'], 'Student not found')
+        self.assertEqual(results['successful'][0]['previousMentor']['id'], str(self.faculty[0].id))
+
+        moved.refresh_from_db()
+        self.assertEqual(moved.currentMentor_id, mentor.id)
+        self.assertEqual(
+            list(Mentorship.objects.filter(student=moved, is_active=True).values_list('faculty_id', flat=True)),
+            [mentor.id]
+        )
+
+    def test_reactivates_an_ended_mentorship(self):
+        student = self.students[0]
+        Mentorship.objects.filter(student=student).update(is_active=False, end_date=timezone.now())
+        results = bulk_assign_mentor(self.faculty[0], [student.rollNumber], 1, 1)
+
+        self.assertTrue(results['successful'][0]['reactivated'])
+        self.assertEqual(Mentorship.objects.filter(student=student).count(), 1)
+        student.refresh_from_db()
+        self.assertEqual(student.currentMentor_id, self.faculty[0].id)
+
+
+class MentorAllocationTests(DepartmentTestCase):
+
+    def test_plan_keeps_loads_balanced(self):
+        plan, unplaced = plan_mentor_allocation(['s1', 's2', 's3', 's4'], {'f1': 3, 'f2': 0, 'f3': 1}, cap=10)
+
+        loads = {'f1': 3, 'f2': 0, 'f3': 1}
+        for faculty_id in plan.values():
+            loads[faculty_id] += 1
+        self.assertEqual(unplaced, [])
+        self.assertEqual(loads, {'f1': 3, 'f2': 3, 'f3': 2})
+
+    def test_plan_respects_cap(self):
+        plan, unplaced = plan_mentor_allocation(['s1', 's2', 's3'], {'f1': 2, 'f2': 1}, cap=2)
+
+        self.assertEqual(plan, {'s1': 'f2'})
+        self.assertEqual(unplaced, ['s2', 's3'])
+
+    def test_dry_run_writes_nothing(self):
+        unassigned = self.students[4:]
+        unassigned_ids = [s.id for s in unassigned]
+        Mentorship.objects.filter(student_id__in=unassigned_ids).update(is_active=False, end_date=timezone.now())
+        sync_current_mentors(unassigned_ids)
+        mentorships = Mentorship.objects.count()
+
+        summary = allocate_department_mentors('CSE', 1, 2, cap=10, dry_run=True)
+        self.assertEqual(summary['assignedCount'], 2)
+        self.assertEqual(summary['continuityCount'], 2)
+        self.assertEqual(Mentorship.objects.count(), mentorships)
+        self.assertFalse(Student.objects.filter(id__in=unassigned_ids, currentMentor__isnull=False).exists())
+
+        allocate_department_mentors('CSE', 1, 2, cap=10)
+        # Both go back to their previous mentor, which stays within the balanced load
+        self.assertEqual(
+            dict(Student.objects.filter(id__in=unassigned_ids).values_list('id', 'currentMentor_id')),
+            {unassigned[0].id: self.faculty[1].id, unassigned[1].id: self.faculty[2].id}
+        )
+
+
+class GpaTests(DepartmentTestCase):
+
+    def test_recalculate_from_grades(self):
+        # Fixture semesters store 7 while every grade is an A (9 points)
+        previous_cgpa, cgpa, semesters = recalculate_gpa([self.student.id])[self.student.id]
+
+        self.assertEqual((previous_cgpa, cgpa), (7, 9.0))
+        self.assertEqual({number: sem.sgpa for number, sem in semesters.items()}, {1: 9.0, 2: 9.0})
+        self.assertEqual(Student.objects.get(id=self.student.id).currentCgpa, 9.0)
+
+    def test_update_only_changed_semester(self):
+        recalculate_gpa([self.student.id])
+        grade = StudentSubject.objects.get(student=self.student, subject=self.subjects[0], semester__semester=2)
+        grade.grade = 'F'
+        grade.save()
+
+        cgpa, semesters = update_student_gpa(self.student, [grade.semester_id])
+        # Semester 2: (0 * 3 + 9 * 3) / 6; CGPA weighs both semesters by credits
+        self.assertEqual(semesters[2].sgpa, 4.5)
+        self.assertEqual(semesters[1].sgpa, 9.0)
+        self.assertEqual(cgpa, 6.75)
+        self.assertEqual(Semester.objects.get(id=grade.semester_id).cgpa, 6.75)
+        self.assertEqual(Student.objects.get(id=self.student.id).currentCgpa, 6.75)
+
+
+class GradeImportTests(DepartmentTestCase):
+
+    def rows(self):
+        return [
+            (2, {'rollNumber': self.student.rollNumber, 'subjectCode': self.subjects[2].subjectCode, 'grade': 'B'}),
+            (3, {'rollNumber': 9999, 'subjectCode': self.subjects[2].subjectCode, 'grade': 'B'}),
+        ]
+
+    def test_dry_run_rolls_back(self):
+        grades = StudentSubject.objects.count()
+        with self.captureOnCommitCallbacks() as callbacks:
+            summary = import_grades(self.rows(), semester=3, dry_run=True)
+
+        self.assertEqual((summary['created'], summary['failed'], summary['studentsRecomputed']), (1, 1, 1))
+        self.assertEqual(summary['errors'][0]['reason'], 'Student not found')
+        self.assertEqual(StudentSubject.objects.count(), grades)
+        self.assertFalse(Semester.objects.filter(student=self.student, semester=3).exists())
+        self.assertEqual(Student.objects.get(id=self.student.id).currentCgpa, 7)
+        # Cached stats are only dropped once an import commits
+        self.assertEqual(callbacks, [])
+
+    def test_import_writes_grades(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            summary = import_grades(self.rows(), semester=3)
+
+        self.assertEqual((summary['created'], summary['failed']), (1, 1))
+        semester = Semester.objects.get(student=self.student, semester=3)
+        self.assertEqual(semester.sgpa, 8.0)
+        self.assertTrue(StudentSubject.objects.filter(semester=semester, subject=self.subjects[2], grade='B').exists())
+        self.assertEqual(len(callbacks), 1)
+
+
+class YearTopperTests(DepartmentTestCase):
+
+    def setUp(self):
+        # Two students share the top CGPA; the rest tie at the fixture's 7
+        Student.objects.filter(id__in=[self.students[4].id, self.students[3].id]).update(currentCgpa=8.5)
+        self.expected = [
+            ('CSE', 1, 1, self.students[3].id, 8.5),
+            ('CSE', 1, 2, self.students[4].id, 8.5),
+            ('CSE', 1, 3, self.students[0].id, 7),
+        ]
+
+    def test_ties_ranked_by_roll_number(self):
+        self.assertEqual(rank_year_toppers(['CSE'], [1], top_n=3), self.expected)
+
+    def test_ranking_without_window_functions(self):
+        with mock.patch.object(connection.features, 'supports_over_clause', False):
+            self.assertEqual(rank_year_toppers(['CSE'], [1], top_n=3), self.expected)
+
+    def test_refresh_replaces_rows(self):
+        self.assertEqual(refresh_year_toppers(['CSE'], [1], top_n=3), 3)
+        self.assertEqual(
+            list(YearTopper.objects.filter(department='CSE', academic_year=1).order_by('rank').values_list(
+                'rank', 'student_id'
+            )),
+            [(rank, student_id) for _, _, rank, student_id, _ in self.expected]
+        )
+
+
+class StudentListCursorTests(DepartmentTestCase):
+
+    def pages(self, **params):
+        """Follow nextCursor from the first page; returns the ids of each page"""
+        pages = []
+        cursor = ''
+        while cursor is not None:
+            response = self.client.get(reverse('get_students_list'), {'cursor': cursor, 'limit': 4, **params})
+            self.assertEqual(response.status_code, 200, response.content[:200])
+            body = response.json()
+            pages.append([s['id'] for s in body['students']])
+            cursor = body['pagination']['nextCursor']
+        return pages
+
+    def test_pages_cover_every_student_once(self):
+        self.login('HOD')
+        top = self.students[2]
+        Student.objects.filter(id=top.id).update(currentCgpa=9)
+        # The other students tie on CGPA, so the id orders them across the page boundary
+        tied = sorted(s.id for s in self.students if s != top)
+        cases = {
+            ('rollNumber', 'asc'): [s.id for s in self.students],
+            ('rollNumber', 'desc'): [s.id for s in reversed(self.students)],
+            ('cgpa', 'asc'): tied + [top.id],
+            ('cgpa', 'desc'): [top.id] + tied[::-1],
+        }
+        for (sort_by, sort_order), expected in cases.items():
+            with self.subTest(sortBy=sort_by, sortOrder=sort_order):
+                pages = self.pages(sortBy=sort_by, sortOrder=sort_order)
+                self.assertEqual([len(page) for page in pages], [4, 2])
+                self.assertEqual(sum(pages, []), [str(student_id) for student_id in expected])
+
+    def test_invalid_cursor(self):
+        self.login('HOD')
+        response = self.client.get(reverse('get_students_list'), {'cursor': 'abc|not-an-id'})
+        self.assertEqual(response.status_code, 400)
@@ -8,28 +8,53 @@ from datetime import datetime, timedelta
 from .models import User
 from django.conf import settings
 import os
-from .middleware import require_auth, require_role
+from .middleware import (
+    require_auth, require_role, invalidate_user_data, revoke_user_tokens,
+    build_token_claims, JWT_STATELESS_AUTH
+)
+from .cache import INSTITUTION, invalidate_dashboard_stats, memoize_view
+from .conditional import conditional_get, resource_namespace
 import csv
 import io
+import logging
 from django.utils import timezone
 
 
+logger = logging.getLogger(__name__)
+
 # Get JWT secret from environment or settings
 JWT_SECRET = os.environ.get('JWT_SECRET', settings.SECRET_KEY)
 JWT_EXPIRY_DAYS = 15
 
 
-def generate_token(user_id, response):
+def _request_stats_changed(req):
+    """Drop the cached dashboard stats that count `req` (student, assigned faculty, department)"""
+    assigned_to = req.assigned_to if req.assigned_to_id else None
+    invalidate_dashboard_stats(
+        student_ids=[req.student_id],
+        faculty_ids=[req.assigned_to_id],
+        departments=[assigned_to.department if assigned_to else None]
+    )
+
+
+def generate_token(user, response):
     """
     Generate JWT token and set it as httpOnly cookie
     Similar to GenerateToken from Node.js backend
+    With JWT_STATELESS_AUTH the token also carries role/entity claims and the
+    user's token version, so `user` should be loaded with
+    select_related('student', 'faculty', 'hod', 'admin')
     """
     try:
+        payload = {
+            'id': str(user.id),  # Convert UUID to string
+            'exp': datetime.utcnow() + timedelta(days=JWT_EXPIRY_DAYS)
+        }
+        if JWT_STATELESS_AUTH:
+            payload.update(build_token_claims(user))
+        
         token = jwt.encode(
-            {
-                'id': str(user_id),  # Convert UUID to string
-                'exp': datetime.utcnow() + timedelta(days=JWT_EXPIRY_DAYS)
-            },
+            payload,
             JWT_SECRET,
             algorithm='HS256'
         )
@@ -46,7 +71,7 @@ def generate_token(user_id, response):
         )
         
     except Exception as e:
-        print(f"Error generating token: {str(e)}")
+        logger.exception("Error generating token: %s", e)
         raise
 
 
@@ -76,7 +101,9 @@ def login(request):
         
         # Find user by email
         try:
-            user = User.objects.get(email=email)
+            user = User.objects.select_related(
+                'student', 'faculty', 'hod', 'admin'
+            ).get(email=email)
         except User.DoesNotExist:
             return JsonResponse(
                 {'message': 'Invalid email or password'},
@@ -108,7 +135,7 @@ def login(request):
         }, status=200)
         
         # Generate and set token cookie
-        generate_token(user.id, response)
+        generate_token(user, response)
         
         return response
         
@@ -118,7 +145,7 @@ def login(request):
             status=400
         )
     except Exception as e:
-        print(f"Login error: {str(e)}")
+        logger.exception("Login error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -202,9 +229,7 @@ def export_students_csv(request):
                     buffer.seek(0); buffer.truncate(0)
                 except Exception as row_err:
                     # Log per-row errors and continue with next row
-                    print(f"Error exporting student row (roll: {getattr(s, 'rollNumber', 'unknown')}): {str(row_err)}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception("Error exporting student row (roll: %s): %s", getattr(s, 'rollNumber', 'unknown'), row_err)
                     continue
 
         filename = f"students_{timezone.now().strftime('%Y%m%d_%H%M%S')}.csv"
@@ -213,9 +238,7 @@ def export_students_csv(request):
         return response
 
     except Exception as e:
-        print(f"Export students CSV error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Export students CSV error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -242,7 +265,7 @@ def logout(request):
         return response
         
     except Exception as e:
-        print(f"Logout error: {str(e)}")
+        logger.exception("Logout error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -273,7 +296,9 @@ def change_password(request):
         
         # Get user from database
         try:
-            user = User.objects.get(id=user_id)
+            user = User.objects.select_related(
+                'student', 'faculty', 'hod', 'admin'
+            ).get(id=user_id)
         except User.DoesNotExist:
             return JsonResponse(
                 {'message': 'User not found'},
@@ -301,9 +326,16 @@ def change_password(request):
         user.password = hashed_new_password.decode('utf-8')
         user.save()
         
-        return JsonResponse({
+        # Log out every other session, then re-issue this one at the new version
+        revoke_user_tokens(user.id)
+        user.refresh_from_db(fields=['tokenVersion'])
+        
+        response = JsonResponse({
             'message': 'Password changed successfully'
         }, status=200)
+        generate_token(user, response)
+        
+        return response
         
     except json.JSONDecodeError:
         return JsonResponse(
@@ -311,7 +343,7 @@ def change_password(request):
             status=400
         )
     except Exception as e:
-        print(f"Change password error: {str(e)}")
+        logger.exception("Change password error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -374,6 +406,7 @@ def register(request):
             password=hashed_password.decode('utf-8'),
             role=role
         )
+        invalidate_dashboard_stats()
         
         return JsonResponse({
             'message': 'User registered successfully',
@@ -388,7 +421,7 @@ def register(request):
             status=400
         )
     except Exception as e:
-        print(f"Registration error: {str(e)}")
+        logger.exception("Registration error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -398,20 +431,16 @@ def register(request):
 @csrf_exempt
 @require_http_methods(["GET"])
 @require_auth
+@conditional_get('me')
 def get_user_role(request):
     """
     Get current authenticated user's complete details
     Returns user info, role, and associated entity details (Student, Faculty, HOD, or Admin)
     """
     try:
-        user_id = request.user_data.get('id')
-        
-        # Get user with related entities
-        try:
-            user = User.objects.select_related(
-                'student', 'faculty', 'hod', 'admin'
-            ).get(id=user_id)
-        except User.DoesNotExist:
+        # User with related entities (loaded once per request)
+        user = request.actor.user
+        if user is None:
             return JsonResponse(
                 {'message': 'User not found'},
                 status=404
@@ -495,7 +524,7 @@ def get_user_role(request):
         return JsonResponse(response_data, status=200)
         
     except Exception as e:
-        print(f"Get user details error: {str(e)}")
+        logger.exception("Get user details error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -536,10 +565,8 @@ def assign_mentor(request):
                 status=400
             )
         
-        # Get HOD user ID from request (set by middleware)
-        hod_user_id = request.user_id
-        
-        from .models import Student, Faculty, HOD, Mentorship
+        from .models import Faculty
+        from .mentorship import bulk_assign_mentor
         
         # Find the faculty by employee ID
         try:
@@ -551,120 +578,15 @@ def assign_mentor(request):
             )
         
         # Verify that the HOD is authorized for this department
-        try:
-            hod = HOD.objects.select_related('faculty').get(
-                user_id=hod_user_id,
-                department=faculty.department,
-                endDate__isnull=True  # Only active HODs
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None or hod.department != faculty.department:
             return JsonResponse(
                 {'message': f'You are not authorized to assign mentors in the {faculty.department} department'},
                 status=403
             )
         
-        # Process each student
-        results = {
-            'successful': [],
-            'failed': []
-        }
-        
-        for roll_number in student_roll_numbers:
-            try:
-                # Find the student by roll number
-                try:
-                    student = Student.objects.select_related('user').get(rollNumber=int(roll_number))
-                except Student.DoesNotExist:
-                    results['failed'].append({
-                        'rollNumber': roll_number,
-                        'reason': 'Student not found'
-                    })
-                    continue
-                
-                # Check if student is in the same department as faculty
-                if student.branch != faculty.department:
-                    results['failed'].append({
-                        'rollNumber': roll_number,
-                        'reason': f'Student branch ({student.branch}) does not match faculty department ({faculty.department})'
-                    })
-                    continue
-                
-                # Check if mentorship already exists for same faculty, student, year, semester
-                existing_mentorship = Mentorship.objects.filter(
-                    faculty=faculty,
-                    student=student,
-                    year=int(year),
-                    semester=int(semester)
-                ).first()
-                
-                if existing_mentorship:
-                    # Reactivate if inactive
-                    if not existing_mentorship.is_active:
-                        existing_mentorship.is_active = True
-                        existing_mentorship.end_date = None
-                        existing_mentorship.save()
-                        results['successful'].append({
-                            'student': {
-                                'name': student.name,
-                                'rollNumber': student.rollNumber,
-                                'branch': student.branch
-                            },
-                            'mentorshipId': str(existing_mentorship.id),
-                            'reactivated': True
-                        })
-                    else:
-                        results['failed'].append({
-                            'rollNumber': roll_number,
-                            'reason': 'Active mentorship already exists for this faculty, student, year, and semester'
-                        })
-                    continue
-                
-                # Deactivate any existing active mentorships for this student (previous mentor becomes past mentor)
-                previous_mentor_info = None
-                active_mentorship = Mentorship.objects.filter(
-                    student=student,
-                    is_active=True
-                ).select_related('faculty').first()
-                
-                if active_mentorship:
-                    active_mentorship.is_active = False
-                    active_mentorship.end_date = datetime.now()
-                    active_mentorship.save()
-                    previous_mentor_info = {
-                        'id': str(active_mentorship.faculty.id),
-                        'name': active_mentorship.faculty.name,
-                        'employeeId': active_mentorship.faculty.employeeId,
-                        'mentorshipId': str(active_mentorship.id)
-                    }
-                
-                # Create new mentorship
-                mentorship = Mentorship.objects.create(
-                    faculty=faculty,
-                    student=student,
-                    department=faculty.department,
-                    year=int(year),
-                    semester=int(semester),
-                    start_date=datetime.now(),
-                    is_active=True,
-                    comments=comments if isinstance(comments, list) else []
-                )
-                
-                results['successful'].append({
-                    'student': {
-                        'name': student.name,
-                        'rollNumber': student.rollNumber,
-                        'branch': student.branch
-                    },
-                    'mentorshipId': str(mentorship.id),
-                    'previousMentor': previous_mentor_info,
-                    'reactivated': False
-                })
-                
-            except Exception as e:
-                results['failed'].append({
-                    'rollNumber': roll_number,
-                    'reason': str(e)
-                })
+        # Validate, deactivate previous mentors and create mentorships in bulk
+        results = bulk_assign_mentor(faculty, student_roll_numbers, year, semester, comments)
         
         # If no students were successfully assigned, return error
         if len(results['successful']) == 0:
@@ -712,9 +634,105 @@ def assign_mentor(request):
             status=400
         )
     except Exception as e:
-        print(f"Assign mentor error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Assign mentor error: %s", e)
+        return JsonResponse(
+            {'message': 'Server error'},
+            status=500
+        )
+
+
+def _json_flag(value, name):
+    """A JSON boolean field: true/false, or a "1"/"true"/"yes" ("0"/"false"/"no") string"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ('1', 'true', 'yes'):
+            return True
+        if lowered in ('0', 'false', 'no', ''):
+            return False
+    raise ValueError(f'{name} must be true or false')
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+@require_role('HOD')
+def allocate_mentors(request):
+    """
+    HOD automatically allocates every unassigned student of a year to the department's active faculty
+    Required fields: year (year of study, 1-4), semester
+    Optional fields:
+        - department: must match the HOD's department (defaults to it)
+        - maxPerMentor: cap on active mentees per faculty (default settings.MENTOR_ALLOCATION_CAP)
+        - keepPreviousMentor: reassign students to their most recent past mentor when balance allows (default true)
+        - dryRun: return the plan without saving it (default false)
+    """
+    try:
+        data = json.loads(request.body)
+        year = data.get('year')
+        semester = data.get('semester')
+        department = data.get('department')
+        max_per_mentor = data.get('maxPerMentor', getattr(settings, 'MENTOR_ALLOCATION_CAP', 25))
+        keep_previous_mentor = _json_flag(data.get('keepPreviousMentor', True), 'keepPreviousMentor')
+        dry_run = _json_flag(data.get('dryRun', False), 'dryRun')
+        
+        if not year or not semester:
+            return JsonResponse(
+                {'message': 'Missing required fields: year, semester'},
+                status=400
+            )
+        
+        max_per_mentor = int(max_per_mentor)
+        if max_per_mentor < 1:
+            return JsonResponse({'message': 'maxPerMentor must be at least 1'}, status=400)
+        
+        from .mentorship import allocate_department_mentors
+        
+        hod = request.actor.active_hod
+        if hod is None:
+            return JsonResponse({'message': 'Active HOD profile not found'}, status=404)
+        
+        if department and department != hod.department:
+            return JsonResponse(
+                {'message': f'You are not authorized to assign mentors in the {department} department'},
+                status=403
+            )
+        
+        summary = allocate_department_mentors(
+            hod.department,
+            year,
+            semester,
+            max_per_mentor,
+            keep_previous_mentor=keep_previous_mentor,
+            dry_run=dry_run
+        )
+        
+        if summary['totalUnassigned'] == 0:
+            message = 'No unassigned students found'
+        elif not summary['faculty']:
+            message = 'No active faculty available in the department'
+        elif dry_run:
+            message = f"Planned {summary['assignedCount']} of {summary['totalUnassigned']} unassigned student(s)"
+        else:
+            message = f"Allocated {summary['assignedCount']} of {summary['totalUnassigned']} unassigned student(s)"
+        
+        return JsonResponse({
+            'message': message,
+            **summary
+        }, status=200 if dry_run or summary['assignedCount'] == 0 else 201)
+        
+    except json.JSONDecodeError:
+        return JsonResponse(
+            {'message': 'Invalid JSON in request body'},
+            status=400
+        )
+    except (TypeError, ValueError) as e:
+        return JsonResponse(
+            {'message': f'Invalid data format: {str(e)}'},
+            status=400
+        )
+    except Exception as e:
+        logger.exception("Allocate mentors error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -820,15 +838,25 @@ def get_department_students(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get department students error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get department students error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
         )
 
 
+def _student_section_response(rollno, section):
+    """Serve one section of the student detail page (see core.student_profile)"""
+    from .models import Student
+    from .student_profile import build_sections
+    
+    try:
+        data = build_sections(rollno, [section])[section]
+    except Student.DoesNotExist:
+        return JsonResponse({'message': 'Student not found'}, status=404)
+    return JsonResponse(data, status=200)
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 @require_role(['FACULTY', 'HOD', 'ADMIN'])
@@ -838,81 +866,10 @@ def get_student_by_rollno(request, rollno):
     Accessible by: FACULTY, HOD, ADMIN (not STUDENT)
     """
     try:
-        from .models import Student, Mentorship
-        
-        try:
-            student = Student.objects.select_related('user').get(rollNumber=rollno)
-        except Student.DoesNotExist:
-            return JsonResponse(
-                {'message': 'Student not found'},
-                status=404
-            )
-        
-        # Get active mentorship info
-        active_mentorship = Mentorship.objects.filter(student=student, is_active=True).first()
-        mentor_info = None
-        if active_mentorship:
-            mentor_info = {
-                'id': str(active_mentorship.faculty.id),
-                'name': active_mentorship.faculty.name,
-                'employeeId': active_mentorship.faculty.employeeId,
-                'department': active_mentorship.faculty.department,
-                'email': active_mentorship.faculty.collegeEmail
-            }
-        
-        return JsonResponse({
-            'id': str(student.id),
-            'userId': str(student.user.id),
-            'name': student.name,
-            'email': student.user.email,
-            'aadhar': student.aadhar,
-            'phoneNumber': student.phoneNumber,
-            'phoneCode': student.phoneCode,
-            'registrationNumber': student.registrationNumber,
-            'rollNumber': student.rollNumber,
-            'passPort': student.passPort,
-            'emergencyContact': student.emergencyContact,
-            'personalEmail': student.personalEmail,
-            'collegeEmail': student.collegeEmail,
-            'dob': student.dob.isoformat() if student.dob else None,
-            'address': student.address,
-            'program': student.program,
-            'branch': student.branch,
-            'year': student.year,
-            'bloodGroup': student.bloodGroup,
-            'dayScholar': student.dayScholar,
-            'gender': student.gender,
-            'community': student.community,
-            'status': student.status,
-            'profilePicture': student.user.profilePicture,
-            'accountStatus': student.user.accountStatus,
-            'father': {
-                'name': student.fatherName,
-                'occupation': student.fatherOccupation,
-                'aadhar': student.fatherAadhar,
-                'phone': student.fatherNumber
-            },
-            'mother': {
-                'name': student.motherName,
-                'occupation': student.motherOccupation,
-                'aadhar': student.motherAadhar,
-                'phone': student.motherNumber
-            },
-            'academicBackground': {
-                'xMarks': student.xMarks,
-                'xiiMarks': student.xiiMarks,
-                'jeeMains': student.jeeMains,
-                'jeeAdvanced': student.jeeAdvanced
-            },
-            'mentor': mentor_info,
-            'createdAt': student.createdAt.isoformat() if student.createdAt else None,
-            'updatedAt': student.updatedAt.isoformat() if student.updatedAt else None
-        }, status=200)
+        return _student_section_response(rollno, 'profile')
         
     except Exception as e:
-        print(f"Get student by rollno error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student by rollno error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -975,6 +932,7 @@ def update_student_by_rollno(request, rollno):
             if account_status in [s.value for s in AccountStatus]:
                 student.user.accountStatus = account_status
                 student.user.save()
+                revoke_user_tokens(student.user_id)
                 updated_fields.append('accountStatus')
             else:
                 return JsonResponse(
@@ -1003,9 +961,7 @@ def update_student_by_rollno(request, rollno):
             status=400
         )
     except Exception as e:
-        print(f"Update student by rollno error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update student by rollno error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -1021,43 +977,15 @@ def get_student_cocurricular_by_rollno(request, rollno):
     Accessible by: STUDENT (own data only), FACULTY, HOD, ADMIN
     """
     try:
-        from .models import Student, CoCurricular
-        
         # If student, verify they can only access their own data
         if request.user_role == 'STUDENT':
             if not hasattr(request, 'user_student') or request.user_student.rollNumber != rollno:
                 return JsonResponse({'message': 'You can only view your own co-curricular activities'}, status=403)
         
-        try:
-            student = Student.objects.get(rollNumber=rollno)
-        except Student.DoesNotExist:
-            return JsonResponse({'message': 'Student not found'}, status=404)
-        
-        activities = CoCurricular.objects.filter(student=student).order_by('-sem', '-date')
-        
-        activities_list = []
-        for activity in activities:
-            activities_list.append({
-                'id': str(activity.id),
-                'semester': activity.sem,
-                'date': activity.date.isoformat() if activity.date else None,
-                'eventDetails': activity.eventDetails,
-                'participationDetails': activity.participationDetails,
-                'awards': activity.awards
-            })
-        
-        return JsonResponse({
-            'studentId': str(student.id),
-            'studentName': student.name,
-            'rollNumber': student.rollNumber,
-            'activities': activities_list,
-            'total': len(activities_list)
-        }, status=200)
+        return _student_section_response(rollno, 'cocurricular')
         
     except Exception as e:
-        print(f"Get student co-curricular by rollno error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student co-curricular by rollno error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -1070,42 +998,10 @@ def get_student_projects_by_rollno(request, rollno):
     Accessible by: FACULTY, HOD, ADMIN
     """
     try:
-        from .models import Student, Project
-        
-        try:
-            student = Student.objects.get(rollNumber=rollno)
-        except Student.DoesNotExist:
-            return JsonResponse({'message': 'Student not found'}, status=404)
-        
-        projects = Project.objects.filter(student=student).order_by('-semester')
-        
-        projects_list = []
-        for project in projects:
-            projects_list.append({
-                'id': str(project.id),
-                'semester': project.semester,
-                'title': project.title,
-                'description': project.description,
-                'technologies': project.technologies or [],
-                'mentor': {
-                    'name': project.mentor.name if project.mentor else None,
-                    'employeeId': project.mentor.employeeId if project.mentor else None,
-                    'department': project.mentor.department if project.mentor else None
-                } if project.mentor else None
-            })
-        
-        return JsonResponse({
-            'studentId': str(student.id),
-            'studentName': student.name,
-            'rollNumber': student.rollNumber,
-            'projects': projects_list,
-            'total': len(projects_list)
-        }, status=200)
+        return _student_section_response(rollno, 'projects')
         
     except Exception as e:
-        print(f"Get student projects by rollno error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student projects by rollno error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -1118,39 +1014,10 @@ def get_student_internships_by_rollno(request, rollno):
     Accessible by: FACULTY, HOD, ADMIN
     """
     try:
-        from .models import Student, Internship
-        
-        try:
-            student = Student.objects.get(rollNumber=rollno)
-        except Student.DoesNotExist:
-            return JsonResponse({'message': 'Student not found'}, status=404)
-        
-        internships = Internship.objects.filter(student=student).order_by('-semester')
-        
-        internships_list = []
-        for internship in internships:
-            internships_list.append({
-                'id': str(internship.id),
-                'semester': internship.semester,
-                'type': internship.type,
-                'organisation': internship.organisation,
-                'stipend': internship.stipend,
-                'duration': internship.duration,
-                'location': internship.location
-            })
-        
-        return JsonResponse({
-            'studentId': str(student.id),
-            'studentName': student.name,
-            'rollNumber': student.rollNumber,
-            'internships': internships_list,
-            'total': len(internships_list)
-        }, status=200)
+        return _student_section_response(rollno, 'internships')
         
     except Exception as e:
-        print(f"Get student internships by rollno error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student internships by rollno error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -1163,72 +1030,10 @@ def get_student_career_by_rollno(request, rollno):
     Accessible by: FACULTY, HOD, ADMIN
     """
     try:
-        from .models import Student, CareerDetails
-        
-        try:
-            student = Student.objects.get(rollNumber=rollno)
-        except Student.DoesNotExist:
-            return JsonResponse({'message': 'Student not found'}, status=404)
-        
-        try:
-            career = CareerDetails.objects.get(student=student)
-            return JsonResponse({
-                'id': str(career.id),
-                'studentId': str(student.id),
-                'studentName': student.name,
-                'rollNumber': student.rollNumber,
-                'hobbies': career.hobbies or [],
-                'strengths': career.strengths or [],
-                'areasToImprove': career.areasToImprove or [],
-                'careerInterests': {
-                    'core': career.core or [],
-                    'it': career.it or [],
-                    'higherEducation': career.higherEducation or [],
-                    'startup': career.startup or [],
-                    'familyBusiness': career.familyBusiness or [],
-                    'otherInterests': career.otherInterests or []
-                },
-                'careerRankings': {
-                    'govt_sector_rank': career.govt_sector_rank,
-                    'core_rank': career.core_rank,
-                    'it_rank': career.it_rank,
-                    'higher_education_rank': career.higher_education_rank,
-                    'startup_rank': career.startup_rank,
-                    'family_business_rank': career.family_business_rank
-                }
-            }, status=200)
-        except CareerDetails.DoesNotExist:
-            return JsonResponse({
-                'id': None,
-                'studentId': str(student.id),
-                'studentName': student.name,
-                'rollNumber': student.rollNumber,
-                'hobbies': [],
-                'strengths': [],
-                'areasToImprove': [],
-                'careerInterests': {
-                    'core': [],
-                    'it': [],
-                    'higherEducation': [],
-                    'startup': [],
-                    'familyBusiness': [],
-                    'otherInterests': []
-                },
-                'careerRankings': {
-                    'govt_sector_rank': 1,
-                    'core_rank': 2,
-                    'it_rank': 3,
-                    'higher_education_rank': 4,
-                    'startup_rank': 5,
-                    'family_business_rank': 6
-                },
-                'message': 'No career details found for this student'
-            }, status=200)
+        return _student_section_response(rollno, 'career')
         
     except Exception as e:
-        print(f"Get student career by rollno error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student career by rollno error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -1241,113 +1046,10 @@ def get_student_problems_by_rollno(request, rollno):
     Accessible by: FACULTY, HOD, ADMIN
     """
     try:
-        from .models import Student, PersonalProblem
-        
-        try:
-            student = Student.objects.get(rollNumber=rollno)
-        except Student.DoesNotExist:
-            return JsonResponse({'message': 'Student not found'}, status=404)
-        
-        try:
-            problem = PersonalProblem.objects.get(student=student)
-            return JsonResponse({
-                'id': str(problem.id),
-                'studentId': str(student.id),
-                'studentName': student.name,
-                'rollNumber': student.rollNumber,
-                # Column 1
-                'stress': problem.stress,
-                'anger': problem.anger,
-                'emotional_problem': problem.emotional_problem,
-                'low_self_esteem': problem.low_self_esteem,
-                'examination_anxiety': problem.examination_anxiety,
-                'negative_thoughts': problem.negative_thoughts,
-                'exam_phobia': problem.exam_phobia,
-                'stammering': problem.stammering,
-                'financial_problems': problem.financial_problems,
-                'disturbed_relationship_with_teachers': problem.disturbed_relationship_with_teachers,
-                'disturbed_relationship_with_parents': problem.disturbed_relationship_with_parents,
-                # Column 2
-                'mood_swings': problem.mood_swings,
-                'stage_phobia': problem.stage_phobia,
-                'poor_concentration': problem.poor_concentration,
-                'poor_memory_problem': problem.poor_memory_problem,
-                'adjustment_problem': problem.adjustment_problem,
-                'frustration': problem.frustration,
-                'migraine_headache': problem.migraine_headache,
-                'relationship_problems': problem.relationship_problems,
-                'fear_of_public_speaking': problem.fear_of_public_speaking,
-                'disciplinary_problems_in_college': problem.disciplinary_problems_in_college,
-                'disturbed_peer_relationship_with_friends': problem.disturbed_peer_relationship_with_friends,
-                # Column 3
-                'worries_about_future': problem.worries_about_future,
-                'disappointment_with_course': problem.disappointment_with_course,
-                'time_management_problem': problem.time_management_problem,
-                'lack_of_expression': problem.lack_of_expression,
-                'poor_decisive_power': problem.poor_decisive_power,
-                'conflicts': problem.conflicts,
-                'low_self_motivation': problem.low_self_motivation,
-                'procrastination': problem.procrastination,
-                'suicidal_attempt_or_thought': problem.suicidal_attempt_or_thought,
-                'tobacco_or_alcohol_use': problem.tobacco_or_alcohol_use,
-                'poor_command_of_english': problem.poor_command_of_english,
-                # Special Issues
-                'economic_issues': problem.economic_issues,
-                'economic_issues_suggestion': problem.economic_issues_suggestion,
-                'economic_issues_outcome': problem.economic_issues_outcome,
-                'teenage_issues': problem.teenage_issues,
-                'teenage_issues_suggestion': problem.teenage_issues_suggestion,
-                'teenage_issues_outcome': problem.teenage_issues_outcome,
-                'health_issues': problem.health_issues,
-                'health_issues_suggestion': problem.health_issues_suggestion,
-                'health_issues_outcome': problem.health_issues_outcome,
-                'emotional_issues': problem.emotional_issues,
-                'emotional_issues_suggestion': problem.emotional_issues_suggestion,
-                'emotional_issues_outcome': problem.emotional_issues_outcome,
-                'psychological_issues': problem.psychological_issues,
-                'psychological_issues_suggestion': problem.psychological_issues_suggestion,
-                'psychological_issues_outcome': problem.psychological_issues_outcome,
-                'additional_comments': problem.additional_comments
-            }, status=200)
-        except PersonalProblem.DoesNotExist:
-            return JsonResponse({
-                'id': None,
-                'studentId': str(student.id),
-                'studentName': student.name,
-                'rollNumber': student.rollNumber,
-                'stress': None, 'anger': None, 'emotional_problem': None,
-                'low_self_esteem': None, 'examination_anxiety': None,
-                'negative_thoughts': None, 'exam_phobia': None,
-                'stammering': None, 'financial_problems': None,
-                'disturbed_relationship_with_teachers': None,
-                'disturbed_relationship_with_parents': None,
-                'mood_swings': None, 'stage_phobia': None,
-                'poor_concentration': None, 'poor_memory_problem': None,
-                'adjustment_problem': None, 'frustration': None,
-                'migraine_headache': None, 'relationship_problems': None,
-                'fear_of_public_speaking': None,
-                'disciplinary_problems_in_college': None,
-                'disturbed_peer_relationship_with_friends': None,
-                'worries_about_future': None, 'disappointment_with_course': None,
-                'time_management_problem': None, 'lack_of_expression': None,
-                'poor_decisive_power': None, 'conflicts': None,
-                'low_self_motivation': None, 'procrastination': None,
-                'suicidal_attempt_or_thought': None, 'tobacco_or_alcohol_use': None,
-                'poor_command_of_english': None,
-                # Special Issues
-                'economic_issues': None, 'economic_issues_suggestion': None, 'economic_issues_outcome': None,
-                'teenage_issues': None, 'teenage_issues_suggestion': None, 'teenage_issues_outcome': None,
-                'health_issues': None, 'health_issues_suggestion': None, 'health_issues_outcome': None,
-                'emotional_issues': None, 'emotional_issues_suggestion': None, 'emotional_issues_outcome': None,
-                'psychological_issues': None, 'psychological_issues_suggestion': None, 'psychological_issues_outcome': None,
-                'additional_comments': None,
-                'message': 'No personal problems data found for this student'
-            }, status=200)
+        return _student_section_response(rollno, 'problems')
         
     except Exception as e:
-        print(f"Get student problems by rollno error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student problems by rollno error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -1356,69 +1058,45 @@ def get_student_problems_by_rollno(request, rollno):
 @require_role(['FACULTY', 'HOD', 'ADMIN'])
 def get_student_mentoring_by_rollno(request, rollno):
     """
-    Get student's mentoring details by roll number
+    Get student's mentoring details by roll number, with a timeline merging legacy meetings
+    and group meeting attendance/reviews (newest first)
+    Query params:
+        - cursor: Optional - nextCursor of the previous page, or a date (YYYY-MM-DD) to list
+          timeline entries before that day
+        - limit: Optional - max timeline entries per page (default all)
+    With cursor or limit, mentorships carry totalMeetings but not their meetings list (those
+    are paged through the timeline)
     Accessible by: FACULTY, HOD, ADMIN
     """
     try:
-        from .models import Student, Mentorship, Meeting
+        from .models import Student
+        from .student_profile import load_student, mentoring_data, parse_timeline_cursor
+        
+        cursor = request.GET.get('cursor')
+        limit = request.GET.get('limit')
+        if cursor is None and limit is None:
+            return _student_section_response(rollno, 'mentoring')
         
         try:
-            student = Student.objects.get(rollNumber=rollno)
+            cursor = parse_timeline_cursor(cursor) if cursor else None
+        except ValueError:
+            return JsonResponse({'message': 'Invalid cursor'}, status=400)
+        try:
+            limit = int(limit) if limit else None
+        except ValueError:
+            return JsonResponse({'message': 'limit must be a number'}, status=400)
+        if limit is not None and limit < 1:
+            return JsonResponse({'message': 'limit must be at least 1'}, status=400)
+        
+        try:
+            student = load_student(rollno, ['mentoring'], timeline_page=(cursor, limit))
         except Student.DoesNotExist:
             return JsonResponse({'message': 'Student not found'}, status=404)
         
-        # Get all mentorships for this student
-        mentorships = Mentorship.objects.filter(student=student).select_related('faculty', 'faculty__user').order_by('-is_active', '-start_date')
-        
-        mentorships_list = []
-        for mentorship in mentorships:
-            # Get meetings for this mentorship
-            meetings = Meeting.objects.filter(mentorship=mentorship).order_by('-date', '-time')
-            meetings_list = []
-            for meeting in meetings:
-                meetings_list.append({
-                    'id': str(meeting.id),
-                    'date': meeting.date.isoformat() if meeting.date else None,
-                    'time': meeting.time.strftime('%H:%M') if meeting.time else None,
-                    'description': meeting.description,
-                    'status': meeting.status,
-                    'feedback': meeting.facultyReview,
-                    'remarks': None
-                })
-            
-            mentorships_list.append({
-                'id': str(mentorship.id),
-                'faculty': {
-                    'id': str(mentorship.faculty.id),
-                    'name': mentorship.faculty.name,
-                    'employeeId': mentorship.faculty.employeeId,
-                    'department': mentorship.faculty.department,
-                    'email': mentorship.faculty.collegeEmail,
-                    'phone': mentorship.faculty.phone1
-                },
-                'startDate': mentorship.start_date.isoformat() if mentorship.start_date else None,
-                'endDate': mentorship.end_date.isoformat() if mentorship.end_date else None,
-                'isActive': mentorship.is_active,
-                'meetings': meetings_list,
-                'totalMeetings': len(meetings_list)
-            })
-        
-        # Get active mentorship
-        active_mentorship = next((m for m in mentorships_list if m['isActive']), None)
-        
-        return JsonResponse({
-            'studentId': str(student.id),
-            'studentName': student.name,
-            'rollNumber': student.rollNumber,
-            'activeMentorship': active_mentorship,
-            'mentorships': mentorships_list,
-            'totalMentorships': len(mentorships_list)
-        }, status=200)
+        return JsonResponse(mentoring_data(student, cursor, limit), status=200)
         
     except Exception as e:
-        print(f"Get student mentoring by rollno error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student mentoring by rollno error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -1431,88 +1109,86 @@ def get_student_academic_by_rollno(request, rollno):
     Accessible by: FACULTY, HOD, ADMIN
     """
     try:
-        from .models import Student, Semester, StudentSubject
+        return _student_section_response(rollno, 'academic')
+        
+    except Exception as e:
+        logger.exception("Get student academic by rollno error: %s", e)
+        return JsonResponse({'message': 'Server error'}, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@require_role(['FACULTY', 'HOD', 'ADMIN'])
+def get_student_bundle_by_rollno(request, rollno):
+    """
+    Get several sections of a student's detail page in one call
+    Query params:
+        - include: Optional comma-separated sections (profile, projects, internships, career,
+          problems, mentoring, academic, cocurricular); default all
+    Each section has the same shape as its own api/department/student/<rollno>/<section> endpoint.
+    Accessible by: FACULTY, HOD, ADMIN
+    """
+    try:
+        from .models import Student
+        from .student_profile import SECTIONS, build_sections
+        
+        include = request.GET.get('include')
+        if include:
+            sections = list(dict.fromkeys(s.strip() for s in include.split(',') if s.strip()))
+            invalid = [s for s in sections if s not in SECTIONS]
+            if invalid:
+                return JsonResponse(
+                    {'message': f'Invalid include {invalid}. Valid values: {list(SECTIONS)}'},
+                    status=400
+                )
+        else:
+            sections = list(SECTIONS)
         
         try:
-            student = Student.objects.get(rollNumber=rollno)
+            data = build_sections(rollno, sections)
         except Student.DoesNotExist:
             return JsonResponse({'message': 'Student not found'}, status=404)
         
-        # Get all semesters for this student
-        semesters = Semester.objects.filter(student=student).order_by('semester')
-        
-        semesters_list = []
-        latest_cgpa = None
-        
-        for sem in semesters:
-            # Get subjects for this semester via StudentSubject
-            student_subjects = StudentSubject.objects.filter(
-                student=student, 
-                semester=sem
-            ).select_related('subject')
-            
-            subjects_list = []
-            for ss in student_subjects:
-                subjects_list.append({
-                    'subjectCode': ss.subject.subjectCode,
-                    'subjectName': ss.subject.subjectName,
-                    'credits': ss.subject.credits,
-                    'grade': ss.grade
-                })
-            
-            semesters_list.append({
-                'semester': sem.semester,
-                'sgpa': float(sem.sgpa) if sem.sgpa else None,
-                'cgpa': float(sem.cgpa) if sem.cgpa else None,
-                'subjects': subjects_list,
-                'totalCredits': sum(s['credits'] for s in subjects_list)
-            })
-            
-            if sem.cgpa:
-                latest_cgpa = float(sem.cgpa)
-        
         return JsonResponse({
-            'studentId': str(student.id),
-            'studentName': student.name,
-            'rollNumber': student.rollNumber,
-            'program': student.program,
-            'branch': student.branch,
-            'currentYear': student.year,
-            'latestCGPA': latest_cgpa,
-            'semesters': semesters_list,
-            'totalSemesters': len(semesters_list),
-            'preAdmission': {
-                'xMarks': student.xMarks,
-                'xiiMarks': student.xiiMarks,
-                'jeeMains': student.jeeMains,
-                'jeeAdvanced': student.jeeAdvanced
-            }
+            'rollNumber': rollno,
+            'sections': data
         }, status=200)
         
     except Exception as e:
-        print(f"Get student academic by rollno error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student bundle by rollno error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
 @require_role(['HOD', 'ADMIN'])
+@memoize_view(
+    'faculty-list',
+    getattr(settings, 'FACULTY_LIST_TTL', 60),
+    lambda request: [INSTITUTION, resource_namespace('faculty-list')]
+)
 def get_faculty(request):
     """
     Get all faculty or filter by department
     Query params:
         - department: Optional (CSE, ECE, EEE, MECH, CIVIL, BIO-TECH, MME, CHEM)
         - active: Optional (true/false) - filter by active status
+        - sortBy: Optional (name, load, mentorships, lastMeeting) - default name;
+          load is the current mentee count
+        - sortOrder: Optional (asc, desc) - default asc
+        - page, limit: Optional - paginate the list (all faculty when neither is given)
     Accessible by: HOD, ADMIN only
     """
     try:
-        from .models import Faculty, Department
+        from .models import Faculty, Department, GroupMeeting, MeetingStatus
+        from django.db.models import Count, F, OuterRef, Q, Subquery
         
         # Get query parameters
         department = request.GET.get('department')
         active = request.GET.get('active')
+        sort_by = request.GET.get('sortBy', 'name')
+        sort_order = request.GET.get('sortOrder', 'asc')
+        paginate = 'page' in request.GET or 'limit' in request.GET
         
         # Validate department if provided
         if department:
@@ -1523,6 +1199,26 @@ def get_faculty(request):
                     status=400
                 )
         
+        sort_fields = {
+            'name': 'name',
+            'load': 'current_mentee_count',
+            'mentorships': 'total_mentorships',
+            'lastMeeting': 'last_meeting_date'
+        }
+        if sort_by not in sort_fields:
+            return JsonResponse(
+                {'message': f'Invalid sortBy. Valid values: {list(sort_fields)}'},
+                status=400
+            )
+        
+        try:
+            page = int(request.GET.get('page', 1))
+            limit = int(request.GET.get('limit', 50))
+        except ValueError:
+            return JsonResponse({'message': 'page and limit must be numbers'}, status=400)
+        if page < 1 or limit < 1:
+            return JsonResponse({'message': 'page and limit must be at least 1'}, status=400)
+        
         # Build query
         faculty_query = Faculty.objects.all()
         
@@ -1535,14 +1231,35 @@ def get_faculty(request):
             is_active = active.lower() == 'true'
             faculty_query = faculty_query.filter(isActive=is_active)
         
-        # Execute query and format response
-        faculty_list = faculty_query.select_related('user').order_by('name')
+        total_query = faculty_query
+        
+        # Mentee counts in the same query; the last meeting is a correlated subquery so it
+        # does not multiply the mentorship join
+        last_meeting = GroupMeeting.objects.filter(
+            faculty=OuterRef('pk'),
+            status=MeetingStatus.COMPLETED
+        ).order_by('-date').values('date')[:1]
+        faculty_query = faculty_query.annotate(
+            current_mentee_count=Count('mentorships', filter=Q(mentorships__is_active=True)),
+            total_mentorships=Count('mentorships'),
+            last_meeting_date=Subquery(last_meeting)
+        )
+        
+        order_field = sort_fields[sort_by]
+        if sort_order == 'desc':
+            ordering = [F(order_field).desc(nulls_last=True)]
+        else:
+            ordering = [F(order_field).asc(nulls_last=True)]
+        faculty_list = faculty_query.select_related('user').order_by(*ordering, 'name', 'id')
+        
+        # Pagination
+        if paginate:
+            total_count = total_query.count()
+            offset = (page - 1) * limit
+            faculty_list = faculty_list[offset:offset + limit]
         
         result = []
         for faculty in faculty_list:
-            # Get current mentee count
-            mentee_count = faculty.mentorships.filter(is_active=True).count()
-            
             result.append({
                 'id': str(faculty.id),
                 'employeeId': faculty.employeeId,
@@ -1561,7 +1278,9 @@ def get_faculty(request):
                 'btech': faculty.btech,
                 'mtech': faculty.mtech,
                 'phd': faculty.phd,
-                'currentMenteeCount': mentee_count
+                'currentMenteeCount': faculty.current_mentee_count,
+                'totalMentorships': faculty.total_mentorships,
+                'lastMeetingDate': faculty.last_meeting_date.isoformat() if faculty.last_meeting_date else None
             })
         
         response_data = {
@@ -1570,6 +1289,14 @@ def get_faculty(request):
             'faculty': result
         }
         
+        if paginate:
+            response_data['pagination'] = {
+                'page': page,
+                'limit': limit,
+                'totalCount': total_count,
+                'totalPages': (total_count + limit - 1) // limit
+            }
+        
         # Add filter info if department was specified
         if department:
             response_data['department'] = department
@@ -1577,9 +1304,7 @@ def get_faculty(request):
         return JsonResponse(response_data, status=200)
         
     except Exception as e:
-        print(f"Get faculty error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get faculty error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -1653,9 +1378,7 @@ def get_faculty_by_id(request, faculty_id):
         return JsonResponse(result, status=200)
         
     except Exception as e:
-        print(f"Get faculty by ID error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get faculty by ID error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -1753,9 +1476,7 @@ def get_faculty_mentor_details(request, faculty_id):
         return JsonResponse(result, status=200)
         
     except Exception as e:
-        print(f"Get faculty mentor details error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get faculty mentor details error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -1788,10 +1509,7 @@ def schedule_meetings(request):
                 status=400
             )
         
-        from .models import Mentorship, Meeting, MeetingStatus, HOD
-        
-        # Get HOD user ID from request
-        hod_user_id = request.user_id
+        from .models import Mentorship, Meeting, MeetingStatus
         
         # Find the mentorship
         try:
@@ -1803,13 +1521,8 @@ def schedule_meetings(request):
             )
         
         # Verify HOD is authorized for this department
-        try:
-            hod = HOD.objects.get(
-                user_id=hod_user_id,
-                department=mentorship.department,
-                endDate__isnull=True
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None or hod.department != mentorship.department:
             return JsonResponse(
                 {'message': f'You are not authorized to schedule meetings for {mentorship.department} department'},
                 status=403
@@ -1900,9 +1613,7 @@ def schedule_meetings(request):
             status=400
         )
     except Exception as e:
-        print(f"Schedule meetings error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Schedule meetings error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -1921,6 +1632,8 @@ def schedule_group_meetings(request):
         - year: Academic year (1-4)
         - semester: Semester (1-8)
         - meetings: Array of {date: "YYYY-MM-DD", time: "HH:MM", description: "optional"}
+          and/or recurrence: {startDate, time, weekday, intervalWeeks, weeks | endDate | occurrences, description}
+          (see core.meetings.expand_recurring_schedule)
     """
     try:
         data = json.loads(request.body)
@@ -1928,6 +1641,7 @@ def schedule_group_meetings(request):
         year = data.get('year')
         semester = data.get('semester')
         meetings_data = data.get('meetings')
+        recurrence = data.get('recurrence')
         
         # Validate required fields
         if not faculty_id or not year or not semester:
@@ -1936,16 +1650,14 @@ def schedule_group_meetings(request):
                 status=400
             )
         
-        if not meetings_data or not isinstance(meetings_data, list) or len(meetings_data) == 0:
+        if not recurrence and (not meetings_data or not isinstance(meetings_data, list) or len(meetings_data) == 0):
             return JsonResponse(
-                {'message': 'meetings must be a non-empty array'},
+                {'message': 'meetings must be a non-empty array (or provide recurrence)'},
                 status=400
             )
         
-        from .models import Faculty, Mentorship, GroupMeeting, GroupMeetingStudent, MeetingStatus, HOD
-        from datetime import datetime
-        
-        hod_user_id = request.user_id
+        from .models import Faculty, Mentorship, MeetingStatus
+        from .meetings import parse_meeting_entries, expand_recurring_schedule, create_group_meetings
         
         # Get faculty
         try:
@@ -1954,52 +1666,31 @@ def schedule_group_meetings(request):
             return JsonResponse({'message': 'Faculty not found'}, status=404)
         
         # Verify HOD is authorized for this department
-        try:
-            hod = HOD.objects.get(
-                user_id=hod_user_id,
-                department=faculty.department,
-                endDate__isnull=True
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None or hod.department != faculty.department:
             return JsonResponse(
                 {'message': f'You are not authorized for {faculty.department} department'},
                 status=403
             )
         
         # Get all active mentorships in this group (to get the students)
-        mentorships = Mentorship.objects.filter(
+        student_ids = list(Mentorship.objects.filter(
             faculty=faculty,
             year=year,
             semester=semester,
             is_active=True
-        ).select_related('student')
+        ).values_list('student_id', flat=True))
         
-        if not mentorships.exists():
+        if not student_ids:
             return JsonResponse(
                 {'message': 'No active mentorships found in this group'},
                 status=404
             )
         
-        # Parse meeting dates
-        parsed_meetings = []
-        for meeting_data in meetings_data:
-            meeting_date = meeting_data.get('date')
-            meeting_time = meeting_data.get('time')
-            description = meeting_data.get('description', '')
-            
-            if not meeting_date or not meeting_time:
-                continue
-            
-            try:
-                parsed_date = datetime.strptime(meeting_date, '%Y-%m-%d').date()
-                parsed_time = datetime.strptime(meeting_time, '%H:%M').time()
-                parsed_meetings.append({
-                    'date': parsed_date,
-                    'time': parsed_time,
-                    'description': description
-                })
-            except ValueError:
-                continue
+        # Parse explicit meeting dates and expand any recurring schedule
+        parsed_meetings = parse_meeting_entries(meetings_data if isinstance(meetings_data, list) else [])
+        if recurrence:
+            parsed_meetings.extend(expand_recurring_schedule(recurrence))
         
         if not parsed_meetings:
             return JsonResponse(
@@ -2007,55 +1698,35 @@ def schedule_group_meetings(request):
                 status=400
             )
         
-        # Create GroupMeeting records and student entries
-        students = [m.student for m in mentorships]
-        total_meetings_created = 0
-        
         for meeting_data in parsed_meetings:
-            # Create the group meeting
-            group_meeting = GroupMeeting.objects.create(
-                faculty=faculty,
-                department=faculty.department,
-                year=year,
-                semester=semester,
-                date=meeting_data['date'],
-                time=meeting_data['time'],
-                description=meeting_data['description'],
-                status=MeetingStatus.YET_TO_DONE
-            )
-            
-            # Create student entries for this meeting
-            for student in students:
-                GroupMeetingStudent.objects.create(
-                    group_meeting=group_meeting,
-                    student=student,
-                    review='',
-                    attended=True
-                )
-            
-            total_meetings_created += 1
+            meeting_data['status'] = MeetingStatus.YET_TO_DONE
+        
+        # Create GroupMeeting records and student entries in bulk
+        group_meetings = create_group_meetings(faculty, year, semester, student_ids, parsed_meetings)
+        total_meetings_created = len(group_meetings)
         
         return JsonResponse({
-            'message': f'Scheduled {total_meetings_created} group meeting(s) for {len(students)} student(s)',
+            'message': f'Scheduled {total_meetings_created} group meeting(s) for {len(student_ids)} student(s)',
             'group': {
                 'facultyId': str(faculty.id),
                 'facultyName': faculty.name,
                 'year': year,
                 'semester': semester,
-                'studentCount': len(students)
+                'studentCount': len(student_ids)
             },
             'results': {
-                'totalStudents': len(students),
-                'totalMeetingsCreated': total_meetings_created
+                'totalStudents': len(student_ids),
+                'totalMeetingsCreated': total_meetings_created,
+                'meetingDates': [gm.date.isoformat() for gm in group_meetings]
             }
         }, status=201)
         
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON in request body'}, status=400)
+    except ValueError as e:
+        return JsonResponse({'message': str(e)}, status=400)
     except Exception as e:
-        print(f"Schedule group meetings error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Schedule group meetings error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -2145,9 +1816,7 @@ def get_student_mentor_details(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get mentor details error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get mentor details error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2165,13 +1834,8 @@ def get_student_about(request):
     Returns all details from the Student table
     """
     try:
-        user_id = request.user_id
-        
-        from .models import Student
-        
-        try:
-            student = Student.objects.select_related('user').get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -2223,9 +1887,7 @@ def get_student_about(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get student about error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student about error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2240,13 +1902,10 @@ def get_student_career_details(request):
     Get student's career details including hobbies, strengths, career interests
     """
     try:
-        user_id = request.user_id
+        from .models import CareerDetails
         
-        from .models import Student, CareerDetails
-        
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -2304,9 +1963,7 @@ def get_student_career_details(request):
             }, status=200)
         
     except Exception as e:
-        print(f"Get career details error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get career details error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2321,13 +1978,10 @@ def get_student_internships(request):
     Get all internships for the student
     """
     try:
-        user_id = request.user_id
+        from .models import Internship
         
-        from .models import Student, Internship
-        
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -2354,9 +2008,7 @@ def get_student_internships(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get internships error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get internships error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2371,13 +2023,10 @@ def get_student_personal_problems(request):
     Get student's personal problems/challenges
     """
     try:
-        user_id = request.user_id
+        from .models import PersonalProblem
         
-        from .models import Student, PersonalProblem
-        
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -2487,9 +2136,7 @@ def get_student_personal_problems(request):
             }, status=200)
         
     except Exception as e:
-        print(f"Get personal problems error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get personal problems error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2504,13 +2151,10 @@ def get_student_projects(request):
     Get all projects for the student
     """
     try:
-        user_id = request.user_id
+        from .models import Project
         
-        from .models import Student, Project
-        
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -2540,9 +2184,7 @@ def get_student_projects(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get projects error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get projects error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2557,13 +2199,10 @@ def get_student_academic(request):
     Get student's academic details including all semesters, subjects, and grades
     """
     try:
-        user_id = request.user_id
+        from .models import Semester, StudentSubject
         
-        from .models import Student, Semester, StudentSubject
-        
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -2618,9 +2257,7 @@ def get_student_academic(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get academic details error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get academic details error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2635,13 +2272,10 @@ def get_student_requests(request):
     Get all requests made by the student
     """
     try:
-        user_id = request.user_id
+        from .models import Request
         
-        from .models import Student, Request
-        
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -2686,9 +2320,7 @@ def get_student_requests(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get student requests error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student requests error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2704,14 +2336,12 @@ def create_internship_request(request):
     Request will be pending until approved by mentor/HOD
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, Request, RequestType, Mentorship
+        from .models import Request, RequestType, Mentorship
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -2748,6 +2378,7 @@ def create_internship_request(request):
             request_data=internship_data,
             remarks=data.get('remarks', '')
         )
+        _request_stats_changed(new_request)
         
         return JsonResponse({
             'message': 'Internship request submitted successfully',
@@ -2757,9 +2388,7 @@ def create_internship_request(request):
         }, status=201)
         
     except Exception as e:
-        print(f"Create internship request error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Create internship request error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2775,14 +2404,12 @@ def create_project_request(request):
     Request will be pending until approved by mentor/HOD
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, Request, RequestType, Mentorship, Faculty
+        from .models import Request, RequestType, Mentorship, Faculty
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -2829,6 +2456,7 @@ def create_project_request(request):
             request_data=project_data,
             remarks=data.get('remarks', '')
         )
+        _request_stats_changed(new_request)
         
         return JsonResponse({
             'message': 'Project request submitted successfully',
@@ -2838,9 +2466,7 @@ def create_project_request(request):
         }, status=201)
         
     except Exception as e:
-        print(f"Create project request error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Create project request error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -2856,15 +2482,13 @@ def approve_request(request, request_id):
     Creates the actual record and links it to the student
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body) if request.body else {}
         
         from .models import Request, RequestStatus, Faculty, Internship, Project
         from django.contrib.contenttypes.models import ContentType
         
-        try:
-            faculty = Faculty.objects.get(user__id=user_id)
-        except Faculty.DoesNotExist:
+        faculty = request.actor.faculty
+        if faculty is None:
             return JsonResponse(
                 {'message': 'Faculty profile not found'},
                 status=404
@@ -2885,7 +2509,7 @@ def approve_request(request, request_id):
             )
         
         # Check if faculty is assigned to this request or is HOD
-        user = User.objects.get(id=user_id)
+        user = request.actor.user
         is_hod = user.role == 'HOD'
         is_assigned = req.assigned_to and req.assigned_to.id == faculty.id
         
@@ -2995,6 +2619,7 @@ def approve_request(request, request_id):
         req.status = RequestStatus.APPROVED
         req.feedback = data.get('feedback', 'Approved')
         req.save()
+        _request_stats_changed(req)
         
         return JsonResponse({
             'message': f'{req.type.replace("_", " ").capitalize()} approved successfully',
@@ -3004,9 +2629,7 @@ def approve_request(request, request_id):
         }, status=200)
         
     except Exception as e:
-        print(f"Approve request error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Approve request error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -3021,14 +2644,12 @@ def reject_request(request, request_id):
     Reject a pending request
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body) if request.body else {}
         
-        from .models import Request, RequestStatus, Faculty
+        from .models import Request, RequestStatus
         
-        try:
-            faculty = Faculty.objects.get(user__id=user_id)
-        except Faculty.DoesNotExist:
+        faculty = request.actor.faculty
+        if faculty is None:
             return JsonResponse(
                 {'message': 'Faculty profile not found'},
                 status=404
@@ -3049,7 +2670,7 @@ def reject_request(request, request_id):
             )
         
         # Check if faculty is assigned to this request or is HOD
-        user = User.objects.get(id=user_id)
+        user = request.actor.user
         is_hod = user.role == 'HOD'
         is_assigned = req.assigned_to and req.assigned_to.id == faculty.id
         
@@ -3063,6 +2684,7 @@ def reject_request(request, request_id):
         req.status = RequestStatus.REJECTED
         req.feedback = data.get('feedback', 'Rejected')
         req.save()
+        _request_stats_changed(req)
         
         return JsonResponse({
             'message': 'Request rejected',
@@ -3071,9 +2693,7 @@ def reject_request(request, request_id):
         }, status=200)
         
     except Exception as e:
-        print(f"Reject request error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Reject request error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -3088,19 +2708,16 @@ def get_pending_requests(request):
     Get all pending requests assigned to this faculty/HOD
     """
     try:
-        user_id = request.user_id
+        from .models import Request, RequestStatus
         
-        from .models import Request, RequestStatus, Faculty
-        
-        try:
-            faculty = Faculty.objects.get(user__id=user_id)
-        except Faculty.DoesNotExist:
+        faculty = request.actor.faculty
+        if faculty is None:
             return JsonResponse(
                 {'message': 'Faculty profile not found'},
                 status=404
             )
         
-        user = User.objects.get(id=user_id)
+        user = request.actor.user
         is_hod = user.role == 'HOD'
         
         # HOD can see all requests in their department
@@ -3144,9 +2761,7 @@ def get_pending_requests(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get pending requests error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get pending requests error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -3214,9 +2829,7 @@ def get_student_mentors(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get student mentors error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student mentors error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -3299,9 +2912,7 @@ def get_student_mentor_profile(request, faculty_id):
         return JsonResponse(result, status=200)
         
     except Exception as e:
-        print(f"Get student mentor profile error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student mentor profile error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -3383,9 +2994,7 @@ def get_mentorship_meetings(request, mentorship_id):
         }, status=200)
         
     except Exception as e:
-        print(f"Get mentorship meetings error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get mentorship meetings error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -3395,6 +3004,7 @@ def get_mentorship_meetings(request, mentorship_id):
 @csrf_exempt
 @require_http_methods(["GET"])
 @require_role('ADMIN')
+@conditional_get('hods')
 def get_hods(request):
     """
     Get all HODs with their details
@@ -3428,9 +3038,7 @@ def get_hods(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get HODs error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get HODs error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -3510,6 +3118,7 @@ def assign_hod(request):
             # Revert old HOD's role to FACULTY
             current_hod.user.role = 'FACULTY'
             current_hod.user.save()
+            revoke_user_tokens(current_hod.user_id)
         
         # Create new HOD record
         new_hod = HOD.objects.create(
@@ -3522,6 +3131,8 @@ def assign_hod(request):
         # Update new HOD's role
         faculty.user.role = 'HOD'
         faculty.user.save()
+        revoke_user_tokens(faculty.user_id)
+        invalidate_dashboard_stats()
         
         response_data = {
             'message': f'{faculty.name} is now the HOD of {department}',
@@ -3543,9 +3154,7 @@ def assign_hod(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Assign HOD error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Assign HOD error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -3583,6 +3192,8 @@ def remove_hod(request, hod_id):
         # Revert role to FACULTY
         hod.user.role = 'FACULTY'
         hod.user.save()
+        revoke_user_tokens(hod.user_id)
+        invalidate_dashboard_stats()
         
         return JsonResponse({
             'message': f'{hod.faculty.name} is no longer HOD of {hod.department}',
@@ -3595,9 +3206,7 @@ def remove_hod(request, hod_id):
         }, status=200)
         
     except Exception as e:
-        print(f"Remove HOD error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Remove HOD error: %s", e)
         return JsonResponse(
             {'message': 'Server error'},
             status=500
@@ -3612,24 +3221,62 @@ def remove_hod(request, hod_id):
 def get_hod_mentorships(request):
     """
     Get all mentorships in HOD's department with stats and unassigned students
+    Query params:
+        - status: Optional (active, past) - only current or only past mentees
+        - summary: Optional (true) - only stats and per-faculty mentee counts
+        - limit: Optional - faculty groups per page (default all)
+        - cursor: Optional - nextCursor of the previous page
+        - menteeLimit: Optional - current and past mentees listed per group (default all,
+          HOD_MENTEES_PAGE_SIZE with limit)
+        - facultyId: Optional - only this faculty's group
+        - menteeCursor: Optional - with facultyId, a group's currentMenteesNextCursor or
+          pastMenteesNextCursor; continues that list only
+        - unassignedLimit: Optional - unassigned students listed (default all,
+          HOD_MENTEES_PAGE_SIZE with limit)
+        - unassignedCursor: Optional - unassignedNextCursor of the previous response
     Returns:
         - stats: Total students, assigned, unassigned, total faculty, active mentors
-        - mentorships: List of current/past mentorships grouped by faculty
-        - unassignedStudents: Students without an active mentor
+        - mentorships: List of current/past mentorships grouped by faculty (ordered by faculty name),
+          each list newest first with its next cursor (null when complete)
+        - unassignedStudents: Students without an active mentor (first page or with unassignedCursor)
+        - unassignedNextCursor: Cursor of the next unassigned students, or null
+        - nextCursor: Cursor of the next page of faculty groups, or null
     """
     try:
-        from .models import HOD, Mentorship, Faculty, Student
-        from django.db.models import Count, Q
-        
-        hod_user_id = request.user_id
+        import uuid
+        from .models import Mentorship, Faculty, Student
+        from django.core.exceptions import ValidationError
+        from django.db.models import Count, F, Q, Window
+        from django.db.models.functions import Coalesce, RowNumber
+        
+        status = request.GET.get('status')
+        summary = request.GET.get('summary', '').lower() == 'true'
+        cursor = request.GET.get('cursor')
+        only_faculty = request.GET.get('facultyId')
+        mentee_cursor = request.GET.get('menteeCursor')
+        
+        if status not in (None, 'active', 'past'):
+            return JsonResponse({'message': 'status must be active or past'}, status=400)
+        if mentee_cursor and not only_faculty:
+            return JsonResponse({'message': 'menteeCursor requires facultyId'}, status=400)
+        numbers = {}
+        for param in ('limit', 'menteeLimit', 'unassignedLimit', 'unassignedCursor'):
+            try:
+                numbers[param] = int(request.GET[param]) if request.GET.get(param) else None
+            except ValueError:
+                return JsonResponse({'message': f'{param} must be a number'}, status=400)
+            if param != 'unassignedCursor' and numbers[param] is not None and numbers[param] < 1:
+                return JsonResponse({'message': f'{param} must be at least 1'}, status=400)
+        limit = numbers['limit']
+        unassigned_cursor = numbers['unassignedCursor']
+        # Paged responses bound every list, not only the faculty groups
+        page_size = getattr(settings, 'HOD_MENTEES_PAGE_SIZE', 50) if limit else None
+        mentee_limit = numbers['menteeLimit'] or page_size
+        unassigned_limit = numbers['unassignedLimit'] or page_size
         
         # Get HOD and their department
-        try:
-            hod = HOD.objects.select_related('faculty').get(
-                user_id=hod_user_id,
-                endDate__isnull=True
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None:
             return JsonResponse({'message': 'Active HOD profile not found'}, status=404)
         
         department = hod.department
@@ -3638,44 +3285,126 @@ def get_hod_mentorships(request):
         total_students = Student.objects.filter(branch=department).count()
         
         # Students with active mentorship
-        assigned_student_ids = Mentorship.objects.filter(
-            department=department,
-            is_active=True
-        ).values_list('student_id', flat=True)
-        assigned_count = len(set(assigned_student_ids))
-        unassigned_count = total_students - assigned_count
+        unassigned_students = Student.objects.filter(branch=department, currentMentor__isnull=True)
+        unassigned_count = unassigned_students.count()
+        assigned_count = total_students - unassigned_count
+        
+        # Faculty count and active mentors (faculty with at least one active mentorship)
+        faculty_stats = Faculty.objects.filter(department=department, isActive=True).aggregate(
+            total=Count('id', distinct=True),
+            active_mentors=Count('id', filter=Q(mentorships__is_active=True), distinct=True)
+        )
         
-        # Faculty count
-        total_faculty = Faculty.objects.filter(department=department, isActive=True).count()
+        stats = {
+            'totalStudents': total_students,
+            'assignedStudents': assigned_count,
+            'unassignedStudents': unassigned_count,
+            'totalFaculty': faculty_stats['total'],
+            'activeMentors': faculty_stats['active_mentors']
+        }
         
-        # Active mentors (faculty with at least one active mentorship)
-        active_mentors = Faculty.objects.filter(
-            department=department,
-            isActive=True,
-            mentorships__is_active=True
-        ).distinct().count()
+        # Faculty groups with their mentee counts, one aggregate row per faculty
+        groups = Mentorship.objects.filter(
+            department=department
+        ).values(
+            'faculty_id', 'faculty__name', 'faculty__employeeId'
+        ).annotate(
+            faculty_email=Coalesce('faculty__user__email', 'faculty__collegeEmail'),
+            active_count=Count('id', filter=Q(is_active=True)),
+            total_count=Count('id')
+        ).order_by('faculty__name', 'faculty_id')
+        
+        if status == 'active':
+            groups = groups.filter(active_count__gt=0)
+        elif status == 'past':
+            groups = groups.filter(total_count__gt=F('active_count'))
+        
+        if only_faculty:
+            try:
+                groups = groups.filter(faculty_id=uuid.UUID(only_faculty))
+            except ValueError:
+                return JsonResponse({'message': 'Invalid facultyId'}, status=400)
+        
+        if cursor:
+            try:
+                cursor_faculty = Faculty.objects.only('name').get(id=cursor)
+            except (Faculty.DoesNotExist, ValidationError):
+                return JsonResponse({'message': 'Invalid cursor'}, status=400)
+            groups = groups.filter(
+                Q(faculty__name__gt=cursor_faculty.name) |
+                Q(faculty__name=cursor_faculty.name, faculty_id__gt=cursor_faculty.id)
+            )
+        
+        groups = list(groups[:limit + 1] if limit else groups)
+        next_cursor = None
+        if limit and len(groups) > limit:
+            groups = groups[:limit]
+            next_cursor = str(groups[-1]['faculty_id'])
         
-        # Get all mentorships grouped by faculty
         mentorships_by_faculty = {}
+        for group in groups:
+            faculty_id = str(group['faculty_id'])
+            mentorships_by_faculty[faculty_id] = {
+                'facultyId': faculty_id,
+                'facultyName': group['faculty__name'],
+                'facultyEmail': group['faculty_email'],
+                'employeeId': group['faculty__employeeId'],
+                'activeMenteeCount': group['active_count'],
+                'totalMenteeCount': group['total_count']
+            }
         
+        if summary:
+            return JsonResponse({
+                'department': department,
+                'stats': stats,
+                'mentorshipsByFaculty': list(mentorships_by_faculty.values()),
+                'nextCursor': next_cursor
+            }, status=200)
+        
+        for group in mentorships_by_faculty.values():
+            group['currentMentees'] = []
+            group['pastMentees'] = []
+            group['currentMenteesNextCursor'] = None
+            group['pastMenteesNextCursor'] = None
+        
+        # Mentorships of this page's faculty only
         mentorships = Mentorship.objects.filter(
-            department=department
-        ).select_related('faculty', 'student', 'faculty__user', 'student__user').order_by('-start_date')
+            department=department,
+            faculty_id__in=[group['faculty_id'] for group in groups]
+        ).select_related('student', 'student__user').order_by('-start_date', '-id')
+        if status:
+            mentorships = mentorships.filter(is_active=status == 'active')
+        
+        if mentee_cursor:
+            try:
+                cursor_mentorship = Mentorship.objects.only('start_date', 'is_active').get(
+                    id=mentee_cursor, faculty_id=only_faculty, department=department
+                )
+            except (Mentorship.DoesNotExist, ValidationError):
+                return JsonResponse({'message': 'Invalid menteeCursor'}, status=400)
+            mentorships = mentorships.filter(
+                Q(start_date__lt=cursor_mentorship.start_date) |
+                Q(start_date=cursor_mentorship.start_date, id__lt=cursor_mentorship.id),
+                is_active=cursor_mentorship.is_active
+            )
+        
+        if mentee_limit:
+            # Newest mentee_limit + 1 rows of each group's current and past lists, ranked in SQL
+            mentorships = mentorships.annotate(
+                mentee_rank=Window(
+                    RowNumber(),
+                    partition_by=[F('faculty_id'), F('is_active')],
+                    order_by=[F('start_date').desc(), F('id').desc()]
+                )
+            ).filter(mentee_rank__lte=mentee_limit + 1)
         
         for mentorship in mentorships:
-            faculty_id = str(mentorship.faculty.id)
-            
-            if faculty_id not in mentorships_by_faculty:
-                mentorships_by_faculty[faculty_id] = {
-                    'facultyId': faculty_id,
-                    'facultyName': mentorship.faculty.name,
-                    'facultyEmail': mentorship.faculty.user.email if mentorship.faculty.user else mentorship.faculty.collegeEmail,
-                    'employeeId': mentorship.faculty.employeeId,
-                    'activeMenteeCount': 0,
-                    'totalMenteeCount': 0,
-                    'currentMentees': [],
-                    'pastMentees': []
-                }
+            faculty_id = str(mentorship.faculty_id)
+            mentees_key = 'currentMentees' if mentorship.is_active else 'pastMentees'
+            group = mentorships_by_faculty[faculty_id]
+            if mentee_limit and len(group[mentees_key]) == mentee_limit:
+                group[f'{mentees_key}NextCursor'] = group[mentees_key][-1]['mentorshipId']
+                continue
             
             mentee_data = {
                 'mentorshipId': str(mentorship.id),
@@ -3693,51 +3422,43 @@ def get_hod_mentorships(request):
                 'isActive': mentorship.is_active
             }
             
-            mentorships_by_faculty[faculty_id]['totalMenteeCount'] += 1
-            
-            if mentorship.is_active:
-                mentorships_by_faculty[faculty_id]['activeMenteeCount'] += 1
-                mentorships_by_faculty[faculty_id]['currentMentees'].append(mentee_data)
-            else:
-                mentorships_by_faculty[faculty_id]['pastMentees'].append(mentee_data)
-        
-        # Get unassigned students
-        unassigned_students = Student.objects.filter(
-            branch=department
-        ).exclude(
-            id__in=assigned_student_ids
-        ).select_related('user').order_by('rollNumber')
+            group[mentees_key].append(mentee_data)
         
+        # Get unassigned students (first page, or continuing their own cursor)
         unassigned_list = []
-        for student in unassigned_students:
-            unassigned_list.append({
-                'id': str(student.id),
-                'name': student.name,
-                'rollNumber': student.rollNumber,
-                'registrationNumber': student.registrationNumber,
-                'email': student.user.email if student.user else None,
-                'program': student.program,
-                'branch': student.branch,
-                'year': student.year
-            })
+        unassigned_next_cursor = None
+        if not cursor or unassigned_cursor is not None:
+            unassigned_page = unassigned_students.select_related('user').order_by('rollNumber')
+            if unassigned_cursor is not None:
+                unassigned_page = unassigned_page.filter(rollNumber__gt=unassigned_cursor)
+            if unassigned_limit:
+                unassigned_page = list(unassigned_page[:unassigned_limit + 1])
+                if len(unassigned_page) > unassigned_limit:
+                    unassigned_page = unassigned_page[:unassigned_limit]
+                    unassigned_next_cursor = unassigned_page[-1].rollNumber
+            for student in unassigned_page:
+                unassigned_list.append({
+                    'id': str(student.id),
+                    'name': student.name,
+                    'rollNumber': student.rollNumber,
+                    'registrationNumber': student.registrationNumber,
+                    'email': student.user.email if student.user else None,
+                    'program': student.program,
+                    'branch': student.branch,
+                    'year': student.year
+                })
         
         return JsonResponse({
             'department': department,
-            'stats': {
-                'totalStudents': total_students,
-                'assignedStudents': assigned_count,
-                'unassignedStudents': unassigned_count,
-                'totalFaculty': total_faculty,
-                'activeMentors': active_mentors
-            },
+            'stats': stats,
             'mentorshipsByFaculty': list(mentorships_by_faculty.values()),
-            'unassignedStudents': unassigned_list
+            'unassignedStudents': unassigned_list,
+            'unassignedNextCursor': unassigned_next_cursor,
+            'nextCursor': next_cursor
         }, status=200)
         
     except Exception as e:
-        print(f"Get HOD mentorships error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get HOD mentorships error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -3768,9 +3489,7 @@ def create_mentorship_meeting(request):
         if not meeting_time:
             return JsonResponse({'message': 'time is required'}, status=400)
         
-        from .models import Mentorship, Meeting, MeetingStatus, HOD
-        
-        hod_user_id = request.user_id
+        from .models import Mentorship, Meeting, MeetingStatus
         
         # Find the mentorship
         try:
@@ -3779,13 +3498,8 @@ def create_mentorship_meeting(request):
             return JsonResponse({'message': 'Mentorship not found'}, status=404)
         
         # Verify HOD is authorized for this department
-        try:
-            hod = HOD.objects.get(
-                user_id=hod_user_id,
-                department=mentorship.department,
-                endDate__isnull=True
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None or hod.department != mentorship.department:
             return JsonResponse(
                 {'message': f'You are not authorized to create meetings for {mentorship.department} department'},
                 status=403
@@ -3818,6 +3532,7 @@ def create_mentorship_meeting(request):
             description=description,
             status=status
         )
+        invalidate_dashboard_stats(student_ids=[mentorship.student_id], faculty_ids=[mentorship.faculty_id])
         
         return JsonResponse({
             'message': 'Meeting scheduled successfully',
@@ -3844,9 +3559,7 @@ def create_mentorship_meeting(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Create mentorship meeting error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Create mentorship meeting error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -3858,9 +3571,7 @@ def get_mentorship_details(request, mentorship_id):
     Get detailed information about a specific mentorship including all meetings
     """
     try:
-        from .models import Mentorship, Meeting, HOD
-        
-        hod_user_id = request.user_id
+        from .models import Mentorship, Meeting
         
         # Find the mentorship
         try:
@@ -3869,13 +3580,8 @@ def get_mentorship_details(request, mentorship_id):
             return JsonResponse({'message': 'Mentorship not found'}, status=404)
         
         # Verify HOD is authorized for this department
-        try:
-            hod = HOD.objects.get(
-                user_id=hod_user_id,
-                department=mentorship.department,
-                endDate__isnull=True
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None or hod.department != mentorship.department:
             return JsonResponse(
                 {'message': f'You are not authorized to view mentorships in {mentorship.department} department'},
                 status=403
@@ -3938,9 +3644,7 @@ def get_mentorship_details(request, mentorship_id):
         }, status=200)
         
     except Exception as e:
-        print(f"Get mentorship details error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get mentorship details error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -3952,9 +3656,8 @@ def end_mentorship(request, mentorship_id):
     End an active mentorship (mark as inactive)
     """
     try:
-        from .models import Mentorship, HOD
-        
-        hod_user_id = request.user_id
+        from .models import Mentorship
+        from .mentorship import sync_current_mentors
         
         # Find the mentorship
         try:
@@ -3963,13 +3666,8 @@ def end_mentorship(request, mentorship_id):
             return JsonResponse({'message': 'Mentorship not found'}, status=404)
         
         # Verify HOD is authorized for this department
-        try:
-            hod = HOD.objects.get(
-                user_id=hod_user_id,
-                department=mentorship.department,
-                endDate__isnull=True
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None or hod.department != mentorship.department:
             return JsonResponse(
                 {'message': f'You are not authorized to manage mentorships in {mentorship.department} department'},
                 status=403
@@ -3982,6 +3680,12 @@ def end_mentorship(request, mentorship_id):
         mentorship.is_active = False
         mentorship.end_date = datetime.now()
         mentorship.save()
+        sync_current_mentors([mentorship.student_id])
+        invalidate_dashboard_stats(
+            student_ids=[mentorship.student_id],
+            faculty_ids=[mentorship.faculty_id],
+            departments=[mentorship.department]
+        )
         
         return JsonResponse({
             'message': 'Mentorship ended successfully',
@@ -3994,9 +3698,7 @@ def end_mentorship(request, mentorship_id):
         }, status=200)
         
     except Exception as e:
-        print(f"End mentorship error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("End mentorship error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -4006,22 +3708,27 @@ def end_mentorship(request, mentorship_id):
 def transfer_mentorship_group(request):
     """
     Transfer all students from one faculty's mentorship group to another faculty.
-    This creates new mentorship records and marks the old ones as inactive.
+    This creates new mentorship records and marks the old ones as inactive, as one atomic operation.
     
     Required fields:
         - fromFacultyId: Current faculty UUID
         - toFacultyEmployeeId: New faculty employee ID
         - year: Academic year
         - semester: Semester
+    Optional fields:
+        - futureMeetings: 'none' (default), 'move' or 'copy' - what happens to the group's
+          upcoming GroupMeetings
     """
     try:
-        from .models import Mentorship, Faculty, HOD
+        from .models import Faculty
+        from .mentorship import transfer_mentorship_group as transfer_group, TRANSFER_MEETING_MODES
         
         data = json.loads(request.body)
         from_faculty_id = data.get('fromFacultyId')
         to_faculty_employee_id = data.get('toFacultyEmployeeId')
         year = data.get('year')
         semester = data.get('semester')
+        meeting_mode = data.get('futureMeetings', 'none')
         
         # Validate required fields
         if not all([from_faculty_id, to_faculty_employee_id, year, semester]):
@@ -4030,7 +3737,11 @@ def transfer_mentorship_group(request):
                 status=400
             )
         
-        hod_user_id = request.user_id
+        if meeting_mode not in TRANSFER_MEETING_MODES:
+            return JsonResponse(
+                {'message': f'Invalid futureMeetings. Valid values: {list(TRANSFER_MEETING_MODES)}'},
+                status=400
+            )
         
         # Get the source faculty
         try:
@@ -4039,13 +3750,8 @@ def transfer_mentorship_group(request):
             return JsonResponse({'message': 'Source faculty not found'}, status=404)
         
         # Verify HOD is authorized for this department
-        try:
-            hod = HOD.objects.get(
-                user_id=hod_user_id,
-                department=from_faculty.department,
-                endDate__isnull=True
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None or hod.department != from_faculty.department:
             return JsonResponse(
                 {'message': f'You are not authorized to manage mentorships in {from_faculty.department} department'},
                 status=403
@@ -4068,56 +3774,18 @@ def transfer_mentorship_group(request):
         if from_faculty.id == to_faculty.id:
             return JsonResponse({'message': 'Cannot transfer to the same faculty'}, status=400)
         
-        # Get all active mentorships for the source faculty in this year/semester
-        active_mentorships = Mentorship.objects.filter(
-            faculty=from_faculty,
-            year=int(year),
-            semester=int(semester),
-            is_active=True
-        ).select_related('student')
+        # End the old mentorships, create the new ones and carry meetings over atomically
+        transferred, meeting_count = transfer_group(from_faculty, to_faculty, year, semester, meeting_mode)
         
-        if not active_mentorships.exists():
+        if transferred is None:
             return JsonResponse(
                 {'message': 'No active mentorships found for this faculty/year/semester'},
                 status=404
             )
         
-        transferred = []
+        # The transfer is all-or-nothing, so nothing is ever partially failed
         failed = []
         
-        for mentorship in active_mentorships:
-            try:
-                # Mark old mentorship as inactive
-                mentorship.is_active = False
-                mentorship.end_date = datetime.now()
-                mentorship.save()
-                
-                # Create new mentorship with the new faculty
-                new_mentorship = Mentorship.objects.create(
-                    faculty=to_faculty,
-                    student=mentorship.student,
-                    department=to_faculty.department,
-                    year=int(year),
-                    semester=int(semester),
-                    start_date=datetime.now(),
-                    is_active=True,
-                    comments=[]
-                )
-                
-                transferred.append({
-                    'student': {
-                        'name': mentorship.student.name,
-                        'rollNumber': mentorship.student.rollNumber
-                    },
-                    'oldMentorshipId': str(mentorship.id),
-                    'newMentorshipId': str(new_mentorship.id)
-                })
-            except Exception as e:
-                failed.append({
-                    'student': mentorship.student.name,
-                    'reason': str(e)
-                })
-        
         return JsonResponse({
             'message': f'Transferred {len(transferred)} student(s) from {from_faculty.name} to {to_faculty.name}',
             'fromFaculty': {
@@ -4135,15 +3803,17 @@ def transfer_mentorship_group(request):
             'transferred': transferred,
             'failed': failed,
             'transferCount': len(transferred),
-            'failedCount': len(failed)
+            'failedCount': len(failed),
+            'futureMeetings': {
+                'mode': meeting_mode,
+                'count': meeting_count
+            }
         }, status=200)
         
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON in request body'}, status=400)
     except Exception as e:
-        print(f"Transfer mentorship error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Transfer mentorship error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -4161,7 +3831,8 @@ def end_mentorship_group(request):
         - semester: Semester
     """
     try:
-        from .models import Mentorship, Faculty, HOD
+        from .models import Mentorship, Faculty
+        from .mentorship import sync_current_mentors
         
         faculty_id = request.GET.get('faculty')
         year = request.GET.get('year')
@@ -4174,8 +3845,6 @@ def end_mentorship_group(request):
                 status=400
             )
         
-        hod_user_id = request.user_id
-        
         # Get the faculty
         try:
             faculty = Faculty.objects.get(id=faculty_id)
@@ -4183,13 +3852,8 @@ def end_mentorship_group(request):
             return JsonResponse({'message': 'Faculty not found'}, status=404)
         
         # Verify HOD is authorized for this department
-        try:
-            hod = HOD.objects.get(
-                user_id=hod_user_id,
-                department=faculty.department,
-                endDate__isnull=True
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None or hod.department != faculty.department:
             return JsonResponse(
                 {'message': f'You are not authorized to manage mentorships in {faculty.department} department'},
                 status=403
@@ -4222,6 +3886,12 @@ def end_mentorship_group(request):
                 'rollNumber': mentorship.student.rollNumber,
                 'mentorshipId': str(mentorship.id)
             })
+        sync_current_mentors([m.student_id for m in active_mentorships])
+        invalidate_dashboard_stats(
+            student_ids=[m.student_id for m in active_mentorships],
+            faculty_ids=[faculty.id],
+            departments=[faculty.department]
+        )
         
         return JsonResponse({
             'message': f'Ended {ended_count} mentorship(s). Students are now unassigned.',
@@ -4237,9 +3907,7 @@ def end_mentorship_group(request):
         }, status=200)
         
     except Exception as e:
-        print(f"End mentorship group error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("End mentorship group error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -4260,9 +3928,7 @@ def get_mentorship_group(request):
         - GroupMeetings for this faculty/year/semester with individual student reviews
     """
     try:
-        from .models import Mentorship, GroupMeeting, GroupMeetingStudent, HOD, Faculty
-        
-        hod_user_id = request.user_id
+        from .models import Mentorship, GroupMeeting, GroupMeetingStudent, Faculty
         
         # Get query params
         faculty_id = request.GET.get('faculty')
@@ -4292,13 +3958,8 @@ def get_mentorship_group(request):
             return JsonResponse({'message': 'Faculty not found'}, status=404)
         
         # Verify HOD is authorized for this department
-        try:
-            hod = HOD.objects.get(
-                user_id=hod_user_id,
-                department=faculty.department,
-                endDate__isnull=True
-            )
-        except HOD.DoesNotExist:
+        hod = request.actor.active_hod
+        if hod is None or hod.department != faculty.department:
             return JsonResponse(
                 {'message': f'You are not authorized to view mentorships in {faculty.department} department'},
                 status=403
@@ -4391,9 +4052,7 @@ def get_mentorship_group(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get mentorship group error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get mentorship group error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -4408,14 +4067,11 @@ def get_faculty_mentees(request):
         - menteeGroups: Mentees organized by year/semester
     """
     try:
-        from .models import Faculty, Mentorship, Meeting
-        
-        user_id = request.user_id
+        from .models import Mentorship, Meeting
         
         # Get faculty profile
-        try:
-            faculty = Faculty.objects.select_related('user').get(user_id=user_id)
-        except Faculty.DoesNotExist:
+        faculty = request.actor.faculty
+        if faculty is None:
             return JsonResponse({'message': 'Faculty profile not found'}, status=404)
         
         # Get all mentorships for this faculty
@@ -4490,9 +4146,7 @@ def get_faculty_mentees(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get faculty mentees error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get faculty mentees error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -4508,9 +4162,7 @@ def get_faculty_mentorship_group(request):
         - active: Whether to get active or past mentorships (true/false)
     """
     try:
-        from .models import Faculty, Mentorship, Meeting
-        
-        user_id = request.user_id
+        from .models import Mentorship, Meeting
         
         # Get query params
         year = request.GET.get('year')
@@ -4528,9 +4180,8 @@ def get_faculty_mentorship_group(request):
             return JsonResponse({'message': 'year and semester must be integers'}, status=400)
         
         # Get faculty profile
-        try:
-            faculty = Faculty.objects.select_related('user').get(user_id=user_id)
-        except Faculty.DoesNotExist:
+        faculty = request.actor.faculty
+        if faculty is None:
             return JsonResponse({'message': 'Faculty profile not found'}, status=404)
         
         # Get mentorships for this group
@@ -4643,9 +4294,7 @@ def get_faculty_mentorship_group(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get faculty mentorship group error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get faculty mentorship group error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -4670,14 +4319,11 @@ def faculty_schedule_meetings(request):
         if not meetings_data or not isinstance(meetings_data, list) or len(meetings_data) == 0:
             return JsonResponse({'message': 'meetings must be a non-empty array'}, status=400)
         
-        from .models import Faculty, Mentorship, Meeting, MeetingStatus
-        
-        user_id = request.user_id
+        from .models import Mentorship, Meeting, MeetingStatus
         
         # Get faculty profile
-        try:
-            faculty = Faculty.objects.get(user_id=user_id)
-        except Faculty.DoesNotExist:
+        faculty = request.actor.faculty
+        if faculty is None:
             return JsonResponse({'message': 'Faculty profile not found'}, status=404)
         
         # Find the mentorship and verify ownership
@@ -4746,6 +4392,9 @@ def faculty_schedule_meetings(request):
                     'reason': str(e)
                 })
         
+        if created_meetings:
+            invalidate_dashboard_stats(student_ids=[mentorship.student_id], faculty_ids=[faculty.id])
+        
         if len(created_meetings) == 0:
             return JsonResponse({
                 'message': 'Failed to create any meetings',
@@ -4773,9 +4422,7 @@ def faculty_schedule_meetings(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Faculty schedule meetings error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Faculty schedule meetings error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -4790,128 +4437,85 @@ def faculty_schedule_group_meetings(request):
         - year: Academic year (1-4)
         - semester: Semester (1-2)
         - meetings: Array of {date: "YYYY-MM-DD", time: "HH:MM", description: "optional"}
+          and/or recurrence: {startDate, time, weekday, intervalWeeks, weeks | endDate | occurrences, description}
+          (see core.meetings.expand_recurring_schedule)
     """
     try:
         data = json.loads(request.body)
         year = data.get('year')
         semester = data.get('semester')
         meetings_data = data.get('meetings')
+        recurrence = data.get('recurrence')
         
         if not year or not semester:
             return JsonResponse({'message': 'year and semester are required'}, status=400)
         
-        if not meetings_data or not isinstance(meetings_data, list) or len(meetings_data) == 0:
-            return JsonResponse({'message': 'meetings must be a non-empty array'}, status=400)
+        if not recurrence and (not meetings_data or not isinstance(meetings_data, list) or len(meetings_data) == 0):
+            return JsonResponse({'message': 'meetings must be a non-empty array (or provide recurrence)'}, status=400)
         
-        from .models import Faculty, Mentorship, GroupMeeting, GroupMeetingStudent, MeetingStatus
+        from .models import Mentorship, MeetingStatus
+        from .meetings import parse_meeting_entries, expand_recurring_schedule, create_group_meetings
         from django.utils import timezone
-        from datetime import datetime
         
-        user_id = request.user_id
         today = timezone.now().date()
         
         # Get faculty profile
-        try:
-            faculty = Faculty.objects.get(user_id=user_id)
-        except Faculty.DoesNotExist:
+        faculty = request.actor.faculty
+        if faculty is None:
             return JsonResponse({'message': 'Faculty profile not found'}, status=404)
         
         # Get all active mentorships in this group
-        mentorships = Mentorship.objects.filter(
+        student_ids = list(Mentorship.objects.filter(
             faculty=faculty,
             year=year,
             semester=semester,
             is_active=True
-        ).select_related('student')
+        ).values_list('student_id', flat=True))
         
-        if not mentorships.exists():
+        if not student_ids:
             return JsonResponse(
                 {'message': 'No active mentorships found in this group'},
                 status=404
             )
         
-        # Parse meeting dates
-        parsed_meetings = []
-        for meeting_data in meetings_data:
-            meeting_date = meeting_data.get('date')
-            meeting_time = meeting_data.get('time')
-            description = meeting_data.get('description', '')
-            
-            if not meeting_date or not meeting_time:
-                continue
-            
-            try:
-                parsed_date = datetime.strptime(meeting_date, '%Y-%m-%d').date()
-                parsed_time = datetime.strptime(meeting_time, '%H:%M').time()
-                
-                # Determine status based on date
-                if parsed_date > today:
-                    status = MeetingStatus.UPCOMING
-                else:
-                    status = MeetingStatus.YET_TO_DONE
-                
-                parsed_meetings.append({
-                    'date': parsed_date,
-                    'time': parsed_time,
-                    'description': description,
-                    'status': status
-                })
-            except ValueError:
-                continue
+        # Parse explicit meeting dates and expand any recurring schedule
+        parsed_meetings = parse_meeting_entries(meetings_data if isinstance(meetings_data, list) else [])
+        if recurrence:
+            parsed_meetings.extend(expand_recurring_schedule(recurrence))
         
         if not parsed_meetings:
             return JsonResponse({'message': 'No valid meetings to schedule'}, status=400)
         
-        # Create GroupMeeting(s) and attach all students once per meeting
-        students = [m.student for m in mentorships]
-        total_meetings_created = 0
-
+        # Set status: future -> UPCOMING, else YET_TO_DONE
         for meeting_data in parsed_meetings:
-            # Set status: future -> UPCOMING, else YET_TO_DONE
-            status = MeetingStatus.UPCOMING if meeting_data['date'] > today else MeetingStatus.YET_TO_DONE
-
-            gm = GroupMeeting.objects.create(
-                faculty=faculty,
-                department=faculty.department,
-                year=year,
-                semester=semester,
-                date=meeting_data['date'],
-                time=meeting_data['time'],
-                description=meeting_data['description'],
-                status=status
-            )
-
-            for student in students:
-                GroupMeetingStudent.objects.create(
-                    group_meeting=gm,
-                    student=student,
-                    review='',
-                    attended=True
-                )
-
-            total_meetings_created += 1
+            meeting_data['status'] = MeetingStatus.UPCOMING if meeting_data['date'] > today else MeetingStatus.YET_TO_DONE
+        
+        # Create GroupMeeting(s) and attach all students once per meeting, in bulk
+        group_meetings = create_group_meetings(faculty, year, semester, student_ids, parsed_meetings)
+        total_meetings_created = len(group_meetings)
 
         return JsonResponse({
-            'message': f'Scheduled {total_meetings_created} group meeting(s) for {len(students)} student(s)',
+            'message': f'Scheduled {total_meetings_created} group meeting(s) for {len(student_ids)} student(s)',
             'group': {
                 'facultyId': str(faculty.id),
                 'facultyName': faculty.name,
                 'year': year,
                 'semester': semester,
-                'studentCount': len(students)
+                'studentCount': len(student_ids)
             },
             'results': {
-                'totalStudents': len(students),
-                'totalMeetingsCreated': total_meetings_created
+                'totalStudents': len(student_ids),
+                'totalMeetingsCreated': total_meetings_created,
+                'meetingDates': [gm.date.isoformat() for gm in group_meetings]
             }
         }, status=201)
         
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
+    except ValueError as e:
+        return JsonResponse({'message': str(e)}, status=400)
     except Exception as e:
-        print(f"Faculty schedule group meetings error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Faculty schedule group meetings error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -4989,6 +4593,10 @@ def complete_meeting(request, meeting_id):
         if description is not None:
             meeting.description = description
         meeting.save()
+        invalidate_dashboard_stats(
+            student_ids=[meeting.mentorship.student_id],
+            faculty_ids=[meeting.mentorship.faculty_id]
+        )
         
         return JsonResponse({
             'message': 'Meeting marked as completed successfully',
@@ -5009,9 +4617,7 @@ def complete_meeting(request, meeting_id):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Complete meeting error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Complete meeting error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5120,9 +4726,7 @@ def complete_group_meetings(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Complete group meetings error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Complete group meetings error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5140,7 +4744,7 @@ def update_meeting_reviews(request):
         - description: string (optional) - Updated description/agenda
     """
     try:
-        from .models import GroupMeeting, GroupMeetingStudent, MeetingStatus, User, UserRole
+        from .models import GroupMeeting, GroupMeetingStudent, MeetingStatus, UserRole
         from datetime import datetime
         
         # Get user from JWT middleware (require_role sets request.user_id)
@@ -5148,9 +4752,8 @@ def update_meeting_reviews(request):
         if not user_id:
             return JsonResponse({'message': 'Not authenticated'}, status=401)
         
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
+        user = request.actor.user
+        if user is None:
             return JsonResponse({'message': 'User not found'}, status=401)
         
         # Only Faculty can update meeting reviews (not HOD)
@@ -5211,9 +4814,7 @@ def update_meeting_reviews(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update meeting reviews error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update meeting reviews error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5232,16 +4833,15 @@ def update_meeting(request):
         - studentReviews: array (optional) - Array of {rollNumber, review} for each student
     """
     try:
-        from .models import GroupMeeting, GroupMeetingStudent, MeetingStatus, User, UserRole
+        from .models import GroupMeeting, GroupMeetingStudent, MeetingStatus, UserRole
         
         # Get user from JWT middleware (require_role sets request.user_id)
         user_id = getattr(request, 'user_id', None) or request.session.get('user_id')
         if not user_id:
             return JsonResponse({'message': 'Not authenticated'}, status=401)
         
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
+        user = request.actor.user
+        if user is None:
             return JsonResponse({'message': 'User not found'}, status=401)
         
         # Only Faculty can update meetings (not HOD)
@@ -5313,9 +4913,7 @@ def update_meeting(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update meeting error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update meeting error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5431,6 +5029,7 @@ def create_faculty(request):
             isActive=True,
             startDate=timezone.now()
         )
+        invalidate_dashboard_stats(departments=[department])
         
         return JsonResponse({
             'message': 'Faculty created successfully',
@@ -5448,9 +5047,7 @@ def create_faculty(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Create faculty error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Create faculty error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5476,6 +5073,7 @@ def update_faculty(request, faculty_id):
             faculty = Faculty.objects.select_related('user').get(id=faculty_id)
         except Faculty.DoesNotExist:
             return JsonResponse({'message': 'Faculty not found'}, status=404)
+        previous_department = faculty.department
         
         data = json.loads(request.body)
         
@@ -5502,6 +5100,7 @@ def update_faculty(request, faculty_id):
             faculty.collegeEmail = data['collegeEmail']
             faculty.user.email = data['collegeEmail']
             faculty.user.save()
+            revoke_user_tokens(faculty.user_id)
         
         if 'department' in data:
             valid_departments = [d.value for d in Department]
@@ -5534,6 +5133,8 @@ def update_faculty(request, faculty_id):
                 faculty.endDate = timezone.now()
         
         faculty.save()
+        invalidate_user_data(faculty.user_id)
+        invalidate_dashboard_stats(departments=[faculty.department, previous_department])
         
         return JsonResponse({
             'message': 'Faculty updated successfully',
@@ -5551,9 +5152,7 @@ def update_faculty(request, faculty_id):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update faculty error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update faculty error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5633,6 +5232,7 @@ def change_hod(request):
             # Update old HOD's user role back to FACULTY
             current_hod.user.role = UserRole.FACULTY
             current_hod.user.save()
+            revoke_user_tokens(current_hod.user_id)
             
             removed_hod_info = {
                 'id': str(current_hod.faculty.id),
@@ -5651,6 +5251,8 @@ def change_hod(request):
         # Update faculty's user role to HOD
         faculty.user.role = UserRole.HOD
         faculty.user.save()
+        revoke_user_tokens(faculty.user_id)
+        invalidate_dashboard_stats()
         
         response_data = {
             'message': f'HOD changed successfully for {department}',
@@ -5671,9 +5273,7 @@ def change_hod(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Change HOD error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Change HOD error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5688,14 +5288,12 @@ def update_personal_problems(request):
     All fields are optional booleans
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, PersonalProblem
+        from .models import PersonalProblem
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse(
                 {'message': 'Student profile not found'},
                 status=404
@@ -5790,9 +5388,7 @@ def update_personal_problems(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update personal problems error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update personal problems error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5866,9 +5462,7 @@ def update_student_special_issues(request, rollno):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update special issues error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update special issues error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5880,14 +5474,12 @@ def update_career_hobbies(request):
     Update student's hobbies (array of strings)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         hobbies = data.get('hobbies')
@@ -5909,9 +5501,7 @@ def update_career_hobbies(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update hobbies error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update hobbies error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5923,14 +5513,12 @@ def update_career_strengths(request):
     Update student's strengths (array of strings)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         strengths = data.get('strengths')
@@ -5952,9 +5540,7 @@ def update_career_strengths(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update strengths error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update strengths error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -5966,14 +5552,12 @@ def update_career_areas_to_improve(request):
     Update student's areas to improve (array of strings)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         areas = data.get('areasToImprove')
@@ -5995,9 +5579,7 @@ def update_career_areas_to_improve(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update areas to improve error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update areas to improve error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6009,14 +5591,12 @@ def update_career_core(request):
     Update student's core career interests (array of strings)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         core = data.get('core')
@@ -6038,9 +5618,7 @@ def update_career_core(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update core error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update core error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6052,14 +5630,12 @@ def update_career_it(request):
     Update student's IT career interests (array of strings)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         it = data.get('it')
@@ -6081,9 +5657,7 @@ def update_career_it(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update IT error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update IT error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6095,14 +5669,12 @@ def update_career_higher_education(request):
     Update student's higher education interests (array of strings)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         higher_ed = data.get('higherEducation')
@@ -6124,9 +5696,7 @@ def update_career_higher_education(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update higher education error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update higher education error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6138,14 +5708,12 @@ def update_career_startup(request):
     Update student's startup interests (array of strings)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         startup = data.get('startup')
@@ -6167,9 +5735,7 @@ def update_career_startup(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update startup error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update startup error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6181,14 +5747,12 @@ def update_career_family_business(request):
     Update student's family business interests (array of strings)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         family_business = data.get('familyBusiness')
@@ -6210,9 +5774,7 @@ def update_career_family_business(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update family business error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update family business error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6224,14 +5786,12 @@ def update_career_other_interests(request):
     Update student's other interests (array of strings)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         other = data.get('otherInterests')
@@ -6253,9 +5813,7 @@ def update_career_other_interests(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update other interests error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update other interests error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6267,14 +5825,12 @@ def update_career_rankings(request):
     Update student's career rankings (1-6 for each career path)
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         career, created = CareerDetails.objects.get_or_create(student=student)
@@ -6306,9 +5862,7 @@ def update_career_rankings(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update career rankings error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update career rankings error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6320,14 +5874,12 @@ def update_career_details_all(request):
     Update all career details at once
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, CareerDetails
+        from .models import CareerDetails
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         career, created = CareerDetails.objects.get_or_create(student=student)
@@ -6382,9 +5934,7 @@ def update_career_details_all(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Update career details error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Update career details error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6398,13 +5948,10 @@ def cancel_request(request, request_id):
     Cancel a pending request (student can only cancel their own pending requests)
     """
     try:
-        user_id = request.user_id
-        
-        from .models import Student, Request, RequestStatus
+        from .models import Request, RequestStatus
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         try:
@@ -6416,6 +5963,7 @@ def cancel_request(request, request_id):
             return JsonResponse({'message': f'Cannot cancel a {req.status.lower()} request'}, status=400)
         
         req.delete()
+        _request_stats_changed(req)
         
         return JsonResponse({
             'message': 'Request cancelled successfully',
@@ -6423,9 +5971,7 @@ def cancel_request(request, request_id):
         }, status=200)
         
     except Exception as e:
-        print(f"Cancel request error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Cancel request error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6437,14 +5983,12 @@ def create_delete_internship_request(request):
     Create a request to delete an existing internship
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, Request, RequestType, Mentorship, Internship
+        from .models import Request, RequestType, Mentorship, Internship
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         internship_id = data.get('internshipId')
@@ -6480,6 +6024,7 @@ def create_delete_internship_request(request):
             request_data=delete_data,
             remarks=data.get('reason', 'Deletion requested')
         )
+        _request_stats_changed(new_request)
         
         return JsonResponse({
             'message': 'Delete request submitted successfully',
@@ -6491,9 +6036,7 @@ def create_delete_internship_request(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Create delete internship request error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Create delete internship request error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6505,14 +6048,12 @@ def create_delete_project_request(request):
     Create a request to delete an existing project
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, Request, RequestType, Mentorship, Project
+        from .models import Request, RequestType, Mentorship, Project
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         project_id = data.get('projectId')
@@ -6546,6 +6087,7 @@ def create_delete_project_request(request):
             request_data=delete_data,
             remarks=data.get('reason', 'Deletion requested')
         )
+        _request_stats_changed(new_request)
         
         return JsonResponse({
             'message': 'Delete request submitted successfully',
@@ -6557,9 +6099,7 @@ def create_delete_project_request(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Create delete project request error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Create delete project request error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6571,14 +6111,12 @@ def create_meeting_request(request):
     Create a request for a meeting with mentor
     """
     try:
-        user_id = request.user_id
         data = json.loads(request.body)
         
-        from .models import Student, Request, RequestType, Mentorship
+        from .models import Request, RequestType, Mentorship
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         mentorship_id = data.get('mentorshipId')
@@ -6614,6 +6152,7 @@ def create_meeting_request(request):
             request_data=meeting_data,
             remarks=data.get('description', 'Meeting requested')
         )
+        _request_stats_changed(new_request)
         
         return JsonResponse({
             'message': 'Meeting request submitted successfully',
@@ -6625,12 +6164,33 @@ def create_meeting_request(request):
     except json.JSONDecodeError:
         return JsonResponse({'message': 'Invalid JSON'}, status=400)
     except Exception as e:
-        print(f"Create meeting request error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Create meeting request error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
+def _count_subquery(queryset):
+    """COUNT of `queryset` as a scalar subquery, so several counts can share one round trip"""
+    from django.db.models import F, Func, IntegerField, Subquery
+    return Subquery(
+        queryset.order_by().annotate(row_count=Func(F('pk'), function='COUNT')).values('row_count'),
+        output_field=IntegerField()
+    )
+
+
+def _dashboard_counts(anchor, **querysets):
+    """
+    COUNT of each keyword queryset, all evaluated as scalar subqueries of one SELECT on the
+    single row of `anchor` (the requester's already verified profile or user row).
+    Returns {name: count}, or None when that row is gone so the zeros are never cached.
+    """
+    row = anchor.annotate(
+        **{name: _count_subquery(qs) for name, qs in querysets.items()}
+    ).values(*querysets).first()
+    if row is None:
+        return None
+    return {name: row[name] or 0 for name in querysets}
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 @require_role('STUDENT')
@@ -6639,57 +6199,65 @@ def get_student_dashboard_stats(request):
     Get dashboard statistics for a student
     """
     try:
-        user_id = request.user_id
+        user_data = request.user_data
         
-        from .models import Student, Request, RequestStatus, Mentorship, Meeting, MeetingStatus
-        from datetime import datetime, date
+        from .models import Student, Request, RequestStatus, Meeting, MeetingStatus
+        from .cache import get_dashboard_stats
+        from django.db.models import Count, OuterRef, Q, Subquery
+        from datetime import date
         
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student_id = user_data.get('entityId')
+        if user_data.get('entityType') != 'STUDENT' or not student_id:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
-        # Get request counts
-        requests = Request.objects.filter(student=student)
-        pending_requests = requests.filter(status=RequestStatus.PENDING).count()
-        approved_requests = requests.filter(status=RequestStatus.APPROVED).count()
-        rejected_requests = requests.filter(status=RequestStatus.REJECTED).count()
-        
-        # Get active mentorship and upcoming meetings
-        active_mentorship = Mentorship.objects.filter(student=student, is_active=True).first()
-        upcoming_meetings = 0
-        next_meeting = None
-        
-        if active_mentorship:
+        def compute():
             upcoming = Meeting.objects.filter(
-                mentorship=active_mentorship,
+                mentorship__student=OuterRef('pk'),
+                mentorship__is_active=True,
                 status=MeetingStatus.UPCOMING,
                 date__gte=date.today()
             ).order_by('date', 'time')
-            upcoming_meetings = upcoming.count()
             
-            if upcoming.exists():
-                next_m = upcoming.first()
+            # Mentor and upcoming meetings in one query on the student row
+            row = Student.objects.filter(id=student_id).annotate(
+                upcoming_meetings=_count_subquery(upcoming),
+                next_date=Subquery(upcoming.values('date')[:1]),
+                next_time=Subquery(upcoming.values('time')[:1])
+            ).values('currentMentor', 'upcoming_meetings', 'next_date', 'next_time').first()
+            if row is None:
+                return None
+            
+            # Request counts by status
+            counts = Request.objects.filter(student_id=student_id).aggregate(
+                pending=Count('id', filter=Q(status=RequestStatus.PENDING)),
+                approved=Count('id', filter=Q(status=RequestStatus.APPROVED)),
+                rejected=Count('id', filter=Q(status=RequestStatus.REJECTED))
+            )
+            
+            next_meeting = None
+            if row['next_date']:
                 next_meeting = {
-                    'date': next_m.date.strftime('%b %d'),
-                    'time': next_m.time.strftime('%H:%M')
+                    'date': row['next_date'].strftime('%b %d'),
+                    'time': row['next_time'].strftime('%H:%M')
                 }
-        
-        return JsonResponse({
-            'stats': {
-                'pendingRequests': pending_requests,
-                'approvedRequests': approved_requests,
-                'rejectedRequests': rejected_requests,
-                'upcomingMeetings': upcoming_meetings,
+            
+            return {
+                'pendingRequests': counts['pending'],
+                'approvedRequests': counts['approved'],
+                'rejectedRequests': counts['rejected'],
+                'upcomingMeetings': row['upcoming_meetings'] or 0,
                 'nextMeeting': next_meeting,
-                'hasMentor': active_mentorship is not None
+                'hasMentor': row['currentMentor'] is not None
             }
-        }, status=200)
+        
+        stats = get_dashboard_stats('student', student_id, compute)
+        if stats is None:
+            return JsonResponse({'message': 'Student profile not found'}, status=404)
+        
+        return JsonResponse({'stats': stats}, status=200)
         
     except Exception as e:
-        print(f"Get student dashboard stats error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student dashboard stats error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6701,56 +6269,48 @@ def get_faculty_dashboard_stats(request):
     Get dashboard statistics for faculty/HOD
     """
     try:
-        user_id = request.user_id
+        user_data = request.user_data
         
-        from .models import Faculty, Request, RequestStatus, Mentorship, Meeting, MeetingStatus
-        from datetime import date
+        from .models import Request, RequestStatus, Mentorship, MeetingStatus
+        from .cache import get_dashboard_stats
+        from django.db.models import Count, Q
+        from datetime import date, timedelta
         
-        try:
-            faculty = Faculty.objects.get(user__id=user_id)
-        except Faculty.DoesNotExist:
+        faculty_id = user_data.get('entityId')
+        if user_data.get('entityType') != 'FACULTY' or not faculty_id:
             return JsonResponse({'message': 'Faculty profile not found'}, status=404)
         
-        # Get active mentees count
-        active_mentees = Mentorship.objects.filter(faculty=faculty, is_active=True).count()
-        
-        # Get pending requests count
-        pending_requests = Request.objects.filter(
-            assigned_to=faculty,
-            status=RequestStatus.PENDING
-        ).count()
-        
-        # Get upcoming meetings this week
-        from datetime import timedelta
-        today = date.today()
-        week_end = today + timedelta(days=7)
-        
-        upcoming_meetings = Meeting.objects.filter(
-            mentorship__faculty=faculty,
-            status=MeetingStatus.UPCOMING,
-            date__gte=today,
-            date__lte=week_end
-        ).count()
-        
-        # Get total meetings completed
-        completed_meetings = Meeting.objects.filter(
-            mentorship__faculty=faculty,
-            status=MeetingStatus.COMPLETED
-        ).count()
-        
-        return JsonResponse({
-            'stats': {
-                'activeMentees': active_mentees,
+        def compute():
+            today = date.today()
+            week_end = today + timedelta(days=7)
+            
+            # Active mentees, upcoming meetings this week and completed meetings
+            counts = Mentorship.objects.filter(faculty_id=faculty_id).aggregate(
+                active_mentees=Count('id', filter=Q(is_active=True), distinct=True),
+                upcoming_meetings=Count('meetings', filter=Q(
+                    meetings__status=MeetingStatus.UPCOMING,
+                    meetings__date__gte=today,
+                    meetings__date__lte=week_end
+                )),
+                completed_meetings=Count('meetings', filter=Q(meetings__status=MeetingStatus.COMPLETED))
+            )
+            
+            pending_requests = Request.objects.filter(
+                assigned_to_id=faculty_id,
+                status=RequestStatus.PENDING
+            ).count()
+            
+            return {
+                'activeMentees': counts['active_mentees'],
                 'pendingRequests': pending_requests,
-                'upcomingMeetings': upcoming_meetings,
-                'completedMeetings': completed_meetings
+                'upcomingMeetings': counts['upcoming_meetings'],
+                'completedMeetings': counts['completed_meetings']
             }
-        }, status=200)
+        
+        return JsonResponse({'stats': get_dashboard_stats('faculty', faculty_id, compute)}, status=200)
         
     except Exception as e:
-        print(f"Get faculty dashboard stats error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get faculty dashboard stats error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6762,51 +6322,36 @@ def get_hod_dashboard_stats(request):
     Get dashboard statistics for HOD
     """
     try:
-        user_id = request.user_id
+        from .models import Faculty, HOD, Student, Mentorship, Request, RequestStatus
+        from .cache import get_dashboard_stats
         
-        from .models import HOD, Faculty, Student, Mentorship, Request, RequestStatus
-        
-        try:
-            hod = HOD.objects.get(user__id=user_id)
-        except HOD.DoesNotExist:
+        hod = request.actor.hod
+        if hod is None:
             return JsonResponse({'message': 'HOD profile not found'}, status=404)
-        
         department = hod.department
         
-        # Get department stats
-        total_faculty = Faculty.objects.filter(department=department).count()
-        total_students = Student.objects.filter(branch=department).count()
-        
-        # Get mentorship stats
-        active_mentorships = Mentorship.objects.filter(
-            faculty__department=department,
-            is_active=True
-        ).count()
-        
-        unassigned_students = Student.objects.filter(branch=department).exclude(
-            id__in=Mentorship.objects.filter(is_active=True).values_list('student_id', flat=True)
-        ).count()
+        def compute():
+            students = Student.objects.filter(branch=department)
+            return _dashboard_counts(
+                HOD.objects.filter(id=hod.id),
+                totalFaculty=Faculty.objects.filter(department=department),
+                totalStudents=students,
+                activeMentorships=Mentorship.objects.filter(faculty__department=department, is_active=True),
+                unassignedStudents=students.filter(currentMentor__isnull=True),
+                pendingRequests=Request.objects.filter(
+                    assigned_to__department=department,
+                    status=RequestStatus.PENDING
+                )
+            )
         
-        # Pending requests in department
-        pending_requests = Request.objects.filter(
-            assigned_to__department=department,
-            status=RequestStatus.PENDING
-        ).count()
+        stats = get_dashboard_stats('hod', department, compute)
+        if stats is None:
+            return JsonResponse({'message': 'HOD profile not found'}, status=404)
         
-        return JsonResponse({
-            'stats': {
-                'totalFaculty': total_faculty,
-                'totalStudents': total_students,
-                'activeMentorships': active_mentorships,
-                'unassignedStudents': unassigned_students,
-                'pendingRequests': pending_requests
-            }
-        }, status=200)
+        return JsonResponse({'stats': stats}, status=200)
         
     except Exception as e:
-        print(f"Get HOD dashboard stats error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get HOD dashboard stats error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6818,39 +6363,88 @@ def get_admin_dashboard_stats(request):
     Get dashboard statistics for Admin
     """
     try:
-        from .models import User, Faculty, Student, HOD, Mentorship, Request, RequestStatus
+        from .models import Faculty, Student, HOD, Mentorship, Request, RequestStatus
+        from .cache import get_dashboard_stats
+        
+        def compute():
+            return _dashboard_counts(
+                User.objects.filter(id=request.user_id),
+                totalUsers=User.objects.all(),
+                totalFaculty=Faculty.objects.all(),
+                totalStudents=Student.objects.all(),
+                totalHODs=HOD.objects.all(),
+                totalMentorships=Mentorship.objects.filter(is_active=True),
+                pendingRequests=Request.objects.filter(status=RequestStatus.PENDING),
+                unassignedStudents=Student.objects.filter(currentMentor__isnull=True)
+            )
         
-        # Get total counts
-        total_users = User.objects.count()
-        total_faculty = Faculty.objects.count()
-        total_students = Student.objects.count()
-        total_hods = HOD.objects.count()
+        stats = get_dashboard_stats('admin', 'all', compute)
+        if stats is None:
+            return JsonResponse({'message': 'User not found'}, status=404)
         
-        # Get mentorship stats
-        total_mentorships = Mentorship.objects.filter(is_active=True).count()
-        pending_requests = Request.objects.filter(status=RequestStatus.PENDING).count()
+        return JsonResponse({'stats': stats}, status=200)
+        
+    except Exception as e:
+        logger.exception("Get Admin dashboard stats error: %s", e)
+        return JsonResponse({'message': 'Server error'}, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["GET", "DELETE"])
+@require_role('ADMIN')
+def get_endpoint_stats(request):
+    """
+    Per-endpoint performance stats recorded by InstrumentationMiddleware in this worker
+    process: request count and p50/p95/p99/max of latency, DB queries, DB time, JSON
+    serialization time, other Python time and response size over the latest
+    PERF_STATS_WINDOW requests. DELETE clears them.
+    Query params:
+        - sortBy: Optional (totalMs, queries, dbMs, serializeMs, appMs, bytes, requests) -
+          default totalMs; sorts by p95 (descending), or by request count
+        - overBudget: Optional (true) - only endpoints whose max query count exceeds their budget
+    Accessible by: ADMIN only
+    """
+    try:
+        from .instrumentation import QUERY_BUDGETS, SAMPLE_FIELDS, endpoint_stats, summarize
+        
+        if request.method == 'DELETE':
+            endpoint_stats.clear()
+            return JsonResponse({'message': 'Endpoint stats cleared'}, status=200)
         
-        # Unassigned students
-        unassigned_students = Student.objects.exclude(
-            id__in=Mentorship.objects.filter(is_active=True).values_list('student_id', flat=True)
-        ).count()
+        sort_by = request.GET.get('sortBy', 'totalMs')
+        over_budget = request.GET.get('overBudget', '').lower() == 'true'
+        if sort_by not in SAMPLE_FIELDS + ('requests',):
+            return JsonResponse(
+                {'message': f'Invalid sortBy. Valid values: {list(SAMPLE_FIELDS) + ["requests"]}'},
+                status=400
+            )
+        
+        endpoints = []
+        for name, (total, samples) in endpoint_stats.snapshot().items():
+            summary = summarize(samples)
+            budget = QUERY_BUDGETS.get(name)
+            if over_budget and (budget is None or summary['queries']['max'] <= budget):
+                continue
+            endpoints.append({
+                'name': name,
+                'requests': total,
+                'samples': len(samples),
+                'queryBudget': budget,
+                **summary
+            })
+        
+        if sort_by == 'requests':
+            endpoints.sort(key=lambda e: e['requests'], reverse=True)
+        else:
+            endpoints.sort(key=lambda e: e[sort_by]['p95'] or 0, reverse=True)
         
         return JsonResponse({
-            'stats': {
-                'totalUsers': total_users,
-                'totalFaculty': total_faculty,
-                'totalStudents': total_students,
-                'totalHODs': total_hods,
-                'totalMentorships': total_mentorships,
-                'pendingRequests': pending_requests,
-                'unassignedStudents': unassigned_students
-            }
+            'count': len(endpoints),
+            'endpoints': endpoints
         }, status=200)
         
     except Exception as e:
-        print(f"Get Admin dashboard stats error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get endpoint stats error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6859,30 +6453,28 @@ def get_admin_dashboard_stats(request):
 @csrf_exempt
 @require_http_methods(["GET"])
 @require_role(['FACULTY', 'HOD', 'ADMIN'])
+@conditional_get('faculty-subjects')
 def get_faculty_subjects(request, faculty_id=None):
     """
     Get subjects taught by a faculty - current and past.
     Faculty can view their own, HOD can view their department, Admin can view all.
     """
     try:
-        user_id = request.user_id
         role = request.user_role
         
-        from .models import Faculty, Subject, FacultySubjectHistory, HOD
+        from .models import Faculty, Subject, FacultySubjectHistory
         
         # If faculty_id not provided, get current user's faculty
         if not faculty_id:
             if role == 'FACULTY':
-                try:
-                    faculty = Faculty.objects.get(user__id=user_id)
-                except Faculty.DoesNotExist:
+                faculty = request.actor.faculty
+                if faculty is None:
                     return JsonResponse({'message': 'Faculty profile not found'}, status=404)
             elif role == 'HOD':
-                try:
-                    hod = HOD.objects.get(user__id=user_id)
-                    faculty = hod.faculty
-                except HOD.DoesNotExist:
+                hod = request.actor.hod
+                if hod is None:
                     return JsonResponse({'message': 'HOD profile not found'}, status=404)
+                faculty = hod.faculty
             else:
                 return JsonResponse({'message': 'Faculty ID required for admin'}, status=400)
         else:
@@ -6893,12 +6485,11 @@ def get_faculty_subjects(request, faculty_id=None):
             
             # Check permission
             if role == 'HOD':
-                try:
-                    hod = HOD.objects.get(user__id=user_id)
-                    if faculty.department != hod.department:
-                        return JsonResponse({'message': 'You can only view faculty in your department'}, status=403)
-                except HOD.DoesNotExist:
+                hod = request.actor.hod
+                if hod is None:
                     return JsonResponse({'message': 'HOD profile not found'}, status=404)
+                if faculty.department != hod.department:
+                    return JsonResponse({'message': 'You can only view faculty in your department'}, status=403)
         
         # Get current subjects
         current_subjects = []
@@ -6954,9 +6545,7 @@ def get_faculty_subjects(request, faculty_id=None):
         }, status=200)
         
     except Exception as e:
-        print(f"Get faculty subjects error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get faculty subjects error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -6968,13 +6557,10 @@ def get_mentor_subjects(request):
     Student can view their mentor's subjects
     """
     try:
-        user_id = request.user_id
+        from .models import Mentorship, Faculty, FacultySubjectHistory
         
-        from .models import Student, Mentorship, Faculty, FacultySubjectHistory
-        
-        try:
-            student = Student.objects.get(user__id=user_id)
-        except Student.DoesNotExist:
+        student = request.actor.student
+        if student is None:
             return JsonResponse({'message': 'Student profile not found'}, status=404)
         
         # Get current mentor
@@ -7019,9 +6605,7 @@ def get_mentor_subjects(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get mentor subjects error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get mentor subjects error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -7033,7 +6617,6 @@ def assign_faculty_to_subject(request):
     Assign a faculty to teach a subject (current or mark as past)
     """
     try:
-        user_id = request.user_id
         role = request.user_role
         
         data = json.loads(request.body)
@@ -7046,7 +6629,7 @@ def assign_faculty_to_subject(request):
         if not all([faculty_id, subject_id, academic_year, semester_type]):
             return JsonResponse({'message': 'Missing required fields'}, status=400)
         
-        from .models import Faculty, Subject, FacultySubjectHistory, HOD
+        from .models import Faculty, Subject, FacultySubjectHistory
         
         try:
             faculty = Faculty.objects.get(id=faculty_id)
@@ -7056,12 +6639,11 @@ def assign_faculty_to_subject(request):
         
         # HOD can only assign to their department
         if role == 'HOD':
-            try:
-                hod = HOD.objects.get(user__id=user_id)
-                if faculty.department != hod.department:
-                    return JsonResponse({'message': 'You can only assign faculty in your department'}, status=403)
-            except HOD.DoesNotExist:
+            hod = request.actor.hod
+            if hod is None:
                 return JsonResponse({'message': 'HOD profile not found'}, status=404)
+            if faculty.department != hod.department:
+                return JsonResponse({'message': 'You can only assign faculty in your department'}, status=403)
         
         # Create or update faculty subject history
         history, created = FacultySubjectHistory.objects.update_or_create(
@@ -7100,9 +6682,7 @@ def assign_faculty_to_subject(request):
         }, status=200 if not created else 201)
         
     except Exception as e:
-        print(f"Assign faculty to subject error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Assign faculty to subject error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -7115,19 +6695,35 @@ def get_student_grades(request, student_id=None):
     """
     Get student's grades with SG/CG calculations
     Students can view their own, Faculty/HOD/Admin can view others
+    Optional query params:
+    - fields: comma-separated sections to include, any of semesters, subjects (per-semester
+      grades, implies semesters), backlogHistory, gradePointMapping (default: all).
+      Student details and currentCGPA are always returned.
     """
     try:
-        user_id = request.user_id
         role = request.user_role
         
         from .models import Student, Semester, StudentSubject, BacklogHistory, GRADE_POINTS
+        from django.db.models import Prefetch, Q, Sum
+        
+        grade_sections = ('semesters', 'subjects', 'backlogHistory', 'gradePointMapping')
+        fields = request.GET.get('fields')
+        if fields:
+            fields = {f.strip() for f in fields.split(',') if f.strip()}
+            invalid = fields - set(grade_sections)
+            if invalid:
+                return JsonResponse(
+                    {'message': f'Invalid fields {sorted(invalid)}. Valid values: {list(grade_sections)}'},
+                    status=400
+                )
+        else:
+            fields = set(grade_sections)
         
         # Determine which student to show
         if not student_id:
             if role == 'STUDENT':
-                try:
-                    student = Student.objects.get(user__id=user_id)
-                except Student.DoesNotExist:
+                student = request.actor.student
+                if student is None:
                     return JsonResponse({'message': 'Student profile not found'}, status=404)
             else:
                 return JsonResponse({'message': 'Student ID required'}, status=400)
@@ -7137,66 +6733,78 @@ def get_student_grades(request, student_id=None):
             except Student.DoesNotExist:
                 return JsonResponse({'message': 'Student not found'}, status=404)
         
-        # Get all semesters with their grades
+        # All semesters in one query (earned credits = credits of passed subjects),
+        # with their grades in one prefetch query when subjects are requested
+        semesters = Semester.objects.filter(student=student).annotate(
+            earned_credits=Sum('subject_grades__subject__credits', filter=Q(subject_grades__is_passed=True))
+        ).order_by('semester')
+        if 'subjects' in fields:
+            semesters = semesters.prefetch_related(Prefetch(
+                'subject_grades',
+                queryset=StudentSubject.objects.select_related('subject').order_by('subject__subjectCode')
+            ))
+        
         semesters_data = []
-        for semester in Semester.objects.filter(student=student).order_by('semester'):
-            subject_grades = []
-            for sg in StudentSubject.objects.filter(semester=semester).select_related('subject'):
-                subject_grades.append({
-                    'id': str(sg.id),
-                    'subject': {
-                        'id': str(sg.subject.id),
-                        'subjectCode': sg.subject.subjectCode,
-                        'subjectName': sg.subject.subjectName,
-                        'credits': sg.subject.credits,
-                        'subjectType': sg.subject.subject_type
-                    },
-                    'grade': sg.grade,
-                    'gradePoint': sg.grade_point,
-                    'attemptType': sg.attempt_type,
-                    'examYear': sg.exam_year,
-                    'examMonth': sg.exam_month,
-                    'isPassed': sg.is_passed
-                })
-            
-            semesters_data.append({
+        for semester in semesters:
+            semester_data = {
                 'semester': semester.semester,
                 'semesterType': semester.semester_type,
                 'academicYear': semester.academic_year,
                 'sgpa': semester.sgpa,
                 'cgpa': semester.cgpa,
                 'totalCredits': semester.total_credits,
-                'earnedCredits': semester.earned_credits,
-                'subjects': subject_grades
-            })
+                'earnedCredits': semester.earned_credits or 0
+            }
+            if 'subjects' in fields:
+                semester_data['subjects'] = [
+                    {
+                        'id': str(sg.id),
+                        'subject': {
+                            'id': str(sg.subject.id),
+                            'subjectCode': sg.subject.subjectCode,
+                            'subjectName': sg.subject.subjectName,
+                            'credits': sg.subject.credits,
+                            'subjectType': sg.subject.subject_type
+                        },
+                        'grade': sg.grade,
+                        'gradePoint': sg.grade_point,
+                        'attemptType': sg.attempt_type,
+                        'examYear': sg.exam_year,
+                        'examMonth': sg.exam_month,
+                        'isPassed': sg.is_passed
+                    }
+                    for sg in semester.subject_grades.all()
+                ]
+            semesters_data.append(semester_data)
         
         # Get backlog history
         backlogs = []
-        for backlog in BacklogHistory.objects.filter(student=student).select_related('subject'):
-            backlogs.append({
-                'id': str(backlog.id),
-                'subject': {
-                    'id': str(backlog.subject.id),
-                    'subjectCode': backlog.subject.subjectCode,
-                    'subjectName': backlog.subject.subjectName
-                },
-                'originalSemester': backlog.original_semester,
-                'attemptNumber': backlog.attempt_number,
-                'attemptType': backlog.attempt_type,
-                'semesterType': backlog.semester_type,
-                'examYear': backlog.exam_year,
-                'examMonth': backlog.exam_month,
-                'grade': backlog.grade,
-                'gradePoint': backlog.grade_point,
-                'isCleared': backlog.is_cleared
-            })
+        if 'backlogHistory' in fields:
+            for backlog in BacklogHistory.objects.filter(student=student).select_related('subject'):
+                backlogs.append({
+                    'id': str(backlog.id),
+                    'subject': {
+                        'id': str(backlog.subject.id),
+                        'subjectCode': backlog.subject.subjectCode,
+                        'subjectName': backlog.subject.subjectName
+                    },
+                    'originalSemester': backlog.original_semester,
+                    'attemptNumber': backlog.attempt_number,
+                    'attemptType': backlog.attempt_type,
+                    'semesterType': backlog.semester_type,
+                    'examYear': backlog.exam_year,
+                    'examMonth': backlog.exam_month,
+                    'grade': backlog.grade,
+                    'gradePoint': backlog.grade_point,
+                    'isCleared': backlog.is_cleared
+                })
         
         # Calculate current CGPA
         latest_cgpa = 0.0
         if semesters_data:
             latest_cgpa = semesters_data[-1]['cgpa']
         
-        return JsonResponse({
+        response_data = {
             'student': {
                 'id': str(student.id),
                 'name': student.name,
@@ -7206,16 +6814,19 @@ def get_student_grades(request, student_id=None):
                 'branch': student.branch,
                 'year': student.year
             },
-            'currentCGPA': latest_cgpa,
-            'semesters': semesters_data,
-            'backlogHistory': backlogs,
-            'gradePointMapping': GRADE_POINTS
-        }, status=200)
+            'currentCGPA': latest_cgpa
+        }
+        if fields & {'semesters', 'subjects'}:
+            response_data['semesters'] = semesters_data
+        if 'backlogHistory' in fields:
+            response_data['backlogHistory'] = backlogs
+        if 'gradePointMapping' in fields:
+            response_data['gradePointMapping'] = GRADE_POINTS
+        
+        return JsonResponse(response_data, status=200)
         
     except Exception as e:
-        print(f"Get student grades error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get student grades error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -7239,7 +6850,8 @@ def update_student_grade(request):
         if not all([student_id, subject_id, semester_number, grade]):
             return JsonResponse({'message': 'Missing required fields'}, status=400)
         
-        from .models import Student, Subject, Semester, StudentSubject, BacklogHistory, YearTopper, GRADE_POINTS
+        from .models import Student, Subject, Semester, StudentSubject, BacklogHistory, GRADE_POINTS
+        from .grades import update_student_gpa
         
         try:
             student = Student.objects.get(id=student_id)
@@ -7262,7 +6874,8 @@ def update_student_grade(request):
         existing_grade = StudentSubject.objects.filter(
             student=student,
             subject=subject
-        ).first()
+        ).select_related('semester').first()
+        changed_semester_ids = {semester.id}
         
         if existing_grade and attempt_type in ['BACKLOG', 'MAKEUP']:
             # Record in backlog history
@@ -7290,6 +6903,7 @@ def update_student_grade(request):
                 existing_grade.is_passed = True
                 existing_grade.passing_year = exam_year or datetime.now().year
                 existing_grade.save()
+                changed_semester_ids.add(existing_grade.semester_id)
         else:
             # Create or update student subject grade
             StudentSubject.objects.update_or_create(
@@ -7304,25 +6918,92 @@ def update_student_grade(request):
                 }
             )
         
-        # Recalculate SGPA for the semester
-        semester.calculate_sgpa()
+        # Recalculate SGPA of the changed semesters and CGPA; toppers only if the top ranks are crossed
+        cgpa, semesters = update_student_gpa(student, changed_semester_ids)
+        
+        return JsonResponse({
+            'message': 'Grade updated successfully',
+            'sgpa': semesters[semester.semester].sgpa,
+            'cgpa': cgpa
+        }, status=200)
+        
+    except Exception as e:
+        logger.exception("Update student grade error: %s", e)
+        return JsonResponse({'message': 'Server error'}, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+@require_role(['HOD', 'ADMIN'])
+def import_student_grades(request):
+    """
+    Bulk import an exam result sheet (multipart/form-data)
+    Required fields:
+    - file: CSV (or XLSX when openpyxl is installed) with columns rollNumber, subjectCode, grade
+      and optionally attemptType, semester, examYear, examMonth
+    Optional fields:
+    - semester: semester for rows without a semester column
+    - department: only accept students of this branch (HODs are limited to their own department)
+    - examYear, examMonth: defaults for rows that leave them empty
+    - dryRun: "true" to validate and report without saving
+    Returns a summary with a row-level error report; valid rows are imported even if others fail.
+    """
+    try:
+        user_id = request.user_id
+        role = request.user_role
+        
+        from .models import HOD, Department
+        from .grade_import import read_result_sheet, import_grades
+        
+        uploaded = request.FILES.get('file')
+        if not uploaded:
+            return JsonResponse({'message': 'file is required'}, status=400)
+        
+        department = request.POST.get('department') or None
+        if role == 'HOD':
+            hod_department = HOD.objects.filter(
+                user__id=user_id,
+                endDate__isnull=True
+            ).values_list('department', flat=True).first()
+            if hod_department is None:
+                return JsonResponse({'message': 'HOD profile not found'}, status=404)
+            if department and department != hod_department:
+                return JsonResponse(
+                    {'message': f'You can only import grades for {hod_department} department'},
+                    status=403
+                )
+            department = hod_department
+        elif department and department not in Department.values:
+            return JsonResponse(
+                {'message': f'Invalid department. Valid values: {Department.values}'},
+                status=400
+            )
         
-        # Recalculate CGPA for all semesters
-        Semester.calculate_cgpa_for_student(student)
+        try:
+            semester = int(request.POST['semester']) if request.POST.get('semester') else None
+            exam_year = int(request.POST['examYear']) if request.POST.get('examYear') else None
+        except ValueError:
+            return JsonResponse({'message': 'semester and examYear must be integers'}, status=400)
         
-        # Update year toppers
-        YearTopper.update_toppers(student.branch)
+        try:
+            summary = import_grades(
+                read_result_sheet(uploaded, uploaded.name),
+                department=department,
+                semester=semester,
+                exam_year=exam_year,
+                exam_month=request.POST.get('examMonth') or None,
+                dry_run=request.POST.get('dryRun', '').lower() in ('1', 'true', 'yes')
+            )
+        except (ValueError, UnicodeDecodeError, csv.Error) as e:
+            return JsonResponse({'message': f'Could not read result sheet: {e}'}, status=400)
         
         return JsonResponse({
-            'message': 'Grade updated successfully',
-            'sgpa': semester.sgpa,
-            'cgpa': semester.cgpa
+            'message': f"Imported {summary['created'] + summary['updated'] + summary['backlogAttempts']} of {summary['totalRows']} row(s)",
+            **summary
         }, status=200)
         
     except Exception as e:
-        print(f"Update student grade error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Import student grades error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -7331,33 +7012,31 @@ def update_student_grade(request):
 @csrf_exempt
 @require_http_methods(["GET"])
 @require_role(['HOD', 'ADMIN', 'FACULTY'])
+@conditional_get('toppers')
 def get_year_toppers(request):
     """
     Get top 3 students by CGPA for each year in a department
     """
     try:
-        user_id = request.user_id
         role = request.user_role
         
         department = request.GET.get('department')
         year = request.GET.get('year')  # Optional: filter by specific year
         
-        from .models import YearTopper, HOD, Faculty
+        from .models import YearTopper
         
         # Determine department based on role
         if not department:
             if role == 'HOD':
-                try:
-                    hod = HOD.objects.get(user__id=user_id)
-                    department = hod.department
-                except HOD.DoesNotExist:
+                hod = request.actor.hod
+                if hod is None:
                     return JsonResponse({'message': 'HOD profile not found'}, status=404)
+                department = hod.department
             elif role == 'FACULTY':
-                try:
-                    faculty = Faculty.objects.get(user__id=user_id)
-                    department = faculty.department
-                except Faculty.DoesNotExist:
+                faculty = request.actor.faculty
+                if faculty is None:
                     return JsonResponse({'message': 'Faculty profile not found'}, status=404)
+                department = faculty.department
             elif role == 'ADMIN':
                 return JsonResponse({'message': 'Department required for admin'}, status=400)
         
@@ -7391,9 +7070,7 @@ def get_year_toppers(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get year toppers error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get year toppers error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -7405,21 +7082,19 @@ def refresh_year_toppers(request):
     Manually refresh the year toppers for a department
     """
     try:
-        user_id = request.user_id
         role = request.user_role
         
         data = json.loads(request.body)
         department = data.get('department')
         
-        from .models import YearTopper, HOD
+        from .models import YearTopper
         
         if not department:
             if role == 'HOD':
-                try:
-                    hod = HOD.objects.get(user__id=user_id)
-                    department = hod.department
-                except HOD.DoesNotExist:
+                hod = request.actor.hod
+                if hod is None:
                     return JsonResponse({'message': 'HOD profile not found'}, status=404)
+                department = hod.department
             else:
                 return JsonResponse({'message': 'Department required'}, status=400)
         
@@ -7431,9 +7106,7 @@ def refresh_year_toppers(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Refresh year toppers error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Refresh year toppers error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -7445,38 +7118,57 @@ def refresh_year_toppers(request):
 def get_students_list(request):
     """
     Get list of students with filtering and sorting options
+    Query params:
+        - department, year, program: Optional filters
+        - search: Optional - name, roll number, registration number or email terms (see core.search)
+        - sortBy: Optional (rollNumber, cgpa, name, relevance) - default rollNumber; relevance
+          ranks search matches and cannot be combined with cursor
+        - sortOrder: Optional (asc, desc) - default asc
+        - limit: Optional - page size (default 50)
+        - page: Optional - OFFSET pagination (default 1)
+        - cursor: Optional - keyset pagination on (sort key, id); pass it empty for the first
+          page and then the nextCursor of the previous page. Takes precedence over page.
+        - count: Optional (exact, cached, none) - total count mode; cached reuses a recent
+          total and none skips it (default exact)
     """
     try:
-        user_id = request.user_id
         role = request.user_role
         
         # Get query parameters
         department = request.GET.get('department')
         year = request.GET.get('year')
         program = request.GET.get('program')
-        sort_by = request.GET.get('sortBy', 'rollNumber')  # rollNumber, cgpa, name
+        search = request.GET.get('search', '')
+        sort_by = request.GET.get('sortBy', 'rollNumber')  # rollNumber, cgpa, name, relevance
         sort_order = request.GET.get('sortOrder', 'asc')  # asc, desc
         page = int(request.GET.get('page', 1))
         limit = int(request.GET.get('limit', 50))
-        search = request.GET.get('search', '')
+        cursor = request.GET.get('cursor')
+        count_mode = request.GET.get('count', 'exact')
+        
+        if count_mode not in ('exact', 'cached', 'none'):
+            return JsonResponse({'message': 'count must be exact, cached or none'}, status=400)
+        if page < 1 or limit < 1:
+            return JsonResponse({'message': 'page and limit must be at least 1'}, status=400)
         
-        from .models import Student, Faculty, HOD, Semester
-        from django.db.models import Max, Q
+        import uuid
+        from .models import Student
+        from .cache import get_student_count
+        from .search import search_students, ranked
+        from django.db.models import Q
         
         # Determine department based on role
         if not department:
             if role == 'HOD':
-                try:
-                    hod = HOD.objects.get(user__id=user_id)
-                    department = hod.department
-                except HOD.DoesNotExist:
+                hod = request.actor.hod
+                if hod is None:
                     return JsonResponse({'message': 'HOD profile not found'}, status=404)
+                department = hod.department
             elif role == 'FACULTY':
-                try:
-                    faculty = Faculty.objects.get(user__id=user_id)
-                    department = faculty.department
-                except Faculty.DoesNotExist:
+                faculty = request.actor.faculty
+                if faculty is None:
                     return JsonResponse({'message': 'Faculty profile not found'}, status=404)
+                department = faculty.department
         
         # Build query
         qs = Student.objects.all()
@@ -7491,30 +7183,67 @@ def get_students_list(request):
             qs = qs.filter(program=program)
         
         if search:
-            qs = qs.filter(
-                Q(name__icontains=search) |
-                Q(rollNumber__icontains=search) |
-                Q(registrationNumber__icontains=search) |
-                Q(collegeEmail__icontains=search)
-            )
+            qs = search_students(qs, search)
         
-        # Annotate with latest CGPA
-        qs = qs.annotate(latest_cgpa=Max('semesters__cgpa'))
+        filtered = qs
         
-        # Sorting
-        if sort_by == 'cgpa':
-            order_field = 'latest_cgpa' if sort_order == 'asc' else '-latest_cgpa'
+        # Sorting (CGPA sorts on the maintained Student.currentCgpa; 0.0 without a result)
+        if sort_by == 'relevance' and search:
+            if cursor is not None:
+                return JsonResponse(
+                    {'message': 'cursor pagination needs sortBy rollNumber, cgpa or name'},
+                    status=400
+                )
+            sort_field = None
+            qs = ranked(qs)
+        elif sort_by == 'cgpa':
+            sort_field, parse_key = 'currentCgpa', float
         elif sort_by == 'name':
-            order_field = 'name' if sort_order == 'asc' else '-name'
+            sort_field, parse_key = 'name', str
         else:
-            order_field = 'rollNumber' if sort_order == 'asc' else '-rollNumber'
+            sort_field, parse_key = 'rollNumber', int
+        descending = sort_order == 'desc'
+        
+        if sort_field and descending:
+            qs = qs.order_by(f'-{sort_field}', '-id')
+        elif sort_field:
+            qs = qs.order_by(sort_field, 'id')
+        
+        if cursor:
+            try:
+                cursor_value, cursor_id = cursor.rsplit('|', 1)
+                cursor_value = parse_key(cursor_value)
+                cursor_id = uuid.UUID(cursor_id)
+            except ValueError:
+                return JsonResponse({'message': 'Invalid cursor'}, status=400)
+            op = 'lt' if descending else 'gt'
+            qs = qs.filter(
+                Q(**{f'{sort_field}__{op}': cursor_value}) |
+                Q(**{sort_field: cursor_value, f'id__{op}': cursor_id})
+            )
         
-        qs = qs.order_by(order_field)
+        # Total count
+        if count_mode == 'exact':
+            total_count = filtered.count()
+        elif count_mode == 'cached':
+            total_count = get_student_count(
+                {'department': department, 'year': year, 'program': program, 'search': search},
+                filtered.count
+            )
+        else:
+            total_count = None
         
         # Pagination
-        total_count = qs.count()
-        offset = (page - 1) * limit
-        students = qs[offset:offset + limit]
+        next_cursor = None
+        if cursor is not None:
+            students = list(qs[:limit + 1])
+            if len(students) > limit:
+                students = students[:limit]
+                last = students[-1]
+                next_cursor = f'{getattr(last, sort_field)}|{last.id}'
+        else:
+            offset = (page - 1) * limit
+            students = qs[offset:offset + limit]
         
         students_data = []
         for student in students:
@@ -7528,23 +7257,87 @@ def get_students_list(request):
                 'branch': student.branch,
                 'year': student.year,
                 'status': student.status,
-                'cgpa': student.latest_cgpa or 0.0
+                'cgpa': student.currentCgpa
             })
         
-        return JsonResponse({
-            'students': students_data,
-            'pagination': {
+        if cursor is not None:
+            pagination = {
+                'limit': limit,
+                'nextCursor': next_cursor,
+                'totalCount': total_count
+            }
+        else:
+            pagination = {
                 'page': page,
                 'limit': limit,
                 'totalCount': total_count,
-                'totalPages': (total_count + limit - 1) // limit
+                'totalPages': (total_count + limit - 1) // limit if total_count is not None else None
             }
+        
+        return JsonResponse({
+            'students': students_data,
+            'pagination': pagination
         }, status=200)
         
     except Exception as e:
-        print(f"Get students list error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get students list error: %s", e)
+        return JsonResponse({'message': 'Server error'}, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@require_role(['HOD', 'ADMIN', 'FACULTY'])
+def search_students_quick(request):
+    """
+    Search-as-you-type lookup of students, best match first
+    Query params:
+        - q: Required - name, roll number, registration number or email terms
+        - department: Optional (defaults to the HOD's/faculty's own department)
+        - limit: Optional - max results (default and max 20)
+    """
+    try:
+        from .models import Student
+        from .search import SEARCH_LIMIT, search_students, ranked
+        
+        role = request.user_role
+        query = request.GET.get('q', '').strip()
+        department = request.GET.get('department')
+        
+        try:
+            limit = min(int(request.GET.get('limit', SEARCH_LIMIT)), SEARCH_LIMIT)
+        except ValueError:
+            return JsonResponse({'message': 'limit must be a number'}, status=400)
+        if limit < 1:
+            return JsonResponse({'message': 'limit must be at least 1'}, status=400)
+        if not query:
+            return JsonResponse({'students': [], 'count': 0}, status=200)
+        
+        # Determine department based on role
+        if not department:
+            if role == 'HOD':
+                hod = request.actor.hod
+                if hod is None:
+                    return JsonResponse({'message': 'HOD profile not found'}, status=404)
+                department = hod.department
+            elif role == 'FACULTY':
+                faculty = request.actor.faculty
+                if faculty is None:
+                    return JsonResponse({'message': 'Faculty profile not found'}, status=404)
+                department = faculty.department
+        
+        qs = Student.objects.all()
+        if department:
+            qs = qs.filter(branch=department)
+        
+        results = ranked(search_students(qs, query)).values(
+            'id', 'name', 'rollNumber', 'registrationNumber', 'collegeEmail', 'branch', 'year'
+        )[:limit]
+        
+        students = [{**row, 'id': str(row['id'])} for row in results]
+        return JsonResponse({'students': students, 'count': len(students)}, status=200)
+        
+    except Exception as e:
+        logger.exception("Search students error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -7553,6 +7346,7 @@ def get_students_list(request):
 @csrf_exempt
 @require_http_methods(["GET"])
 @require_role(['HOD', 'ADMIN', 'FACULTY'])
+@conditional_get('subjects')
 def get_subjects_list(request):
     """
     Get list of all subjects with filtering options
@@ -7564,7 +7358,7 @@ def get_subjects_list(request):
         
         from .models import Subject
         
-        qs = Subject.objects.all()
+        qs = Subject.objects.select_related('current_faculty')
         
         if department:
             qs = qs.filter(department=department)
@@ -7603,9 +7397,7 @@ def get_subjects_list(request):
         }, status=200)
         
     except Exception as e:
-        print(f"Get subjects list error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Get subjects list error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
 
 
@@ -7655,7 +7447,5 @@ def create_subject(request):
         }, status=201)
         
     except Exception as e:
-        print(f"Create subject error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Create subject error: %s", e)
         return JsonResponse({'message': 'Server error'}, status=500)
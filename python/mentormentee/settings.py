@@ -48,6 +48,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.instrumentation.InstrumentationMiddleware',  # Per-endpoint query/latency stats
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -158,3 +159,97 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
 STATIC_URL = 'static/'
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# CACHE_URL picks the backend: unset for a per-process memory cache (development),
+# file:///path for a directory shared by the workers of one host, redis://host:port/db for
+# a cache shared across hosts (production; needs the redis package).
+CACHE_URL = os.getenv('CACHE_URL', '')
+
+if CACHE_URL.startswith(('redis://', 'rediss://')):
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': CACHE_URL}}
+elif CACHE_URL.startswith('file://'):
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': CACHE_URL[len('file://'):]}}
+else:
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'core'}}
+
+# Application cache (core/cache.py): entries are namespaced and dropped by bumping a namespace
+# version; a missing entry is recomputed by one caller while others wait up to
+# CORE_CACHE_LOCK_WAIT seconds for it
+CORE_CACHE_ALIAS = os.getenv('CORE_CACHE_ALIAS', 'default')
+CORE_CACHE_LOCK_TIMEOUT = int(os.getenv('CORE_CACHE_LOCK_TIMEOUT', '10'))  # seconds
+CORE_CACHE_LOCK_WAIT = float(os.getenv('CORE_CACHE_LOCK_WAIT', '2'))  # seconds
+# api/faculty responses, memoized per role and query string until any mentorship or
+# profile write bumps the institution namespace
+FACULTY_LIST_TTL = int(os.getenv('FACULTY_LIST_TTL', '60'))  # seconds
+
+
+# JWT authentication
+# Per-process cache of verified tokens -> request.user_data (set either to 0 to disable)
+JWT_USER_CACHE_SIZE = int(os.getenv('JWT_USER_CACHE_SIZE', '2048'))
+JWT_USER_CACHE_TTL = int(os.getenv('JWT_USER_CACHE_TTL', '60'))  # seconds
+# Stateless tokens embed role/entity claims plus User.tokenVersion; only the version is
+# checked per request (through the default cache, re-read every JWT_TOKEN_VERSION_TTL seconds)
+JWT_STATELESS_AUTH = os.getenv('JWT_STATELESS_AUTH', 'false').lower() in ('1', 'true', 'yes')
+JWT_TOKEN_VERSION_TTL = int(os.getenv('JWT_TOKEN_VERSION_TTL', '30'))  # seconds
+
+
+# Mentorship
+# Default cap on active mentees per faculty for automatic allocation (api/hod/allocate-mentors)
+MENTOR_ALLOCATION_CAP = int(os.getenv('MENTOR_ALLOCATION_CAP', '25'))
+
+# Dashboards
+# Per-role dashboard stats are cached per student/faculty/department and dropped by the writes
+# that change them; the TTL bounds drift of date-based counts (upcoming meetings)
+DASHBOARD_STATS_TTL = int(os.getenv('DASHBOARD_STATS_TTL', '30'))  # seconds
+
+# Student list
+# count=cached on api/students/list reuses a total computed within this window
+STUDENT_COUNT_TTL = int(os.getenv('STUDENT_COUNT_TTL', '300'))  # seconds
+
+# Conditional GET
+# Serialized bodies of ETag-served endpoints (subjects, toppers, HODs, /me) are kept this long
+# per ETag; writes move readers to a new ETag, so this only bounds memory use
+CONDITIONAL_RESPONSE_TTL = int(os.getenv('CONDITIONAL_RESPONSE_TTL', '300'))  # seconds
+
+# Instrumentation
+# Per-endpoint latency, query count, DB time and response size (api/admin/endpoint-stats);
+# the latest PERF_STATS_WINDOW requests of each endpoint are kept per worker process
+PERF_STATS_ENABLED = os.getenv('PERF_STATS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+PERF_STATS_WINDOW = int(os.getenv('PERF_STATS_WINDOW', '500'))
+
+# Grades
+# Ranks kept per department/year in YearTopper (api/toppers, manage.py refresh_year_toppers)
+YEAR_TOPPERS_COUNT = int(os.getenv('YEAR_TOPPERS_COUNT', '3'))
+
+# Logging
+# CORE_LOG_LEVEL=DEBUG turns on per-request auth tracing; at INFO and above the
+# debug calls on the request path are skipped before any formatting happens.
+# CORE_LOG_QUEUE hands records to a background thread so log I/O never blocks a request.
+CORE_LOG_LEVEL = os.getenv('CORE_LOG_LEVEL', 'INFO').upper()
+CORE_LOG_QUEUE = os.getenv('CORE_LOG_QUEUE', 'true').lower() in ('1', 'true', 'yes')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'core': {
+            'format': '%(asctime)s %(levelname)s %(name)s [pid %(process)d] %(message)s',
+        },
+    },
+    'handlers': {
+        'core_console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'core',
+        },
+    },
+    'loggers': {
+        'core': {
+            'handlers': ['core_console'],
+            'level': CORE_LOG_LEVEL,
+            'propagate': False,
+        },
+    },
+}
@@ -22,6 +22,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/auth/', include('core.urls')),
     path('api/hod/assign-mentor', views.assign_mentor, name='assign_mentor'),
+    path('api/hod/allocate-mentors', views.allocate_mentors, name='allocate_mentors'),
     path('api/hod/schedule-meetings', views.schedule_meetings, name='schedule_meetings'),
     path('api/hod/schedule-group-meetings', views.schedule_group_meetings, name='schedule_group_meetings'),
     path('api/hod/mentorships', views.get_hod_mentorships, name='get_hod_mentorships'),
@@ -41,6 +42,7 @@ urlpatterns = [
     path('api/department/student/<int:rollno>/mentoring', views.get_student_mentoring_by_rollno, name='get_student_mentoring_by_rollno'),
     path('api/department/student/<int:rollno>/academic', views.get_student_academic_by_rollno, name='get_student_academic_by_rollno'),
     path('api/department/student/<int:rollno>/cocurricular', views.get_student_cocurricular_by_rollno, name='get_student_cocurricular_by_rollno'),
+    path('api/department/student/<int:rollno>/bundle', views.get_student_bundle_by_rollno, name='get_student_bundle_by_rollno'),
     path('api/admin/student/<int:rollno>', views.update_student_by_rollno, name='update_student_by_rollno'),
     path('api/faculty', views.get_faculty, name='get_faculty'),
     path('api/faculty/<uuid:faculty_id>', views.get_faculty_by_id, name='get_faculty_by_id'),
@@ -106,6 +108,7 @@ urlpatterns = [
     path('api/faculty/dashboard/stats', views.get_faculty_dashboard_stats, name='get_faculty_dashboard_stats'),
     path('api/hod/dashboard/stats', views.get_hod_dashboard_stats, name='get_hod_dashboard_stats'),
     path('api/admin/dashboard/stats', views.get_admin_dashboard_stats, name='get_admin_dashboard_stats'),
+    path('api/admin/endpoint-stats', views.get_endpoint_stats, name='get_endpoint_stats'),
     # Export APIs
     path('api/export/students', views.export_students_csv, name='export_students_csv'),
     # Faculty Subjects APIs
@@ -117,11 +120,13 @@ urlpatterns = [
     path('api/student/grades', views.get_student_grades, name='get_student_grades'),
     path('api/student/<uuid:student_id>/grades', views.get_student_grades, name='get_student_grades_by_id'),
     path('api/grades/update', views.update_student_grade, name='update_student_grade'),
+    path('api/grades/import', views.import_student_grades, name='import_student_grades'),
     # Year Toppers APIs
     path('api/toppers', views.get_year_toppers, name='get_year_toppers'),
     path('api/toppers/refresh', views.refresh_year_toppers, name='refresh_year_toppers'),
     # Students List with Filters API
     path('api/students/list', views.get_students_list, name='get_students_list'),
+    path('api/students/search', views.search_students_quick, name='search_students'),
     # Subjects APIs
     path('api/subjects', views.get_subjects_list, name='get_subjects_list'),
     path('api/subjects/create', views.create_subject, name='create_subject'),